@@ -14,9 +14,13 @@ __version__ = "0.1 Alpha"
 
 from .interiors import InteriorIDs
 from .object_manager import *
+from .spatial import SpatialIndex, spatial_index
+from .element_store import ElementStore, element_store
+from .element_ids import ElementIDAllocator, element_ids
 from .player_manager import Player
 from .logger import Logger
 from .server import Server
+from .event_loop import ServerEventLoop, Timer
 
 from .common import (
     HttpDownloadTypes,
@@ -30,7 +34,7 @@ from .common import (
     PORT_TESTER_URL,
 )
 
-from .vectors import Vector2, Vector3
+from .vectors import Vector2, Vector3, Vector3Batch
 from .errors import (
     MaxMapNameLength,
     MaxGameTypeLength,
@@ -53,13 +57,37 @@ from .errors import (
     ResourceFileError,
     BitStreamError,
     EventHandlerError,
+    PacketHandlerError,
+    ElementIDError,
+    ElementIDLimitReached,
+    ElementDestroyedError,
+    ElementStateError,
+    HTTPBadRequest,
 )
 from .brodcast import BrodcastManager, PortChecker
 from .httpserver import HTTPServer
 from .resources import Resource, ResourceFile, ResourceInfo, ResourceLoader
 from .event import ServerEventHandler
-from .core import NetworkWrapper, BitStream, PacketID, PacketPriority, PacketReliability
+from .core import (
+    NetworkWrapper,
+    Transport,
+    LoopbackTransport,
+    LoopbackClient,
+    PacketCapture,
+    PacketReplayer,
+    BitStream,
+    BitStreamPool,
+    PacketRegistry,
+    PacketID,
+    PacketPriority,
+    PacketReliability,
+)
 
+from .network.packet_cache import PacketCache, PrebuiltPacket
+from .network.send_queue import SendScheduler
+from .network.bandwidth import BandwidthBudget
+from .network.stats import NetworkStatsSampler
+from .network.interest import InterestManager
 from .network.packets import (
     Packet_PlayerJoinModName,
     Packet_PlayerJoinData,
@@ -40,38 +40,67 @@ class LocalServerListAnnouncer(socket.socket):
 
         try:
             while True:
-                if self._server.is_running():
-                    self._current_player_count = self._server.get_player_count()
-                self.uptime = time.time() - self.uptime
                 _data = self.recvfrom(self._buffer)
-                addr = _data[1]
-                if len(_data[0]) == 1:
-                    match _data[0]:
-                        case QueryTypes.LightRelease.value:
-                            if (
-                                self._query == ""
-                                or time.time() - self._last_query_sent > 10  # Query Light Cache Interval
-                                or self._current_player_count != self._last_player_count
-                            ):
-                                self._last_player_count = self._current_player_count
-                                self._last_query_sent = time.time()
-                                self._query = str(QueryLight(self._server))
-
-                        case QueryTypes.Full.value:
-                            self._last_player_count = self._current_player_count
-                            self._last_query_sent = time.time()
-                            self._query = str(QueryFull(self._server))
-
-                        case QueryTypes.XFire.value:
-                            self._last_player_count = self._current_player_count
-                            self._last_query_sent = time.time()
-                            self._query = str(QueryXFireLight(self._server))
-
-                        case QueryTypes.Version.value:
-                            self._query = self._server.get_ase_version().name
-
-                    if self._query != "":
-                        self.sendto(bytes(self._query, encoding="utf-8"), addr)
+                _response = self.get_response(_data[0])
+                if _response:
+                    self.sendto(_response, _data[1])
 
         except KeyboardInterrupt:
             ...
+
+    async def serve(self, event_loop) -> None:
+        """
+            Serve ASE Queries on the server event loop (asyncio mode)
+        """
+        try:
+            self.bind(self._announcement_addr)
+        except OSError as err:
+            self.logger.error(f"Couldn't bind ASE queries socket ({err}).")
+            return
+
+        self._server.event.call("onAseServerStart")
+        await event_loop.serve_datagram(self, self.get_response)
+
+    def get_response(self, data: bytes) -> bytes | None:
+        """Get ASE query response
+
+        Args:
+        -----
+            data (bytes): Received query
+
+        Returns:
+        --------
+            bytes | None: Query response (None if no response)
+        """
+        if self._server.is_running():
+            self._current_player_count = self._server.get_player_count()
+        self.uptime = time.time() - self.uptime
+        if len(data) != 1:
+            return None
+        match data:
+            case QueryTypes.LightRelease.value:
+                if (
+                    self._query == ""
+                    or time.time() - self._last_query_sent > 10  # Query Light Cache Interval
+                    or self._current_player_count != self._last_player_count
+                ):
+                    self._last_player_count = self._current_player_count
+                    self._last_query_sent = time.time()
+                    self._query = str(QueryLight(self._server))
+
+            case QueryTypes.Full.value:
+                self._last_player_count = self._current_player_count
+                self._last_query_sent = time.time()
+                self._query = str(QueryFull(self._server))
+
+            case QueryTypes.XFire.value:
+                self._last_player_count = self._current_player_count
+                self._last_query_sent = time.time()
+                self._query = str(QueryXFireLight(self._server))
+
+            case QueryTypes.Version.value:
+                self._query = self._server.get_ase_version().name
+
+        if self._query != "":
+            return bytes(self._query, encoding="utf-8")
+        return None
@@ -27,8 +27,7 @@ class LocalServerListASE(socket.socket):
                 f"Local Server List ASE Bind On {self._ip}:{self._port}.")
             while self._server.is_running():
                 self._data, self.addr = self.recvfrom(31)
-                self.sendto(
-                    bytes(f"{LOCAL_SERVER_LIST_ASE_MESSAGE} {self._port + 123}", "utf-8"), self.addr)
+                self.sendto(self.get_response(self._data), self.addr)
         except KeyboardInterrupt:
             ...
         except OSError as err:
@@ -36,3 +35,20 @@ class LocalServerListASE(socket.socket):
             if 'Only one usage of each socket address' in err.strerror:
                 self.logger.error('Server Address in use.')
                 quit(-1)
+
+    async def serve(self, event_loop) -> None:
+        """
+            Serve Local Server Ase on the server event loop (asyncio mode)
+        """
+        try:
+            self.bind(self._announcement_addr)
+        except OSError as err:
+            self.logger.error(f"Couldn't bind Local Server List ASE ({err}).")
+            return
+        self.logger.log(
+            f"Local Server List ASE Bind On {self._ip}:{self._port}.")
+        await event_loop.serve_datagram(self, self.get_response)
+
+    def get_response(self, data: bytes = b"") -> bytes:
+        """Get the local server list port response"""
+        return bytes(f"{LOCAL_SERVER_LIST_ASE_MESSAGE} {self._port + 123}", "utf-8")
@@ -13,12 +13,17 @@ class BrodcastManager(object):
     """
 
     def __init__(self, server) -> None:
+        self._server = server
         self._lcl_serverlist = LocalServerListASE(server)
         self._lcl_announcer = LocalServerListAnnouncer(server)
         self._mstr_serverlist = MasterServerListAnnouncement(server)
 
     def start_local_server_list_ase(self) -> Literal[True] | None:
         """Tells MTA Client local server list port"""
+        _event_loop = self._server.get_event_loop()
+        if _event_loop is not None:
+            _event_loop.spawn(self._lcl_serverlist.serve(_event_loop))
+            return True
         Thread(
             target=self._lcl_serverlist.start,
             name="Local Server List ASE",
@@ -28,6 +33,10 @@ class BrodcastManager(object):
 
     def start_local_server_list_announces(self) -> Literal[True] | None:
         """Shows server in local game server list."""
+        _event_loop = self._server.get_event_loop()
+        if _event_loop is not None:
+            _event_loop.spawn(self._lcl_announcer.serve(_event_loop))
+            return True
         Thread(
             target=self._lcl_announcer.start,
             name="Local Server List Announcer",
@@ -37,6 +46,10 @@ class BrodcastManager(object):
 
     def start_master_server_announces(self) -> Literal[True] | None:
         """Shows server in game server list"""
+        _event_loop = self._server.get_event_loop()
+        if _event_loop is not None:
+            _event_loop.spawn(_event_loop.run_blocking(self._mstr_serverlist.start))
+            return True
         Thread(
             target=self._mstr_serverlist.start,
             name="Master Server List Announcer",
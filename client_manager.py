@@ -2,19 +2,45 @@
     IronicMTA Client
 """
 
-from .core import NetworkWrapper
+from typing import Hashable
+from .core import Transport
 from .core.packet_ids import PacketID
 from .network.packet_base import Packet
+from .network.send_queue import SendScheduler
 
 
 class Client(object):
     def __init__(self, binary_address: int, bitstream_version: int, server):
-        self._network: NetworkWrapper = server.get_network()
+        self._network: Transport = server.get_network()
+        self._scheduler: SendScheduler = server.get_send_scheduler()
         self._bin_address = binary_address
         self._bitstream_version = bitstream_version
         self._serial = None
 
-    def send(self, packet: Packet) -> bool:
+    def get_binary_address(self) -> int:
+        return self._bin_address
+
+    def get_bitstream_version(self) -> int:
+        return self._bitstream_version
+
+    def send(self, packet: Packet, coalesce_key: Hashable | None = None) -> bool:
+        """Send a packet (queued until the end of the tick if the send scheduler is running)
+
+        Args:
+        -----
+            packet (Packet): Packet to send
+            coalesce_key (Hashable, optional): Key of the updated state (ex: (packet id, element id)),
+                                               a queued unreliable sequenced packet with the same key is replaced
+
+        Returns:
+        --------
+            bool: True if the packet has been sent or queued
+        """
+        if self._scheduler.is_running():
+            self._scheduler.queue(
+                self._bin_address, self._bitstream_version, packet, coalesce_key
+            )
+            return True
         return self._network.send(
             self._bin_address,
             packet.get_id(),
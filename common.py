@@ -1,5 +1,7 @@
 from enum import Enum
 
+from .element_ids import ElementID  # Kept importable from here
+
 
 class HttpDownloadTypes:
     """
@@ -93,11 +95,3 @@ PORT_TESTER_URL = "http://nightly.mtasa.com/ports/"
 
 # Just For Debug
 BITSTREAM_VERSION = 171
-
-
-class ElementID(object):
-    def __init__(self, __id: int) -> None:
-        self._id = __id
-
-    def getID(self) -> int:
-        return self._id
@@ -2,5 +2,16 @@
 
 
 from IronicMTA.core.wrapper import NetworkWrapper
+from IronicMTA.core.transport import (
+    Transport,
+    LoopbackTransport,
+    LoopbackClient,
+    get_transport,
+)
 from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
-from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_handler.io import BitStream, BitStreamPool
+from IronicMTA.core.packet_handler.registry import PacketRegistry
+from IronicMTA.core.packet_handler.workers import PacketWorkerPool
+from IronicMTA.core.packet_handler.pump import PacketPump
+from IronicMTA.core.packet_handler.capture import PacketCapture, PacketReplayer
+from IronicMTA.core.packet_handler.payload import as_payload, retain_payload
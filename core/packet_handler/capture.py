@@ -0,0 +1,148 @@
+"""Packet Capture and Replay"""
+
+import mmap
+import time
+from struct import Struct
+from threading import Lock
+from typing import Any, Callable, Iterator, Literal, Tuple
+
+from IronicMTA.errors import PacketHandlerError
+
+# File header: magic + format version
+CAPTURE_MAGIC = b"IMTACAP"
+CAPTURE_VERSION = 1
+_HEADER = Struct("<7sB")
+
+# Record header: timestamp (seconds), player binary address, packet id, payload size
+_RECORD = Struct("<dIBI")
+
+# (timestamp, player binary address, packet id, payload)
+CapturedPacket = Tuple[float, int, int, memoryview]
+
+
+class PacketCapture(object):
+    """Received packets capture
+
+    Appends every received packet to a compact binary log
+    (timestamp, player, packet id, payload).
+
+    Args:
+    -----
+        path (str): Capture file path (overwritten)
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION))
+        self._lock = Lock()
+        self._count = 0
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_count(self) -> int:
+        """Get number of captured packets"""
+        return self._count
+
+    def is_closed(self) -> bool:
+        return self._file.closed
+
+    def record(self, packet_id: int, player: int, payload: Any) -> None:
+        """Append a received packet to the capture (ignored once closed)"""
+        _payload = payload if payload is not None else b""
+        _header = _RECORD.pack(time.time(), player, packet_id, len(_payload))
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(_header)
+            self._file.write(_payload)
+            self._count += 1
+
+    def close(self) -> Literal[True]:
+        with self._lock:
+            self._file.close()
+        return True
+
+
+class PacketReplayer(object):
+    """Memory mapped capture replayer
+
+    Payloads are memoryviews of the mapped file (no copy), handlers
+    must copy them to keep them after the replayer is closed.
+
+    Args:
+    -----
+        path (str): Capture file path
+
+    Raises:
+    -------
+        PacketHandlerError: If the file isn't a packet capture
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._file.close()
+            raise PacketHandlerError(f"Invalid packet capture ({path})")
+        if len(self._map) < _HEADER.size or _HEADER.unpack_from(self._map, 0) != (
+            CAPTURE_MAGIC,
+            CAPTURE_VERSION,
+        ):
+            self.close()
+            raise PacketHandlerError(f"Invalid packet capture ({path})")
+        self._view = memoryview(self._map)
+
+    def __iter__(self) -> Iterator[CapturedPacket]:
+        _view = self._view
+        _offset = _HEADER.size
+        _end = len(_view)
+        _unpack = _RECORD.unpack_from
+        _record_size = _RECORD.size
+        while _offset + _record_size <= _end:
+            _timestamp, _player, _packet_id, _size = _unpack(_view, _offset)
+            _offset += _record_size
+            if _offset + _size > _end:  # Truncated capture
+                return
+            yield _timestamp, _player, _packet_id, _view[_offset : _offset + _size]
+            _offset += _size
+
+    def replay(
+        self, process: Callable[[int, int, Any], Any], speed: float = 0.0
+    ) -> int:
+        """Feed the captured packets to `process` (ex: `PacketHandler.process`)
+
+        Args:
+        -----
+            process (Callable[[int, int, Any], Any]): process(packet_id, player, payload)
+            speed (float, optional): Replay speed (1.0 = recorded speed, 0 = as fast as possible)
+
+        Returns:
+        --------
+            int: Number of replayed packets
+        """
+        _count = 0
+        _start = time.perf_counter()
+        _first = None
+        for _timestamp, _player, _packet_id, _payload in self:
+            if speed > 0:
+                if _first is None:
+                    _first = _timestamp
+                _delay = (_timestamp - _first) / speed - (time.perf_counter() - _start)
+                if _delay > 0:
+                    time.sleep(_delay)
+            process(_packet_id, _player, _payload)
+            _count += 1
+        return _count
+
+    def close(self) -> Literal[True]:
+        if hasattr(self, "_view"):
+            self._view.release()
+        try:
+            self._map.close()
+        except BufferError:  # Payloads still referenced, closed once collected
+            ...
+        self._file.close()
+        return True
@@ -1,13 +1,24 @@
 """Packet Handler Core"""
-from typing import Any, Tuple
+from os.path import join
+from typing import Any, Hashable, List, Tuple, Type
 from IronicMTA.network.packets import Packet_PlayerJoinModName
+from IronicMTA.network.packet_base import Packet
+from IronicMTA.network.packet_cache import PrebuiltPacket, packet_cache
 from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.core.packet_handler.workers import PacketWorkerPool
+from IronicMTA.core.packet_handler.capture import PacketCapture
+from IronicMTA.core.packet_handler.payload import as_payload
 from IronicMTA.common import BITSTREAM_VERSION
 
 
 class PacketHandler(object):
     """Packet Handler
 
+    Registers the core packet handlers and dispatches the received
+    packets through the server packet registry. When `packet_workers`
+    network setting is set, packets are processed by a per player
+    ordered worker pool instead of the receiving thread.
+
     Args:
     -----
         server (Server): IronicMTA server
@@ -17,8 +28,23 @@ class PacketHandler(object):
         self._server = server
         self._network = server.get_network()
         self._logger = server.get_logger()
-        self._packet: Any
+        self._registry = server.packets
         self._packet_index = -1
+        self._workers: PacketWorkerPool | None = None
+        self._capture: PacketCapture | None = None
+
+        _workers_count = server.get_settings()["network"]["packet_workers"]
+        if _workers_count > 0:
+            self._workers = PacketWorkerPool(self.handle, _workers_count, self._logger)
+            self._workers.start()
+
+        _capture_file = server.get_settings()["network"]["capture_file"]
+        if _capture_file:
+            self.start_capture(join(server.get_base_dir(), _capture_file))
+
+        self._registry.register(PacketID.PACKET_ID_PLAYER_JOIN, self._on_player_join)
+        self._registry.register(PacketID.PACKET_ID_PLAYER_QUIT, self._on_player_quit)
+        self._registry.register(PacketID.PACKET_ID_PLAYER_TIMEOUT, self._on_player_quit)
 
     def onrecive(
         self, packet: int, player: int, packet_index: int, packet_content: Tuple[Any]
@@ -38,38 +64,139 @@ class PacketHandler(object):
         if self._packet_index != packet_index:
             self._packet_index = packet_index
             if packet != 0 and player != 0:
-                self._server.event.call(
-                    "onReceivePacket", self._server, packet, player, bytes()
-                )
-
-                self._logger.debug(f"Received {PacketID(packet)}")
-                print("====================\n")
-
-                if packet == PacketID.PACKET_ID_PLAYER_JOIN.value:
-                    self._packet = Packet_PlayerJoinModName(BITSTREAM_VERSION)
-
-                elif packet == PacketID.PACKET_ID_SERVER_DISCONNECTED.value:
-                    # self._packet = Packet_PlayerDisconnected(packet_content)
-                    ...
-
-                elif packet == PacketID.PACKET_ID_PLAYER_TRANSGRESSION.value:
-                    # self._packet = Packet_AntiCheatTransgression(packet_content)
-                    ...
-
-                elif packet == PacketID.PACKET_ID_PLAYER_JOINDATA.value:
-                    # self._packet = Packet_PlayerJoinData(packet_content)
-                    ...
-
-                else:
-                    return False
-                if self._packet:
-                    self._network.send(
-                        player_binaddr=player,
-                        packet_id=self._packet.get_id().value,
-                        bitstream_version=BITSTREAM_VERSION,
-                        data=self._packet.build(),
-                        priority=self._packet.get_priority(),
-                        reliability=self._packet.get_reliability(),
-                    )
-                    return True
+                return self.process(packet, player, packet_content)
         return False
+
+    def process(self, packet: int, player: int, packet_content: Any) -> bool:
+        """Process a new packet (queue it to the workers or handle it inline)
+
+        The content is passed to the handlers as a read only memoryview
+        (no copy), handlers keeping it must copy it (see `retain_payload`).
+
+        Args:
+        -----
+            packet (int): Packet id
+            player (int): Player binary address
+            packet_content (Any): Packet content
+
+        Returns:
+        --------
+            bool: True if the packet was queued or handled successfuly
+        """
+        packet_content = as_payload(packet_content)
+        _capture = self._capture  # stop_capture() may run on another thread
+        if _capture is not None:
+            _capture.record(packet, player, packet_content)
+        if self._workers is not None:
+            self._workers.submit(packet, player, packet_content)
+            return True
+        return self.handle(packet, player, packet_content)
+
+    def handle(self, packet: int, player: int, packet_content: Any) -> bool:
+        """Handle a received packet (call `onReceivePacket` and the packet handlers)
+
+        Args:
+        -----
+            packet (int): Packet id
+            player (int): Player binary address
+            packet_content (Any): Packet content
+
+        Returns:
+        --------
+            bool: True if the packet was handled successfuly
+        """
+        self._server.event.call(
+            "onReceivePacket", self._server, packet, player, packet_content
+        )
+        return self._registry.dispatch(packet, player, packet_content)
+
+    def get_workers(self) -> PacketWorkerPool | None:
+        """Get packet processing workers (None if packets are handled inline)"""
+        return self._workers
+
+    def get_worker_queue_depths(self) -> List[int]:
+        """Get number of packets waiting in each worker queue"""
+        if self._workers is None:
+            return []
+        return self._workers.get_queue_depths()
+
+    def start_capture(self, path: str) -> PacketCapture:
+        """Start capturing the received packets to a file (see `PacketReplayer`)
+
+        Args:
+        -----
+            path (str): Capture file path (overwritten)
+
+        Returns:
+        --------
+            PacketCapture: Packet capture
+        """
+        self.stop_capture()
+        self._capture = PacketCapture(path)
+        return self._capture
+
+    def stop_capture(self) -> None:
+        """Stop capturing the received packets"""
+        if self._capture is not None:
+            self._capture.close()
+            self._capture = None
+
+    def get_capture(self) -> PacketCapture | None:
+        return self._capture
+
+    def stop(self) -> None:
+        """Stop the packet processing workers and the capture"""
+        if self._workers is not None:
+            self._workers.stop()
+        self.stop_capture()
+
+    def send(self, player: int, packet: Packet) -> bool:
+        """Build and send a packet, then release it
+
+        Args:
+        -----
+            player (int): Player binary address
+            packet (Packet): Packet to send
+
+        Returns:
+        --------
+            bool: Transport send result (True if the packet has been sent)
+        """
+        try:
+            return self._send(player, packet)
+        finally:
+            packet.release()
+
+    def send_cached(
+        self, player: int, packet_type: Type[Packet], *params: Hashable
+    ) -> bool:
+        """Send a prebuilt packet (built once per packet type and parameters)
+
+        Args:
+        -----
+            player (int): Player binary address
+            packet_type (Type[Packet]): Packet class
+            *params (Hashable): Packet constructor parameters
+
+        Returns:
+        --------
+            bool: Transport send result (True if the packet has been sent)
+        """
+        return self._send(player, packet_cache.get(packet_type, *params))
+
+    def _send(self, player: int, packet: Packet | PrebuiltPacket) -> bool:
+        return self._network.send(
+            player_binaddr=player,
+            packet_id=packet.get_id(),
+            bitstream_version=BITSTREAM_VERSION,
+            data=packet.build(),
+            priority=packet.get_priority(),
+            reliability=packet.get_reliability(),
+        )
+
+    def _on_player_join(self, packet_id: int, player: int, payload: Any) -> bool:
+        return self.send_cached(player, Packet_PlayerJoinModName, BITSTREAM_VERSION)
+
+    def _on_player_quit(self, packet_id: int, player: int, payload: Any) -> bool:
+        self._server.remove_player(player)
+        return False  # Other handlers (ex: resources) get the quit too
@@ -1,38 +1,198 @@
-from struct import pack, unpack
+from struct import Struct, pack, unpack
+from math import floor, sqrt
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence
 from IronicMTA.errors import BitStreamError
+from IronicMTA.element_ids import element_ids
+from IronicMTA.vectors import Vector3
+
+# Default preallocated buffer size (bytes), enough for most sync packets
+BITSTREAM_DEFAULT_CAPACITY = 256
+# Pooled streams grown beyond this size are shrinked back on release
+BITSTREAM_POOL_MAX_CAPACITY = 64 * 1024
+
+_FLOAT = Struct("!f")
+_DOUBLE = Struct("!d")
+
+
+def _quantize(
+    value: float, min_value: float, max_value: float, num_bits: int, wrap: bool
+) -> int:
+    _size = max_value - min_value
+    if wrap:
+        value -= _size * floor((value - min_value) / _size)
+    value = min(max(value, min_value), max_value)
+    return int(((1 << num_bits) - 1) * ((value - min_value) / _size))
+
 
 class BitStream:
-    def __init__(self, buffer: bytearray | bytes = bytearray()):
-        if isinstance(buffer, bytes):
-            self._buffer = bytearray(buffer)
+    """Bit level stream (RakNet compatible bit order)
+
+    Bits are packed MSB first inside each byte. The buffer is preallocated
+    and grows by doubling, values are written/read as a whole word
+    instead of bit by bit.
+
+    In read only mode the stream reads through a `memoryview` of the given
+    buffer without copying it, and byte fields are returned as views.
+
+    Args:
+    -----
+        buffer (bytearray | bytes, optional): Initial content to read from
+        capacity (int, optional): Preallocated buffer size in bytes
+        readonly (bool, optional): Read `buffer` in place (zero copy)
+    """
+
+    def __init__(
+        self,
+        buffer: Optional[bytearray | bytes | memoryview] = None,
+        capacity: int = BITSTREAM_DEFAULT_CAPACITY,
+        readonly: bool = False,
+    ):
+        self._storage = bytearray(capacity)
+        self._buffer: bytearray | memoryview = self._storage
+        self._readonly = False
+        self._write_bit_offset = 0
+        self._read_bit_offset = 0
+        self._pooled = False  # Idle in a BitStreamPool
+        if buffer is not None:
+            self.refresh(buffer, readonly)
+
+    def refresh(self, buffer: bytearray | bytes | memoryview, readonly: bool = False):
+        """Replace the stream content with `buffer` and rewind the read cursor
+
+        Args:
+        -----
+            buffer (bytearray | bytes | memoryview): New content (any buffer object)
+            readonly (bool, optional): Keep a view on `buffer` instead of copying it
+        """
+        if readonly:
+            _view = memoryview(buffer)
+            if _view.ndim != 1 or _view.format != "B":
+                _view = _view.cast("B")
+            self._buffer = _view
+            self._readonly = True
+            self._write_bit_offset = _view.nbytes << 3
         else:
-            self._buffer = buffer
-        self.write_offset = 0
-        self._read_offset = 0
-
-    def refresh(self, buffer: bytearray):
-        self._buffer = buffer
+            _size = len(buffer)
+            if _size > len(self._storage):
+                self._storage = bytearray(buffer)
+            else:
+                self._storage[:_size] = buffer
+            self._buffer = self._storage
+            self._readonly = False
+            self._write_bit_offset = _size << 3
+        self._read_bit_offset = 0
 
     def reset(self):
-        self._buffer = bytearray()
+        """Rewind the stream, the preallocated buffer (capacity) is kept"""
+        self._buffer = self._storage
+        self._readonly = False
+        self._write_bit_offset = 0
+        self._read_bit_offset = 0
+
+    def get_capacity(self) -> int:
+        """Get preallocated buffer size in bytes"""
+        return len(self._storage)
+
+    def shrink(self, capacity: int):
+        """Reallocate the buffer to `capacity` bytes and reset the stream"""
+        self._storage = bytearray(capacity)
+        self.reset()
+
+    def is_readonly(self) -> bool:
+        """Check if the stream is in read only (memoryview) mode"""
+        return self._readonly
+
+    @property
+    def write_offset(self) -> int:
+        """Number of bits written"""
+        return self._write_bit_offset
+
+    @property
+    def read_offset(self) -> int:
+        """Number of bits read"""
+        return self._read_bit_offset
+
+    def get_number_of_bits_used(self) -> int:
+        return self._write_bit_offset
+
+    def get_number_of_unread_bits(self) -> int:
+        return self._write_bit_offset - self._read_bit_offset
+
+    def _reserve(self, num_bits: int):
+        if self._readonly:
+            raise BitStreamError("Trying to write into a read only bitstream")
+        _needed = (self._write_bit_offset + num_bits + 7) >> 3
+        _capacity = len(self._buffer)
+        if _needed > _capacity:
+            _capacity = max(_capacity, 1)
+            while _capacity < _needed:
+                _capacity <<= 1
+            self._buffer.extend(bytes(_capacity - len(self._buffer)))
+
+    def write_bits(self, value: int, num_bits: int):
+        """Write the `num_bits` lower bits of `value` (MSB first)
+
+        Args:
+        -----
+            value (int): Value to write
+            num_bits (int): Number of bits to write
+        """
+        if num_bits < 0:
+            raise BitStreamError("Invalid number of bits for writing")
+        if num_bits == 0:
+            return
+        self._reserve(num_bits)
+        _offset = self._write_bit_offset
+        _index = _offset >> 3
+        _shift = _offset & 7
+        _count = (_shift + num_bits + 7) >> 3
+        _chunk = (value & ((1 << num_bits) - 1)) << ((_count << 3) - _shift - num_bits)
+        if _shift:
+            _chunk |= (self._buffer[_index] & (0xFF00 >> _shift) & 0xFF) << (
+                (_count - 1) << 3
+            )
+        self._buffer[_index : _index + _count] = _chunk.to_bytes(_count, "big")
+        self._write_bit_offset = _offset + num_bits
+
+    def write_bit(self, bit):
+        self.write_bits(1 if bit else 0, 1)
+
+    def write_byte(self, value: int):
+        self.write_bits(value, 8)
 
     def write_bytes(self, data: bytes):
         byte_count = len(data)
-        self._buffer.extend(data)
-        self.write_offset += byte_count
+        if self._write_bit_offset & 7:
+            self.write_bits(int.from_bytes(data, "big"), byte_count << 3)
+            return
+        self._reserve(byte_count << 3)
+        _index = self._write_bit_offset >> 3
+        self._buffer[_index : _index + byte_count] = data
+        self._write_bit_offset += byte_count << 3
+
+    def write_struct(self, struct_obj: Struct, *values):
+        """Pack `values` with a precompiled `struct.Struct` in one call"""
+        _size = struct_obj.size
+        if self._write_bit_offset & 7:
+            self.write_bytes(struct_obj.pack(*values))
+            return
+        self._reserve(_size << 3)
+        struct_obj.pack_into(self._buffer, self._write_bit_offset >> 3, *values)
+        self._write_bit_offset += _size << 3
 
     def write_elementid(self, element):
-        self.write_bytes_capped(bytes(element.value), 17)
+        self.write_native_bits(element.value, 17)
 
-    def read_bytes(self, byte_count):
-        if self._read_offset + byte_count > len(self._buffer):
-            raise BitStreamError("Trying to read beyond the end of the bitstream")
-        result = self._buffer[self._read_offset:self._read_offset + byte_count]
-        self._read_offset += byte_count
-        return result
+    def read_elementid(self) -> int:
+        return self.read_native_bits(17)
+
+    def read_element(self):
+        """Read an element ID and resolve its element (None if free)"""
+        return element_ids.get_by_value(self.read_native_bits(17))
 
     def write_ushort(self, value):
-        self._buffer.extend(value.to_bytes(2, byteorder='little', signed=False))
+        self.write_bytes(value.to_bytes(2, byteorder='little', signed=False))
 
     def write_uint16(self, value):
         self.write_bits(value, 16)
@@ -43,20 +203,6 @@ class BitStream:
         self.write_uint16(len(byte_data))
         self.write_bytes(byte_data)
 
-    def write_bit(self, bit):
-        if bit:
-            self._buffer.append(0x01)
-        else:
-            self._buffer.append(0x00)
-        self.write_offset += 1
-
-    def write_bits(self, value, num_bits):
-        if num_bits < 0 or num_bits > 32:
-            raise BitStreamError("Invalid number of bits for writing")
-        for i in range(num_bits):
-            bit = (value >> (num_bits - 1 - i)) & 1
-            self.write_bit(bit)
-
     def write_int(self, value, num_bits):
         if num_bits < 0 or num_bits > 32:
             raise BitStreamError("Invalid number of bits for writing an integer")
@@ -83,22 +229,6 @@ class BitStream:
         truncated_value = (int_value >> (32 - num_bits)) & ((1 << num_bits) - 1)
         self.write_bits(truncated_value, num_bits)
 
-    def read_bit(self):
-        if self._read_offset >= len(self._buffer):
-            raise BitStreamError("Trying to read beyond the end of the bitstream")
-        bit = bool(self._buffer[self._read_offset])
-        self._read_offset += 1
-        return bit
-
-    def read_bits(self, num_bits):
-        _bits = []
-        for i in range(num_bits):
-            _bits.append(self.read_bit())
-        return _bits
-
-    def read_byte(self):
-        return self.read_bits(8)
-
     def write_string_without_len(self, string: str):
         self.write_bytes(string.encode())
 
@@ -108,56 +238,113 @@ class BitStream:
         self.write_bytes(string_length.to_bytes(2, byteorder='little'))
         self.write_bytes(encoded_string)
 
+    def align_write_to_byte_boundary(self):
+        _shift = self._write_bit_offset & 7
+        if _shift:
+            self.write_bits(0, 8 - _shift)
+
+    def align_read_to_byte_boundary(self):
+        self._read_bit_offset = (self._read_bit_offset + 7) & ~7
+
+    def ignore_bits(self, num_bits: int):
+        if self._read_bit_offset + num_bits > self._write_bit_offset:
+            raise BitStreamError("Trying to read beyond the end of the bitstream")
+        self._read_bit_offset += num_bits
+
+    def read_bits(self, num_bits: int) -> int:
+        """Read `num_bits` bits (MSB first) as an unsigned integer
+
+        Args:
+        -----
+            num_bits (int): Number of bits to read
+
+        Returns:
+        --------
+            int: Read value
+        """
+        _offset = self._read_bit_offset
+        if num_bits < 0 or _offset + num_bits > self._write_bit_offset:
+            raise BitStreamError("Trying to read beyond the end of the bitstream")
+        if num_bits == 0:
+            return 0
+        _index = _offset >> 3
+        _shift = _offset & 7
+        _count = (_shift + num_bits + 7) >> 3
+        _chunk = int.from_bytes(self._buffer[_index : _index + _count], "big")
+        self._read_bit_offset = _offset + num_bits
+        return (_chunk >> ((_count << 3) - _shift - num_bits)) & ((1 << num_bits) - 1)
+
+    def read_bit(self) -> bool:
+        _offset = self._read_bit_offset
+        if _offset >= self._write_bit_offset:
+            raise BitStreamError("Trying to read beyond the end of the bitstream")
+        self._read_bit_offset = _offset + 1
+        return bool(self._buffer[_offset >> 3] & (0x80 >> (_offset & 7)))
+
+    def read_byte(self) -> int:
+        return self.read_bits(8)
+
+    def read_bytes(self, byte_count, copy: bool = False):
+        """Read `byte_count` bytes
+
+        Args:
+        -----
+            byte_count (int): Number of bytes to read
+            copy (bool, optional): In read only mode, return a copy instead of a view
+
+        Returns:
+        --------
+            bytearray | bytes | memoryview: Read bytes (memoryview in read only mode)
+        """
+        _offset = self._read_bit_offset
+        if _offset + (byte_count << 3) > self._write_bit_offset:
+            raise BitStreamError("Trying to read beyond the end of the bitstream")
+        if _offset & 7:
+            return bytearray(
+                self.read_bits(byte_count << 3).to_bytes(byte_count, "big")
+            )
+        _index = _offset >> 3
+        self._read_bit_offset = _offset + (byte_count << 3)
+        if self._readonly and copy:
+            return bytes(self._buffer[_index : _index + byte_count])
+        return self._buffer[_index : _index + byte_count]
+
+    def read_struct(self, struct_obj: Struct) -> tuple:
+        """Unpack a precompiled `struct.Struct` in one call"""
+        _offset = self._read_bit_offset
+        _size = struct_obj.size
+        if _offset & 7:
+            return struct_obj.unpack(self.read_bytes(_size))
+        if _offset + (_size << 3) > self._write_bit_offset:
+            raise BitStreamError("Trying to read beyond the end of the bitstream")
+        self._read_bit_offset = _offset + (_size << 3)
+        return struct_obj.unpack_from(self._buffer, _offset >> 3)
+
     def read_char(self):
-        byte_value = self.read_byte()
-        char_value = chr(byte_value)
-        return char_value
+        return chr(self.read_byte())
 
     def read_string_characters(self, num_characters):
-        characters = ""
-        for _ in range(num_characters):
-            character = self.read_char()
-            characters += character
-        return characters
+        return str(self.read_bytes(num_characters), "latin-1")
 
     def read_string(self):
         string_length = int.from_bytes(self.read_bytes(2), byteorder='little')
         encoded_string = self.read_bytes(string_length)
-        return encoded_string.decode('utf-8')
+        return str(encoded_string, 'utf-8')
 
     def get_bytes(self):
-        return bytes(self._buffer)
-    
+        return bytes(self._buffer[: (self._write_bit_offset + 7) >> 3])
+
     def read_ushort(self):
-        byte_index = self._read_offset
-        data = self._buffer[byte_index:byte_index + 2]
-        value = int.from_bytes(data, byteorder='little', signed=False)
-        self._read_offset += len(data)
-        return value
+        return int.from_bytes(self.read_bytes(2), byteorder='little', signed=False)
 
     def read_uint16(self):
-        if self._read_offset + 2 > len(self._buffer):
-            raise BitStreamError("Trying to read beyond the end of the bitstream")
-        value = (self._buffer[self._read_offset] << 8) | self._buffer[self._read_offset + 1]
-        self._read_offset += 2
-        return value
+        return self.read_bits(16)
 
     def read_uint32(self):
-        byte_index = self._read_offset
-        data = self._buffer[byte_index:byte_index + 4]
-        value = int.from_bytes(data, signed=False)
-        self._read_offset += len(data)
-        return value
+        return self.read_bits(32)
 
     def read_uint64(self):
-        if self._read_offset + 8 > len(self._buffer):
-            raise BitStreamError("Trying to read beyond the end of the bitstream")
-        value = (self._buffer[self._read_offset]     << 56) | (self._buffer[self._read_offset + 1] << 48) | \
-                (self._buffer[self._read_offset + 2] << 40) | (self._buffer[self._read_offset + 3] << 32) | \
-                (self._buffer[self._read_offset + 4] << 24) | (self._buffer[self._read_offset + 5] << 16) | \
-                (self._buffer[self._read_offset + 6] <<  8) | self._buffer[self._read_offset + 7]
-        self._read_offset += 8
-        return value
+        return self.read_bits(64)
 
     def read_int16(self):
         value = self.read_uint16()
@@ -178,24 +365,333 @@ class BitStream:
         return value
 
     def read_float(self):
-        if self._read_offset + 4 > len(self._buffer):
-            raise BitStreamError("Trying to read beyond the end of the bitstream")
-        bytes_data = self._buffer[self._read_offset : self._read_offset + 4]
-        self._read_offset += 4
-        return unpack('!f', bytes_data)[0]
+        return self.read_struct(_FLOAT)[0]
 
     def read_double(self):
-        if self._read_offset + 8 > len(self._buffer):
-            raise BitStreamError("Trying to read beyond the end of the bitstream")
-        bytes_data = self._buffer[self._read_offset : self._read_offset + 8]
-        self._read_offset += 8
-        return unpack('!d', bytes_data)[0]
+        return self.read_struct(_DOUBLE)[0]
 
-    def read_bytes_capped(self, max_bytes):
+    def read_bytes_capped(self, max_bytes, copy: bool = False):
         length = self.read_uint16()
         if length > max_bytes:
             raise BitStreamError("Capped byte length exceeds the maximum allowed")
-        return self.read_bytes(length)
+        return self.read_bytes(length, copy)
+
+    def write_native_bits(self, value: int, num_bits: int):
+        """Write an integer the way RakNet `WriteBits(&value, num_bits)` does
+
+        The value bytes are written in memory (little endian) order,
+        the last partial byte keeps its lower bits.
+
+        Args:
+        -----
+            value (int): Value to write (negative values are two's complement)
+            num_bits (int): Number of bits to write
+        """
+        _full = num_bits >> 3
+        _rem = num_bits & 7
+        value &= (1 << num_bits) - 1
+        _low = value & ((1 << (_full << 3)) - 1)
+        _word = int.from_bytes(_low.to_bytes(_full, "little"), "big")
+        self.write_bits((_word << _rem) | (value >> (_full << 3)), num_bits)
+
+    def read_native_bits(self, num_bits: int, signed: bool = False) -> int:
+        """Read an integer written with `write_native_bits`"""
+        _full = num_bits >> 3
+        _rem = num_bits & 7
+        _word = self.read_bits(num_bits)
+        _value = int.from_bytes((_word >> _rem).to_bytes(_full, "little"), "big") | (
+            (_word & ((1 << _rem) - 1)) << (_full << 3)
+        )
+        if signed and _value >> (num_bits - 1):
+            _value -= 1 << num_bits
+        return _value
+
+    def write_compressed(self, value: int, num_bytes: int = 4, unsigned: bool = True):
+        """Write an integer with RakNet `WriteCompressed`
+
+        High bytes equal to 0 (0xFF for negative values) cost a single bit.
+
+        Args:
+        -----
+            value (int): Value to write
+            num_bytes (int, optional): Size of the integer type. Defaults to 4.
+            unsigned (bool, optional): Unsigned integer type. Defaults to True.
+        """
+        _data = (value & ((1 << (num_bytes << 3)) - 1)).to_bytes(num_bytes, "little")
+        _match = 0x00 if unsigned else 0xFF
+        _current = num_bytes - 1
+        while _current > 0:
+            if _data[_current] != _match:
+                self.write_bit(False)
+                self.write_bytes(_data[: _current + 1])
+                return
+            self.write_bit(True)
+            _current -= 1
+        if (_data[0] & 0xF0) == (_match & 0xF0):
+            self.write_bits(0x10 | (_data[0] & 0x0F), 5)
+        else:
+            self.write_bits(_data[0], 9)
+
+    def read_compressed(self, num_bytes: int = 4, unsigned: bool = True) -> int:
+        """Read an integer written with `write_compressed`"""
+        _data = bytearray(num_bytes)
+        _match = 0x00 if unsigned else 0xFF
+        _current = num_bytes - 1
+        while _current > 0:
+            if not self.read_bit():
+                _data[: _current + 1] = self.read_bytes(_current + 1)
+                return int.from_bytes(_data, "little", signed=not unsigned)
+            _data[_current] = _match
+            _current -= 1
+        if self.read_bit():
+            _data[0] = self.read_bits(4) | (_match & 0xF0)
+        else:
+            _data[0] = self.read_bits(8)
+        return int.from_bytes(_data, "little", signed=not unsigned)
+
+    def write_bytes_capped_compressed(self, byte_data: bytes, max_bytes: int):
+        """Write bytes prefixed with a compressed ushort length"""
+        if len(byte_data) > max_bytes:
+            raise BitStreamError("Byte data exceeds the maximum allowed length")
+        self.write_compressed(len(byte_data), 2)
+        self.write_bytes(byte_data)
+
+    def read_bytes_capped_compressed(self, max_bytes: int, copy: bool = False):
+        length = self.read_compressed(2)
+        if length > max_bytes:
+            raise BitStreamError("Capped byte length exceeds the maximum allowed")
+        return self.read_bytes(length, copy)
+
+    def write_norm_vector(self, x: float, y: float, z: float):
+        """Write a normalized vector (RakNet `WriteNormVector`)"""
+        self.write_bit(x < 0.0)
+        for _value in (y, z):
+            if _value == 0.0:
+                self.write_bit(True)
+            else:
+                _value = min(max(_value, -1.0), 1.0)
+                self.write_bit(False)
+                self.write_native_bits(int((_value + 1.0) * 32767.5), 16)
+
+    def read_norm_vector(self) -> Vector3:
+        """Read a normalized vector written with `write_norm_vector`"""
+        _xneg = self.read_bit()
+        _y = 0.0 if self.read_bit() else self.read_native_bits(16) / 32767.5 - 1.0
+        _z = 0.0 if self.read_bit() else self.read_native_bits(16) / 32767.5 - 1.0
+        _x = sqrt(max(1.0 - _y * _y - _z * _z, 0.0))
+        return Vector3(-_x if _xneg else _x, _y, _z)
+
+    def write_norm_vectors(self, vectors: Sequence[Vector3]):
+        for _vector in vectors:
+            self.write_norm_vector(_vector.x, _vector.y, _vector.z)
+
+    def read_norm_vectors(self, count: int) -> List[Vector3]:
+        return [self.read_norm_vector() for _ in range(count)]
+
+    def _write_native_batch(self, values: List[int], num_bits: int):
+        if num_bits & 7:
+            for _value in values:
+                self.write_native_bits(_value, num_bits)
+            return
+        _size = num_bits >> 3
+        _mask = (1 << num_bits) - 1
+        self.write_bytes(
+            b"".join((_value & _mask).to_bytes(_size, "little") for _value in values)
+        )
+
+    def _read_native_batch(self, count: int, num_bits: int, signed: bool) -> List[int]:
+        if num_bits & 7:
+            return [self.read_native_bits(num_bits, signed) for _ in range(count)]
+        _size = num_bits >> 3
+        _data = self.read_bytes(count * _size)
+        return [
+            int.from_bytes(_data[_index : _index + _size], "little", signed=signed)
+            for _index in range(0, count * _size, _size)
+        ]
+
+    def write_positions(
+        self,
+        vectors: Sequence[Vector3],
+        integer_bits: int = 14,
+        fractional_bits: int = 10,
+    ):
+        """Write positions as MTA fixed point numbers (`SFloatSync`)
+
+        Args:
+        -----
+            vectors (Sequence[Vector3]): Positions to write
+            integer_bits (int, optional): Integer part bits (sign included). Defaults to 14.
+            fractional_bits (int, optional): Fractional part bits. Defaults to 10.
+        """
+        _bits = integer_bits + fractional_bits
+        _scale = 1 << fractional_bits
+        _max = (1 << (_bits - 1)) - 1
+        _min = -(1 << (_bits - 1))
+        self._write_native_batch(
+            [
+                min(max(int(_value * _scale), _min), _max)
+                for _vector in vectors
+                for _value in (_vector.x, _vector.y, _vector.z)
+            ],
+            _bits,
+        )
+
+    def read_positions(
+        self, count: int, integer_bits: int = 14, fractional_bits: int = 10
+    ) -> List[Vector3]:
+        """Read `count` positions written with `write_positions`"""
+        _scale = 1 << fractional_bits
+        _values = self._read_native_batch(
+            count * 3, integer_bits + fractional_bits, True
+        )
+        return [
+            Vector3(
+                _values[_i] / _scale, _values[_i + 1] / _scale, _values[_i + 2] / _scale
+            )
+            for _i in range(0, count * 3, 3)
+        ]
+
+    def write_position(
+        self, vector: Vector3, integer_bits: int = 14, fractional_bits: int = 10
+    ):
+        self.write_positions((vector,), integer_bits, fractional_bits)
+
+    def read_position(
+        self, integer_bits: int = 14, fractional_bits: int = 10
+    ) -> Vector3:
+        return self.read_positions(1, integer_bits, fractional_bits)[0]
+
+    def write_float_as_bits(
+        self,
+        value: float,
+        min_value: float,
+        max_value: float,
+        num_bits: int,
+        wrap: bool = False,
+    ):
+        """Write a float quantized in [min_value, max_value] (`SFloatAsBitsSync`)"""
+        self._write_native_batch(
+            [_quantize(value, min_value, max_value, num_bits, wrap)], num_bits
+        )
+
+    def read_float_as_bits(
+        self, min_value: float, max_value: float, num_bits: int
+    ) -> float:
+        _alpha = self.read_native_bits(num_bits) / ((1 << num_bits) - 1)
+        return min_value + _alpha * (max_value - min_value)
+
+    def write_rotations(self, vectors: Sequence[Vector3], num_bits: int = 16):
+        """Write rotations in degrees (`SRotationDegreesSync`)
+
+        Args:
+        -----
+            vectors (Sequence[Vector3]): Rotations (degrees) to write
+            num_bits (int, optional): Bits per component. Defaults to 16.
+        """
+        self._write_native_batch(
+            [
+                _quantize(_value, 0.0, 360.0, num_bits, True)
+                for _vector in vectors
+                for _value in (_vector.x, _vector.y, _vector.z)
+            ],
+            num_bits,
+        )
+
+    def read_rotations(self, count: int, num_bits: int = 16) -> List[Vector3]:
+        """Read `count` rotations written with `write_rotations`"""
+        _scale = 360.0 / ((1 << num_bits) - 1)
+        _values = self._read_native_batch(count * 3, num_bits, False)
+        return [
+            Vector3(
+                _values[_i] * _scale, _values[_i + 1] * _scale, _values[_i + 2] * _scale
+            )
+            for _i in range(0, count * 3, 3)
+        ]
+
+    def write_rotation(self, vector: Vector3, num_bits: int = 16):
+        self.write_rotations((vector,), num_bits)
+
+    def read_rotation(self, num_bits: int = 16) -> Vector3:
+        return self.read_rotations(1, num_bits)[0]
 
     def get_size(self):
-        return len(self._buffer)
\ No newline at end of file
+        return (self._write_bit_offset + 7) >> 3
+
+
+class BitStreamPool(object):
+    """Pool of reusable BitStream buffers
+
+    Args:
+    -----
+        size (int, optional): Number of preallocated streams
+        capacity (int, optional): Buffer size of each stream in bytes
+        max_size (int, optional): Max number of idle streams kept by the pool
+    """
+
+    def __init__(
+        self,
+        size: int = 32,
+        capacity: int = BITSTREAM_DEFAULT_CAPACITY,
+        max_size: int = 1024,
+    ) -> None:
+        self._capacity = capacity
+        self._max_size = max_size
+        self._streams: List[BitStream] = [
+            BitStream(capacity=capacity) for _ in range(size)
+        ]
+        for _bitstream in self._streams:
+            _bitstream._pooled = True
+        self._allocated = size
+
+    def acquire(self) -> BitStream:
+        """Get an empty stream from the pool (allocates one if the pool is empty)"""
+        try:
+            _bitstream = self._streams.pop()
+        except IndexError:
+            self._allocated += 1
+            return BitStream(capacity=self._capacity)
+        _bitstream._pooled = False
+        return _bitstream
+
+    def release(self, bitstream: BitStream) -> bool:
+        """Give back a stream to the pool
+
+        Returns:
+        --------
+            bool: False if the stream was already released (ignored)
+        """
+        if bitstream._pooled:
+            return False
+        bitstream._pooled = True
+        if bitstream.get_capacity() > BITSTREAM_POOL_MAX_CAPACITY:
+            bitstream.shrink(self._capacity)
+        else:
+            bitstream.reset()
+        if len(self._streams) < self._max_size:
+            self._streams.append(bitstream)
+        return True
+
+    @contextmanager
+    def borrow(self) -> Iterator[BitStream]:
+        """Acquire a stream for the `with` block
+
+        >>> with pool.borrow() as bitstream:
+        ...     bitstream.write_string("deathmatch")
+        """
+        _bitstream = self.acquire()
+        try:
+            yield _bitstream
+        finally:
+            self.release(_bitstream)
+
+    def get_idle_count(self) -> int:
+        """Get number of streams waiting in the pool"""
+        return len(self._streams)
+
+    def get_allocated_count(self) -> int:
+        """Get number of streams allocated by the pool"""
+        return self._allocated
+
+
+# Default pool used by packets
+bitstream_pool = BitStreamPool()
@@ -0,0 +1,51 @@
+"""Received Packets Payloads"""
+
+from typing import Any
+
+_EMPTY_PAYLOAD = memoryview(b"").toreadonly()
+
+
+def as_payload(content: Any) -> memoryview:
+    """Get a read only view of a received packet content
+
+    Buffer objects (bytes, bytearray, mmap, ...) are viewed in place,
+    other contents (ex: sequence of ints) are copied once.
+
+    Args:
+    -----
+        content (Any): Packet content (from the transport)
+
+    Returns:
+    --------
+        memoryview: Read only bytes view
+    """
+    if content is None:
+        return _EMPTY_PAYLOAD
+    try:
+        _view = memoryview(content)
+    except TypeError:
+        return memoryview(bytes(content)).toreadonly()
+    if _view.ndim != 1 or _view.format != "B":
+        _view = _view.cast("B")
+    return _view if _view.readonly else _view.toreadonly()
+
+
+def retain_payload(payload: Any) -> bytes:
+    """Get a payload copy that can be kept after the handler returns
+
+    Views over a whole `bytes` object return that object (no copy).
+
+    Args:
+    -----
+        payload (Any): Packet payload (memoryview)
+
+    Returns:
+    --------
+        bytes: Payload bytes
+    """
+    if type(payload) is bytes:
+        return payload
+    _obj = getattr(payload, "obj", None)
+    if type(_obj) is bytes and len(_obj) == payload.nbytes:
+        return _obj
+    return bytes(payload)
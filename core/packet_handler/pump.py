@@ -0,0 +1,173 @@
+"""Packet Pump"""
+
+import asyncio
+import time
+from typing import Any, Callable, List, Literal, Tuple
+
+# (packet id, player binary address, packet index, packet content)
+RawPacket = Tuple[int, int, int, Any]
+
+# receive_batch(max_packets, last_packet_index) -> new packets (oldest first)
+ReceiveBatchFunc = Callable[[int, int], List[RawPacket]]
+
+# process(packet_id, player_binaddr, packet_content)
+ProcessFunc = Callable[[int, int, Any], Any]
+
+
+class PacketPumpStats(object):
+    """Packet pump counters"""
+
+    def __init__(self) -> None:
+        self.packets = 0
+        self.batches = 0
+        self.empty_polls = 0
+        self.duplicates = 0
+        self.lost = 0
+        self.index_resets = 0
+        self.sleeps = 0
+        self.sleep_time = 0.0
+        self.max_batch = 0
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class PacketPump(object):
+    """Batched, backoff aware packet receive loop
+
+    Drains up to `batch_size` packets per poll, tracks packet index gaps
+    (lost packets) and duplicates explicitly, and sleeps with an exponential
+    backoff (from `min_sleep` up to `max_sleep` seconds) while no packet
+    arrives, so an idle server doesn't burn a full core.
+
+    Packet indexes going back by less than `reset_window` are duplicates,
+    a larger jump back means the backend restarted its packet counter
+    (ex: network init/start again), the pump follows the new indexes.
+
+    Args:
+    -----
+        receive_batch (ReceiveBatchFunc): Poll function of the network backend
+        process (ProcessFunc): Called for every received packet
+        batch_size (int, optional): Max packets drained per poll
+        min_sleep (float, optional): First backoff sleep (seconds)
+        max_sleep (float, optional): Max backoff sleep (seconds)
+        reset_window (int, optional): Smallest index jump back seen as a counter reset
+        logger (Logger, optional): Logs the counter resets
+    """
+
+    def __init__(
+        self,
+        receive_batch: ReceiveBatchFunc,
+        process: ProcessFunc,
+        batch_size: int = 64,
+        min_sleep: float = 0.0005,
+        max_sleep: float = 0.01,
+        reset_window: int = 64,
+        logger: Any = None,
+    ) -> None:
+        self._receive_batch = receive_batch
+        self._process = process
+        self._batch_size = max(batch_size, 1)
+        self._min_sleep = min_sleep
+        self._max_sleep = max(max_sleep, min_sleep)
+        self._sleep = 0.0
+        self._last_index = -1
+        self._reset_window = max(reset_window, 1)
+        self._logger = logger
+        self._isrunning = False
+        self._stats = PacketPumpStats()
+
+    def get_stats(self) -> PacketPumpStats:
+        """Get pump counters"""
+        return self._stats
+
+    def get_last_packet_index(self) -> int:
+        return self._last_index
+
+    def is_running(self) -> bool:
+        return self._isrunning
+
+    def reset(self) -> Literal[True]:
+        """Forget the last packet index (the next packet is never a duplicate)"""
+        self._last_index = -1
+        return True
+
+    def stop(self) -> Literal[True]:
+        """Stop `run()` loop after the current poll"""
+        self._isrunning = False
+        return True
+
+    def poll(self) -> int:
+        """Drain one batch of packets and process them
+
+        Returns:
+        --------
+            int: Number of processed packets
+        """
+        _stats = self._stats
+        _batch = self._receive_batch(self._batch_size, self._last_index)
+        _processed = 0
+        for _packet_id, _player, _index, _content in _batch:
+            if self._last_index >= 0:
+                if self._last_index - _index >= self._reset_window:
+                    _stats.index_resets += 1
+                    if self._logger is not None:
+                        self._logger.warning(
+                            f"Packet index went back from {self._last_index} to {_index}, "
+                            "counter reset assumed"
+                        )
+                elif _index <= self._last_index:
+                    _stats.duplicates += 1
+                    continue
+                else:
+                    _stats.lost += _index - self._last_index - 1
+            self._last_index = _index
+            if _packet_id == 0 or _player == 0:
+                continue
+            self._process(_packet_id, _player, _content)
+            _processed += 1
+
+        if _processed:
+            _stats.packets += _processed
+            _stats.batches += 1
+            _stats.max_batch = max(_stats.max_batch, _processed)
+        else:
+            _stats.empty_polls += 1
+        return _processed
+
+    def backoff(self, processed: int) -> None:
+        """Sleep (exponential backoff) if the last poll was empty"""
+        _delay = self._next_sleep(processed)
+        if _delay:
+            time.sleep(_delay)
+
+    def run(self) -> Literal[True]:
+        """Run the receive loop until `stop()` is called"""
+        self._isrunning = True
+        while self._isrunning:
+            self.backoff(self.poll())
+        return True
+
+    async def run_async(self) -> Literal[True]:
+        """Run the receive loop as an asyncio task until `stop()` is called
+
+        Busy polls yield to the other loop tasks, idle polls sleep
+        with the same backoff as `run()`.
+        """
+        self._isrunning = True
+        while self._isrunning:
+            await asyncio.sleep(self._next_sleep(self.poll()))
+        return True
+
+    def _next_sleep(self, processed: int) -> float:
+        if processed:
+            self._sleep = 0.0
+            return 0.0
+        self._sleep = (
+            self._min_sleep
+            if not self._sleep
+            else min(self._sleep * 2, self._max_sleep)
+        )
+        self._stats.sleeps += 1
+        self._stats.sleep_time += self._sleep
+        return self._sleep
@@ -0,0 +1,174 @@
+"""Packet Handlers Registry"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.errors import PacketHandlerError
+
+# handler(packet_id, player_binaddr, payload) -> True if handled (stops the chain)
+PacketHandlerFunc = Callable[[int, int, Any], Optional[bool]]
+
+# Packet ids are sent as a single byte
+MAX_PACKET_ID = 255
+
+
+class PacketRegistry(object):
+    """Packet handlers registry
+
+    Handlers are stored in a flat table indexed by packet id, so dispatch
+    cost doesn't depend on the number of handled packets. Handlers of the
+    same packet are called in registration order until one returns True,
+    fallback handlers are called for packets nobody handled. Owners are
+    kept per registration, so a handler registered by two owners stays
+    registered until both are unregistered.
+
+    >>> @server.packets.on(PacketID.PACKET_ID_PLAYER_PURESYNC)
+    ... def on_puresync(packet_id, player, payload):
+    ...     return True
+    """
+
+    def __init__(self) -> None:
+        self._table: List[Tuple[PacketHandlerFunc, ...]] = [()] * (MAX_PACKET_ID + 1)
+        self._fallbacks: Tuple[PacketHandlerFunc, ...] = ()
+        # (packet id, handler) -> owner of each registration (None: fallbacks)
+        self._owners: Dict[Tuple[Optional[int], PacketHandlerFunc], List[Any]] = {}
+
+    def register(
+        self,
+        packet_id: Union[PacketID, int],
+        handler: PacketHandlerFunc,
+        owner: Any = None,
+        first: bool = False,
+    ) -> PacketHandlerFunc:
+        """Register a packet handler
+
+        Args:
+        -----
+            packet_id (PacketID | int): Packet id to handle
+            handler (PacketHandlerFunc): handler(packet_id, player_binaddr, payload)
+            owner (Any, optional): Handler owner (ex: Resource) for `unregister_owner`
+            first (bool, optional): Call the handler before the already registered ones
+
+        Returns:
+        --------
+            PacketHandlerFunc: The registered handler
+        """
+        _id = self._get_index(packet_id)
+        if first:
+            self._table[_id] = (handler,) + self._table[_id]
+        else:
+            self._table[_id] = self._table[_id] + (handler,)
+        if owner is not None:
+            self._owners.setdefault((_id, handler), []).append(owner)
+        return handler
+
+    def on(
+        self, packet_id: Union[PacketID, int], owner: Any = None, first: bool = False
+    ) -> Callable[[PacketHandlerFunc], PacketHandlerFunc]:
+        """Register a packet handler (decorator)"""
+
+        def _decorator(handler: PacketHandlerFunc) -> PacketHandlerFunc:
+            return self.register(packet_id, handler, owner, first)
+
+        return _decorator
+
+    def register_fallback(
+        self, handler: PacketHandlerFunc, owner: Any = None
+    ) -> PacketHandlerFunc:
+        """Register a handler called for packets no handler handled"""
+        self._fallbacks = self._fallbacks + (handler,)
+        if owner is not None:
+            self._owners.setdefault((None, handler), []).append(owner)
+        return handler
+
+    def unregister(
+        self, packet_id: Union[PacketID, int], handler: PacketHandlerFunc
+    ) -> bool:
+        """Unregister a packet handler
+
+        Returns:
+        --------
+            bool: True if the handler was registered
+        """
+        _id = self._get_index(packet_id)
+        if handler not in self._table[_id]:
+            return False
+        self._table[_id] = tuple(
+            _iter for _iter in self._table[_id] if _iter != handler
+        )
+        self._owners.pop((_id, handler), None)
+        return True
+
+    def unregister_owner(self, owner: Any) -> int:
+        """Unregister all the handlers registered by `owner` (ex: a stopped resource)
+
+        Returns:
+        --------
+            int: Number of unregistered handlers
+        """
+        _count = 0
+        for _key, _owners in list(self._owners.items()):
+            _kept_owners = [_owner for _owner in _owners if _owner is not owner]
+            _removed = len(_owners) - len(_kept_owners)
+            if not _removed:
+                continue
+            if _kept_owners:
+                self._owners[_key] = _kept_owners
+            else:
+                del self._owners[_key]
+            _id, _handler = _key
+            if _id is None:
+                self._fallbacks = _remove_last(self._fallbacks, _handler, _removed)
+            else:
+                self._table[_id] = _remove_last(self._table[_id], _handler, _removed)
+            _count += _removed
+        return _count
+
+    def get_handlers(
+        self, packet_id: Union[PacketID, int]
+    ) -> Tuple[PacketHandlerFunc, ...]:
+        """Get the handlers of a packet id"""
+        return self._table[self._get_index(packet_id)]
+
+    def is_handled(self, packet_id: int) -> bool:
+        """Check if a packet id has at least one handler"""
+        return 0 <= packet_id <= MAX_PACKET_ID and bool(self._table[packet_id])
+
+    def dispatch(self, packet_id: int, player: int, payload: Any) -> bool:
+        """Dispatch a packet to its handlers
+
+        Args:
+        -----
+            packet_id (int): Packet id
+            player (int): Player binary address
+            payload (Any): Packet content
+
+        Returns:
+        --------
+            bool: True if a handler handled the packet
+        """
+        if 0 <= packet_id <= MAX_PACKET_ID:
+            for _handler in self._table[packet_id]:
+                if _handler(packet_id, player, payload):
+                    return True
+        for _handler in self._fallbacks:
+            if _handler(packet_id, player, payload):
+                return True
+        return False
+
+    def _get_index(self, packet_id: Union[PacketID, int]) -> int:
+        _id = packet_id.value if isinstance(packet_id, PacketID) else int(packet_id)
+        if not 0 <= _id <= MAX_PACKET_ID:
+            raise PacketHandlerError(f"Invalid packet id ({_id})")
+        return _id
+
+
+def _remove_last(
+    handlers: Tuple[PacketHandlerFunc, ...], handler: PacketHandlerFunc, count: int
+) -> Tuple[PacketHandlerFunc, ...]:
+    """Remove the last `count` registrations of `handler`"""
+    _handlers = list(handlers)
+    for _index in range(len(_handlers) - 1, -1, -1):
+        if count and _handlers[_index] == handler:
+            del _handlers[_index]
+            count -= 1
+    return tuple(_handlers)
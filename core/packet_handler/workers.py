@@ -0,0 +1,102 @@
+"""Packet Processing Workers"""
+
+from queue import SimpleQueue
+from threading import Thread
+from typing import Any, Callable, List, Literal, Optional, Tuple
+
+# dispatch(packet_id, player_binaddr, payload)
+PacketDispatchFunc = Callable[[int, int, Any], Any]
+
+_STOP = None
+
+
+class PacketWorkerPool(object):
+    """Per player ordered packet processing pool
+
+    Packets are sharded on the workers by player binary address, so the
+    packets of a player are handled in order by the same worker while
+    different players are processed concurrently.
+
+    Args:
+    -----
+        dispatch (PacketDispatchFunc): dispatch(packet_id, player_binaddr, payload)
+        workers (int): Number of worker threads
+        logger (Logger, optional): Logger used to report handler errors
+    """
+
+    def __init__(self, dispatch: PacketDispatchFunc, workers: int, logger=None) -> None:
+        self._dispatch = dispatch
+        self._logger = logger
+        self._queues: List[SimpleQueue[Optional[Tuple[int, int, Any]]]] = [
+            SimpleQueue() for _ in range(max(workers, 1))
+        ]
+        self._threads: List[Thread] = []
+        self._processed = [0] * len(self._queues)
+        self._isrunning = False
+
+    def start(self) -> Literal[True]:
+        """Start the worker threads"""
+        if self._isrunning:
+            return True
+        self._isrunning = True
+        for _index, _queue in enumerate(self._queues):
+            _thread = Thread(
+                target=self._worker,
+                args=(_index, _queue),
+                name=f"Packet Worker #{_index}",
+                daemon=True,
+            )
+            _thread.start()
+            self._threads.append(_thread)
+        return True
+
+    def stop(self, wait: bool = True) -> Literal[True]:
+        """Stop the worker threads once their queues are empty"""
+        if not self._isrunning:
+            return True
+        self._isrunning = False
+        for _queue in self._queues:
+            _queue.put(_STOP)
+        if wait:
+            for _thread in self._threads:
+                _thread.join()
+        self._threads.clear()
+        return True
+
+    def submit(self, packet_id: int, player: int, payload: Any) -> None:
+        """Queue a packet on its player worker"""
+        self._queues[player % len(self._queues)].put((packet_id, player, payload))
+
+    def get_worker_count(self) -> int:
+        """Get number of workers"""
+        return len(self._queues)
+
+    def get_worker_index(self, player: int) -> int:
+        """Get the worker processing a player packets"""
+        return player % len(self._queues)
+
+    def get_queue_depths(self) -> List[int]:
+        """Get number of packets waiting in each worker queue"""
+        return [_queue.qsize() for _queue in self._queues]
+
+    def get_processed_counts(self) -> List[int]:
+        """Get number of packets processed by each worker"""
+        return list(self._processed)
+
+    def is_running(self) -> bool:
+        return self._isrunning
+
+    def _worker(self, index: int, queue: SimpleQueue) -> None:
+        _dispatch = self._dispatch
+        while True:
+            _item = queue.get()
+            if _item is _STOP:
+                return
+            try:
+                _dispatch(*_item)
+            except Exception as err:
+                if self._logger:
+                    self._logger.error(
+                        f"Packet handler error (packet {_item[0]}): {err!r}"
+                    )
+            self._processed[index] += 1
@@ -0,0 +1,23 @@
+"""Network Transports"""
+
+from typing import Type
+
+from IronicMTA.core.transport.base import Transport, BandwidthStatistics
+from IronicMTA.core.transport.loopback import LoopbackTransport, LoopbackClient
+from IronicMTA.errors import NetworkWrapperInitError
+
+
+def get_transport(name: str) -> Type[Transport]:
+    """Get a transport backend by its name ("ctypes" or "loopback")
+
+    Raises:
+    -------
+        NetworkWrapperInitError: Unknown transport name
+    """
+    if name == "ctypes":
+        from IronicMTA.core.wrapper import NetworkWrapper
+
+        return NetworkWrapper
+    if name == "loopback":
+        return LoopbackTransport
+    raise NetworkWrapperInitError(f"Unknown network transport ({name})")
@@ -0,0 +1,251 @@
+"""Network Transport Base"""
+
+from abc import ABC, abstractmethod
+from ctypes import Structure, c_float, c_longlong, c_uint
+from typing import Any, Iterable, List, Literal, Tuple
+
+from IronicMTA.core.packet_ids import PacketPriority, PacketReliability, PacketID
+from IronicMTA.core.packet_handler import PacketHandler
+from IronicMTA.core.packet_handler.pump import PacketPump, RawPacket
+
+# (player binary address, packet id, bitstream version, data, reliability, priority)
+OutgoingPacket = Tuple[int, PacketID, int, bytes, PacketReliability, PacketPriority]
+
+
+class ThreadCPUTimes(Structure):
+    """Server Thread statistics"""
+
+    _fields_ = [
+        ("uiProcessorNumber", c_uint),
+        ("fUserPercent", c_float),
+        ("fKernelPercent", c_float),
+        ("fTotalCPUPercent", c_float),
+        ("fUserPercentAvg", c_float),
+        ("fKernelPercentAvg", c_float),
+        ("fTotalCPUPercentAvg", c_float),
+    ]
+
+
+class BandwidthStatistics(Structure):
+    """Server Network Bandwidth statistics"""
+
+    _fields_ = [
+        ("llOutgoingUDPByteCount", c_longlong),
+        ("llIncomingUDPByteCount", c_longlong),
+        ("llIncomingUDPByteCountBlocked", c_longlong),
+        ("llOutgoingUDPPacketCount", c_longlong),
+        ("llIncomingUDPPacketCount", c_longlong),
+        ("llIncomingUDPPacketCountBlocked", c_longlong),
+        ("llOutgoingUDPByteResentCount", c_longlong),
+        ("llOutgoingUDPMessageResentCount", c_longlong),
+        ("threadCPUTimes", ThreadCPUTimes),
+    ]
+
+
+class Transport(ABC):
+    """Network transport backend
+
+    Backends implement the raw network operations (setup, start, receive
+    batch, send, statistics, player address), packet listening (packet pump
+    and handler) and broadcasting are shared by all the backends. A backend
+    missing one of the abstract methods can't be instantiated.
+
+    Args:
+    -----
+        server (Server): IronicMTA Server
+    """
+
+    def __init__(self, server) -> None:
+        self._server = server
+        self._packet_handler: PacketHandler | None = None
+        self._pump: PacketPump | None = None
+
+    @abstractmethod
+    def init(self) -> bool:
+        """Setup the transport
+
+        Returns:
+        --------
+            bool: True If the transport has been setup successfuly
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def start(self) -> Literal[True]:
+        """Start the transport"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stop(self) -> Literal[True]:
+        """Stop the transport"""
+        raise NotImplementedError
+
+    def destroy(self) -> Literal[True]:
+        """Stop listening and packet processing"""
+        self.stop_listening()
+        if self._packet_handler is not None:
+            self._packet_handler.stop()
+        return True
+
+    @abstractmethod
+    def receive_batch(self, max_packets: int, last_index: int) -> List[RawPacket]:
+        """Drain the received packets (oldest first)
+
+        Args:
+        -----
+            max_packets (int): Max number of packets to return
+            last_index (int): Index of the last received packet
+
+        Returns:
+        --------
+            List[RawPacket]: (packet id, player, packet index, packet content) list
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def send(
+        self,
+        player_binaddr: int,
+        packet_id: PacketID,
+        bitstream_version: int,
+        data: bytes,
+        reliability: PacketReliability = PacketReliability.RELIABLE,
+        priority: PacketPriority = PacketPriority.HIGH,
+    ) -> Literal[True]:
+        """Send Client packet
+
+        Args:
+        -----
+            player_binaddr (int): Client Player Binary Address
+            packet_id (int): Packet ID
+            bitstream_version (int): BitStream Version
+            data (bytes): Sequence of bytes represents the data to send
+            reliability (PacketReliability, optional): Packet reliability.
+            Defaults to PacketReliability.RELIABLE.
+            priority (PacketPriority, optional): Packet Priority. Defaults to PacketPriority.HIGH.
+
+        Returns:
+        --------
+            Literal[True]: if packet has been sent successfuly (without errors)
+        """
+        raise NotImplementedError
+
+    def broadcast(
+        self,
+        player_binaddrs: Iterable[int],
+        packet_id: PacketID,
+        bitstream_version: int,
+        data: bytes,
+        reliability: PacketReliability = PacketReliability.RELIABLE,
+        priority: PacketPriority = PacketPriority.HIGH,
+    ) -> int:
+        """Send the same packet data to many clients
+
+        Returns:
+        --------
+            int: Number of clients the packet has been sent to
+        """
+        _count = 0
+        for _binaddr in player_binaddrs:
+            self.send(
+                _binaddr, packet_id, bitstream_version, data, reliability, priority
+            )
+            _count += 1
+        return _count
+
+    def send_many(self, packets: Iterable[OutgoingPacket]) -> int:
+        """Send many packets at once
+
+        Args:
+        -----
+            packets (Iterable[OutgoingPacket]): (player binary address, packet id,
+                bitstream version, data, reliability, priority) records
+
+        Returns:
+        --------
+            int: Number of sent packets
+        """
+        _count = 0
+        for _packet in packets:
+            self.send(*_packet)
+            _count += 1
+        return _count
+
+    @abstractmethod
+    def get_bandwidth_statistics(self) -> Literal[False] | BandwidthStatistics:
+        """Get Bandwidth statistics"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_player_address(self, player_binaddr: int) -> Tuple[str, int]:
+        """Get Player Address (Ip, Port)
+
+        Raises:
+        -------
+            NetworkWrapperError: Invalid Client player binary address
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_valid_socket(self, player_binaddr: int) -> bool:
+        """Check if socket is valid"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_client_bitstream_version(
+        self, client_binaddr: int, version: int
+    ) -> Literal[True]:
+        """Set BitStream Version"""
+        raise NotImplementedError
+
+    def start_listening(self) -> Literal[True]:
+        """Start Server packet listening (blocks until `stop_listening()`)
+
+        Returns:
+        --------
+            Literal[True]: True if all succeded
+        """
+        return self._create_pump().run()
+
+    async def listen_async(self) -> Literal[True]:
+        """Start Server packet listening as an asyncio task (until `stop_listening()`)
+
+        Returns:
+        --------
+            Literal[True]: True if all succeded
+        """
+        return await self._create_pump().run_async()
+
+    def stop_listening(self) -> Literal[True]:
+        """Stop Server packet listening
+
+        Returns:
+        --------
+            Literal[True]: True if all succeded
+        """
+        if self._pump is not None:
+            self._pump.stop()
+        return True
+
+    def get_packet_handler(self) -> PacketHandler | None:
+        """Get the packet handler (None if the server isn't listening)"""
+        return self._packet_handler
+
+    def get_pump(self) -> PacketPump | None:
+        """Get the packet pump (None if the server isn't listening)"""
+        return self._pump
+
+    def _create_pump(self) -> PacketPump:
+        _packet_handler = PacketHandler(self._server)
+        self._packet_handler = _packet_handler
+
+        _settings = self._server.get_settings()["network"]
+        self._pump = PacketPump(
+            self.receive_batch,
+            _packet_handler.process,
+            batch_size=_settings["pump_batch_size"],
+            min_sleep=_settings["pump_min_sleep"],
+            max_sleep=_settings["pump_max_sleep"],
+            logger=self._server.get_logger(),
+        )
+        return self._pump
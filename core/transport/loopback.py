@@ -0,0 +1,203 @@
+"""In-Process Loopback Transport"""
+
+from collections import deque
+from itertools import count
+from threading import Lock
+from typing import Any, Deque, Dict, List, Literal, Tuple
+
+from IronicMTA.core.packet_ids import PacketPriority, PacketReliability, PacketID
+from IronicMTA.core.packet_handler.pump import RawPacket
+from IronicMTA.core.transport.base import Transport, BandwidthStatistics
+from IronicMTA.errors import NetworkWrapperError
+
+# (packet id, packet data, reliability, priority)
+LoopbackPacket = Tuple[int, bytes, PacketReliability, PacketPriority]
+
+
+class LoopbackClient(object):
+    """Simulated client connected to a `LoopbackTransport`
+
+    Args:
+    -----
+        transport (LoopbackTransport): Server transport
+        binaddr (int): Client player binary address
+        address (Tuple[str, int]): Client address (Ip, Port)
+    """
+
+    def __init__(
+        self, transport: "LoopbackTransport", binaddr: int, address: Tuple[str, int]
+    ) -> None:
+        self._transport = transport
+        self._binaddr = binaddr
+        self._address = address
+        self._inbox: Deque[LoopbackPacket] = deque()
+        self._bitstream_version = 0
+        self._isconnected = True
+
+    def get_binary_address(self) -> int:
+        return self._binaddr
+
+    def get_address(self) -> Tuple[str, int]:
+        return self._address
+
+    def get_bitstream_version(self) -> int:
+        return self._bitstream_version
+
+    def is_connected(self) -> bool:
+        return self._isconnected
+
+    def send(self, packet_id: PacketID | int, data: bytes = b"") -> int:
+        """Send a packet to the server
+
+        Returns:
+        --------
+            int: Packet index
+        """
+        _id = packet_id.value if isinstance(packet_id, PacketID) else packet_id
+        return self._transport.inject(_id, self._binaddr, data)
+
+    def receive(self) -> List[LoopbackPacket]:
+        """Pop the packets sent by the server to this client (oldest first)"""
+        _packets = []
+        _inbox = self._inbox
+        while _inbox:
+            _packets.append(_inbox.popleft())
+        return _packets
+
+    def disconnect(self) -> Literal[True]:
+        self._transport.disconnect(self._binaddr)
+        return True
+
+
+class LoopbackTransport(Transport):
+    """Pure python in-memory transport
+
+    No socket nor dll, packets sent by `LoopbackClient`s are queued in
+    memory and received by the packet pump, packets sent by the server
+    land in the client inboxes. Used to profile and load test the
+    server on any platform.
+
+    >>> _client = server.get_network().connect()
+    >>> _client.send(PacketID.PACKET_ID_PLAYER_JOIN)
+
+    Args:
+    -----
+        server (Server): IronicMTA Server
+    """
+
+    def __init__(self, server) -> None:
+        super().__init__(server)
+        self._clients: Dict[int, LoopbackClient] = {}
+        self._inbound: Deque[RawPacket] = deque()
+        self._indexes = count()
+        self._binaddrs = count(1)
+        self._lock = Lock()
+        self._initialized = False
+        self._isrunning = False
+        self._stats = BandwidthStatistics()
+
+    def init(self) -> bool:
+        self._initialized = True
+        return True
+
+    def start(self) -> Literal[True]:
+        self._isrunning = True
+        return True
+
+    def stop(self) -> Literal[True]:
+        self._isrunning = False
+        return True
+
+    def destroy(self) -> Literal[True]:
+        super().destroy()
+        for _binaddr in list(self._clients):
+            self.disconnect(_binaddr)
+        return True
+
+    def connect(self, address: Tuple[str, int] | None = None) -> LoopbackClient:
+        """Connect a simulated client
+
+        Args:
+        -----
+            address (Tuple[str, int], optional): Client address. Defaults to ("127.0.0.1", binary address).
+
+        Returns:
+        --------
+            LoopbackClient: Connected client
+        """
+        _binaddr = next(self._binaddrs)
+        _client = LoopbackClient(self, _binaddr, address or ("127.0.0.1", _binaddr))
+        self._clients[_binaddr] = _client
+        return _client
+
+    def disconnect(self, player_binaddr: int) -> bool:
+        """Disconnect a simulated client"""
+        _client = self._clients.pop(player_binaddr, None)
+        if _client is None:
+            return False
+        _client._isconnected = False
+        return True
+
+    def get_clients(self) -> List[LoopbackClient]:
+        return list(self._clients.values())
+
+    def inject(self, packet_id: int, player_binaddr: int, data: Any) -> int:
+        """Queue a received packet (as if sent by `player_binaddr`)
+
+        Returns:
+        --------
+            int: Packet index
+        """
+        with self._lock:
+            _index = next(self._indexes)
+            self._inbound.append((packet_id, player_binaddr, _index, data))
+        self._stats.llIncomingUDPPacketCount += 1
+        self._stats.llIncomingUDPByteCount += len(data)
+        return _index
+
+    def get_pending_count(self) -> int:
+        """Get number of received packets not pumped yet"""
+        return len(self._inbound)
+
+    def receive_batch(self, max_packets: int, last_index: int) -> List[RawPacket]:
+        _packets: List[RawPacket] = []
+        _inbound = self._inbound
+        while _inbound and len(_packets) < max_packets:
+            _packets.append(_inbound.popleft())
+        return _packets
+
+    def send(
+        self,
+        player_binaddr: int,
+        packet_id: PacketID,
+        bitstream_version: int,
+        data: bytes,
+        reliability: PacketReliability = PacketReliability.RELIABLE,
+        priority: PacketPriority = PacketPriority.HIGH,
+    ) -> Literal[True]:
+        _client = self._clients.get(player_binaddr)
+        if _client is not None:
+            _client._inbox.append((packet_id.value, data, reliability, priority))
+        self._stats.llOutgoingUDPPacketCount += 1
+        self._stats.llOutgoingUDPByteCount += len(data)
+        return True
+
+    def get_bandwidth_statistics(self) -> BandwidthStatistics:
+        return self._stats
+
+    def get_player_address(self, player_binaddr: int) -> Tuple[str, int]:
+        _client = self._clients.get(player_binaddr)
+        if _client is None:
+            raise NetworkWrapperError("Invalid Player Binary Address")
+        return _client.get_address()
+
+    def is_valid_socket(self, player_binaddr: int) -> bool:
+        return player_binaddr in self._clients
+
+    def set_client_bitstream_version(
+        self, client_binaddr: int, version: int
+    ) -> Literal[True]:
+        _client = self._clients.get(client_binaddr)
+        if _client is not None:
+            _client._bitstream_version = version
+        return True
@@ -4,7 +4,7 @@
 import os
 import sys
 from platform import architecture
-from typing import Literal, Any, Tuple, Union
+from typing import Iterable, Literal, Any, Dict, List, Tuple, Union
 from ctypes import (
     cdll,
     PyDLL,
@@ -13,14 +13,11 @@ from ctypes import (
     c_ushort,
     c_short,
     c_int,
-    c_float,
     c_uint,
     c_ulong,
     c_bool,
     c_longlong,
-    windll,
     Structure,
-    WinError,
     POINTER,
     c_ubyte,
 )
@@ -29,11 +26,23 @@ import colorama
 
 from IronicMTA.core.packet_ids import PacketPriority, PacketReliability, PacketID
 from IronicMTA.errors import NetworkWrapperInitError, NetworkWrapperError
-from IronicMTA.core.packet_handler import PacketHandler
+from IronicMTA.core.packet_handler.pump import RawPacket
+from IronicMTA.core.transport.base import (
+    Transport,
+    BandwidthStatistics,
+    ThreadCPUTimes,
+    OutgoingPacket,
+)
 from IronicMTA.common import BuildType
 
 
-kernel32 = windll.kernel32
+try:
+    from ctypes import windll, WinError
+
+    kernel32 = windll.kernel32
+except ImportError:  # Not on Windows, the dll backend can't be loaded
+    windll = None
+    kernel32 = None
 
 colorama.init(autoreset=True)
 
@@ -42,36 +51,6 @@ def _log_err(err: str) -> None:
     print(f"{colorama.Fore.RED}[Net-Wrapper ERROR] {err}.")
 
 
-class ThreadCPUTimes(Structure):
-    """Server Thread statistics"""
-
-    _fields_ = [
-        ("uiProcessorNumber", c_uint),
-        ("fUserPercent", c_float),
-        ("fKernelPercent", c_float),
-        ("fTotalCPUPercent", c_float),
-        ("fUserPercentAvg", c_float),
-        ("fKernelPercentAvg", c_float),
-        ("fTotalCPUPercentAvg", c_float),
-    ]
-
-
-class BandwidthStatistics(Structure):
-    """Server Network Bandwidth statistics"""
-
-    _fields_ = [
-        ("llOutgoingUDPByteCount", c_longlong),
-        ("llIncomingUDPByteCount", c_longlong),
-        ("llIncomingUDPByteCountBlocked", c_longlong),
-        ("llOutgoingUDPPacketCount", c_longlong),
-        ("llIncomingUDPPacketCount", c_longlong),
-        ("llIncomingUDPPacketCountBlocked", c_longlong),
-        ("llOutgoingUDPByteResentCount", c_longlong),
-        ("llOutgoingUDPMessageResentCount", c_longlong),
-        ("threadCPUTimes", ThreadCPUTimes),
-    ]
-
-
 class SPacketStat(Structure):
     """Client Packets Stats"""
 
@@ -86,9 +65,39 @@ class PlayerAddress(Structure):
 
 MTA_DM_SERVER_NET_MODULE_VERSION = 0x0AB
 
-
-class NetworkWrapper(object):
-    """MTA:SA net.dll wrapper
+# Wrapper dll functions (argtypes, restype), bound once at init()
+WRAPPER_FUNCTIONS: Dict[str, Tuple[List[Any], Any]] = {
+    "Setup": (
+        [c_char_p, c_char_p, c_char_p, c_ushort, c_uint, c_char_p, POINTER(c_ulong)],
+        c_short,
+    ),
+    "Destroy": ([c_ushort], c_int),
+    "Start": ([c_ushort], c_int),
+    "Stop": ([c_ushort], c_int),
+    "GetLastPackets": ([c_ushort], py_object),
+    "Send": (
+        [c_ushort, c_ulong, c_uint, c_ushort, c_char_p, c_ulong, c_ubyte, c_ubyte],
+        c_int,
+    ),
+    "IsValidSocket": ([c_ushort, c_ulong], c_bool),
+    "SetClientBitStreamVersion": ([c_ushort, c_ulong, c_ushort], c_int),
+    "GetPlayerAddress": ([c_ushort, c_ulong], PlayerAddress),
+    "GetClientData": ([c_ushort, c_ulong, c_char_p, c_char_p, c_char_p], c_int),
+    "SetAntiCheatChecks": (
+        [c_ushort, c_char_p, c_char_p, c_char_p, c_int, c_bool, c_char_p],
+        c_int,
+    ),
+    "GetModPackets": ([c_ushort, c_ulong], c_int),
+    "GetAntiCheatInfo": ([c_ushort, c_ulong], c_int),
+    "GetNetRoute": ([c_ushort], c_char_p),
+    "GetBandwidthStatistics": ([c_ushort], BandwidthStatistics),
+    "GetPacketStat": ([c_ushort], SPacketStat),
+    "GetPingStatus": ([c_ushort], c_char_p),
+}
+
+
+class NetworkWrapper(Transport):
+    """MTA:SA net.dll wrapper (ctypes transport)
 
     Args:
     -----
@@ -96,11 +105,16 @@ class NetworkWrapper(object):
     """
 
     def __init__(self, server) -> None:
+        super().__init__(server)
         self._ip, self._port = server.get_address()
-        self._server = server
 
         self.__id = c_ushort(0)
 
+        if windll is None:
+            raise NetworkWrapperInitError(
+                "The net.dll transport is only available on Windows"
+            )
+
         if server.get_build_type() != BuildType.RELEASE:
             _log_err("IronicMTA Server does not support network debug dlls")
             sys.exit()
@@ -116,6 +130,7 @@ class NetworkWrapper(object):
         )
 
         self._initialized = False
+        self._calls: Dict[str, Any] = {}
 
         try:
             self._netlib = cdll.LoadLibrary(self.netpath)
@@ -151,59 +166,48 @@ class NetworkWrapper(object):
         --------
             bool: True If the server has been started successfuly
         """
-        if self._wrapperdll.Setup:
-            _func = self._wrapperdll.Setup
-            _func.restype = c_short
-            _func.argtypes = [
-                c_char_p,
-                c_char_p,
-                c_char_p,
-                c_ushort,
-                c_uint,
-                c_char_p,
-                POINTER(c_ulong),
-            ]
-
-            _result = _func(
-                c_char_p(self._b(self._server.get_file_id_path())),
-                c_char_p(self._b(self.netpath)),
-                c_char_p(bytes(self._ip, encoding="utf-8")),
-                c_ushort(self._port),
-                c_uint(self._server.get_player_count() + 1),
-                c_char_p(self._b(self._server.get_name())),
-                c_ulong(self._server.get_build_type().value),
-            )
+        self._bind_functions()
+        _result = self._calls["Setup"](
+            self._b(self._server.get_file_id_path()),
+            self._b(self.netpath),
+            self._b(self._ip),
+            self._port,
+            self._server.get_player_count() + 1,
+            self._b(self._server.get_name()),
+            c_ulong(self._server.get_build_type().value),
+        )
 
-            if _result < 0:
-                _log_err(f"Unable to init network wrapper. ({_result})")
-                return False
-            self._initialized = True
-            self.__id = c_ushort(_result)
-            return True
-        return False
+        if _result < 0:
+            _log_err(f"Unable to init network wrapper. ({_result})")
+            return False
+        self._initialized = True
+        self.__id = c_ushort(_result)
+        return True
+
+    def receive_batch(self, max_packets: int, last_index: int) -> List[RawPacket]:
+        """Drain the received packets (oldest first)
 
-    def start_listening(self) -> Literal[True]:
-        """Start Server packet listening
+        Polls the wrapper until it returns an already seen packet index
+        or `max_packets` new packets were received.
+
+        Args:
+        -----
+            max_packets (int): Max number of packets to return
+            last_index (int): Index of the last received packet
 
         Returns:
         --------
-            Literal[True]: True if all succeded
+            List[RawPacket]: (packet id, player, packet index, packet content) list
         """
-        _packet_handler = PacketHandler(self._server)
-
-        _func = self._wrapperdll.GetLastPackets
-        _func.argtypes = [c_ushort]
-        _func.restype = py_object
-        if _func:
-            while True:
-                _packet = _func(self.__id)
-                _packet_handler.onrecive(
-                    packet=_packet[0],
-                    player=_packet[1],
-                    packet_index=_packet[2],
-                    packet_content=_packet[3],
-                )
-        return True
+        _func = self._calls["GetLastPackets"]
+        _packets: List[RawPacket] = []
+        while len(_packets) < max_packets:
+            _packet = _func(self.__id)
+            if _packet[2] == last_index:
+                break
+            last_index = _packet[2]
+            _packets.append(_packet)
+        return _packets
 
     def destroy(self) -> Literal[True]:
         """Destroy network
@@ -212,7 +216,9 @@ class NetworkWrapper(object):
         --------
             Literal[True]: True if network has been destroyed successfuly
         """
-        self._wrapperdll.Destroy(self.__id)
+        super().destroy()
+        if self._calls:
+            self._calls["Destroy"](self.__id)
         return True
 
     def start(self) -> Literal[True]:
@@ -230,13 +236,14 @@ class NetworkWrapper(object):
             raise NetworkWrapperInitError(
                 "Network wrapper is not initialized. try to init()"
             )
+        if self._pump is not None:  # Restarted wrapper counts packets from 0 again
+            self._pump.reset()
 
-        if self._wrapperdll.Start:
-            try:
-                self._wrapperdll.Start(self.__id)
-            except Exception:
-                _log_err("Coudldn't Start Net Wrapper")
-                _log_err(WinError(kernel32.GetLastError()).strerror)
+        try:
+            self._calls["Start"](self.__id)
+        except Exception:
+            _log_err("Coudldn't Start Net Wrapper")
+            _log_err(WinError(kernel32.GetLastError()).strerror)
         return True
 
     def stop(self) -> Literal[True]:
@@ -246,7 +253,7 @@ class NetworkWrapper(object):
         --------
             Literal[True]: True if network has benn stoped successfuly
         """
-        self._wrapperdll.Stop(self.__id)
+        self._calls["Stop"](self.__id)
         return True
 
     def send(
@@ -274,29 +281,98 @@ class NetworkWrapper(object):
         --------
             Literal[True]: if packet has been sent successfuly (without errors)
         """
-        _func = self._wrapperdll.Send
-        _func.argtypes = [
-            c_ushort,
-            c_ulong,
-            c_uint,
-            c_ushort,
-            c_char_p,
-            c_ulong,
-            c_ubyte,
-            c_ubyte,
-        ]
-        _func(
+        self._calls["Send"](
             self.__id,
-            c_ulong(player_binaddr),
-            c_uint(packet_id.value),
-            c_ushort(bitstream_version),
+            player_binaddr,
+            packet_id.value,
+            bitstream_version,
             data,
-            c_ulong(len(data)),
-            c_ubyte(priority.value),
-            c_ubyte(reliability.value),
+            len(data),
+            priority.value,
+            reliability.value,
         )
         return True
 
+    def broadcast(
+        self,
+        player_binaddrs: Iterable[int],
+        packet_id: PacketID,
+        bitstream_version: int,
+        data: bytes,
+        reliability: PacketReliability = PacketReliability.RELIABLE,
+        priority: PacketPriority = PacketPriority.HIGH,
+    ) -> int:
+        """Send the same packet data to many clients
+
+        Args:
+        -----
+            player_binaddrs (Iterable[int]): Clients Player Binary Addresses
+            packet_id (int): Packet ID
+            bitstream_version (int): BitStream Version
+            data (bytes): Sequence of bytes represents the data to send (built once)
+            reliability (PacketReliability, optional): Packet reliability.
+            Defaults to PacketReliability.RELIABLE.
+            priority (PacketPriority, optional): Packet Priority. Defaults to PacketPriority.HIGH.
+
+        Returns:
+        --------
+            int: Number of clients the packet has been sent to
+        """
+        return self.send_many(
+            (_binaddr, packet_id, bitstream_version, data, reliability, priority)
+            for _binaddr in player_binaddrs
+        )
+
+    def send_many(self, packets: Iterable[OutgoingPacket]) -> int:
+        """Send many packets (one prebound `Send` call per packet, the
+        wrapper dll has no batched send export)
+
+        Args:
+        -----
+            packets (Iterable[OutgoingPacket]): (player binary address, packet id,
+                bitstream version, data, reliability, priority) records
+
+        Returns:
+        --------
+            int: Number of sent packets
+        """
+        _id = self.__id
+        _send = self._calls["Send"]
+        _count = 0
+        for (
+            _binaddr,
+            _packet_id,
+            _bitstream_version,
+            _data,
+            _reliability,
+            _priority,
+        ) in packets:
+            _send(
+                _id,
+                _binaddr,
+                _packet_id.value,
+                _bitstream_version,
+                _data,
+                len(_data),
+                _priority.value,
+                _reliability.value,
+            )
+            _count += 1
+        return _count
+
+    def _bind_functions(self) -> None:
+        # Set the ctypes signatures once instead of on every call
+        for _name, (_argtypes, _restype) in WRAPPER_FUNCTIONS.items():
+            try:
+                _func = getattr(self._wrapperdll, _name)
+            except AttributeError:
+                raise NetworkWrapperInitError(
+                    f"Wrapper dll function not found ({_name})"
+                )
+            _func.argtypes = _argtypes
+            _func.restype = _restype
+            self._calls[_name] = _func
+
     def is_valid_socket(self, player_binaddr: int) -> bool:
         """Check if socket is valid
 
@@ -308,10 +384,7 @@ class NetworkWrapper(object):
         --------
             bool: True if is valid socket else False
         """
-        _func = self._wrapperdll.IsValidSocket
-        _func.argtypes = [c_ushort, c_ulong]
-        _func.restype = c_bool
-        return bool(_func(self.__id, c_ulong(player_binaddr)))  # Convert c_bool to bool
+        return self._calls["IsValidSocket"](self.__id, player_binaddr)
 
     def set_client_bitstream_version(
         self, client_binaddr: int, version: int
@@ -327,7 +400,7 @@ class NetworkWrapper(object):
         --------
             Literal[True]: Set client bitstream version
         """
-        self._wrapperdll.SetClientBitStreamVersion(self.__id, client_binaddr, version)
+        self._calls["SetClientBitStreamVersion"](self.__id, client_binaddr, version)
         return True
 
     def get_player_address(self, player_binaddr: int) -> Tuple[str, int]:
@@ -345,13 +418,10 @@ class NetworkWrapper(object):
         --------
             Tuple[str, int]: Tuple of Client Player address (IP, Port)
         """
-        _func = self._wrapperdll.GetPlayerAddress
-        _func.argtypes = [c_ushort, c_ulong]
-        _func.restype = PlayerAddress
-        _address = _func(self.__id, c_ulong(player_binaddr))
+        _address = self._calls["GetPlayerAddress"](self.__id, player_binaddr)
         if _address.usPort == 0:
             raise NetworkWrapperError("Invalid Player Binary Address")
-        return _address.strIP, _address.usPort
+        return _address.szIP.decode(), _address.usPort
 
     def get_client_data(
         self, player_binaddr: int, serial: str, extra: str, version: str
@@ -369,12 +439,12 @@ class NetworkWrapper(object):
         --------
             Any
         """
-        return self._wrapperdll.GetClientData(
+        return self._calls["GetClientData"](
             self.__id,
-            c_ulong(player_binaddr),
-            c_char_p(self._b(serial)),
-            c_char_p(self._b(extra)),
-            c_char_p(self._b(version)),
+            player_binaddr,
+            self._b(serial),
+            self._b(extra),
+            self._b(version),
         )
 
     def set_anticheat_checks(
@@ -401,14 +471,14 @@ class NetworkWrapper(object):
         --------
             Literal[True]: True if anticheat settings applied successfuly
         """
-        self._wrapperdll.SetAntiCheatChecks(
+        self._calls["SetAntiCheatChecks"](
             self.__id,
-            c_char_p(self._b(disable_combo_ac_map)),
-            c_char_p(self._b(disable_ac_map)),
-            c_char_p(self._b(enable_sd_map)),
-            c_int(enable_client_checks),
-            c_bool(hide_ac),
-            c_char_p(self._b(img_mods)),
+            self._b(disable_combo_ac_map),
+            self._b(disable_ac_map),
+            self._b(enable_sd_map),
+            enable_client_checks,
+            hide_ac,
+            self._b(img_mods),
         )
         return True
 
@@ -423,7 +493,7 @@ class NetworkWrapper(object):
         --------
             Literal[True]: True if mod packets has been resent
         """
-        self._wrapperdll.GetModPackets(self.__id, c_ulong(player_binaddr))
+        self._calls["GetModPackets"](self.__id, player_binaddr)
         return True
 
     def resend_anticheat_info(self, player_binaddr: int) -> Literal[True]:
@@ -437,7 +507,7 @@ class NetworkWrapper(object):
         --------
             Literal[True]: All succeded
         """
-        self._wrapperdll.GetAntiCheatInfo(self.__id, c_ulong(player_binaddr))
+        self._calls["GetAntiCheatInfo"](self.__id, player_binaddr)
         return True
 
     def get_net_route(self) -> Union[bytes, Literal[False]]:
@@ -447,12 +517,8 @@ class NetworkWrapper(object):
         --------
             bytes: Network route
         """
-        _func = self._wrapperdll.GetNetRoute
         if self._server.is_running():
-            if _func:
-                _func.argtypes = [c_ushort]
-                _func.restype = c_char_p
-                return _func(self.__id)
+            return self._calls["GetNetRoute"](self.__id)
         return False
 
     def get_bandwidth_statistics(self) -> Literal[False] | BandwidthStatistics:
@@ -462,12 +528,8 @@ class NetworkWrapper(object):
         --------
             BandwidthStatistics: Bandwidth statistics
         """
-        _func = self._wrapperdll.GetBandwidthStatistics
-        if _func:
-            if self._server.is_running():
-                _func.argtypes = [c_ushort]
-                _func.restype = BandwidthStatistics
-                return _func(self.__id)
+        if self._server.is_running():
+            return self._calls["GetBandwidthStatistics"](self.__id)
         return False
 
     def get_packets_stats(self) -> Union[bool, SPacketStat]:
@@ -477,12 +539,8 @@ class NetworkWrapper(object):
         --------
             SPacketStat: Packets stats
         """
-        _func = self._wrapperdll.GetPacketStat
-        if _func:
-            if self._server.is_running():
-                _func.argtypes = [c_ushort]
-                _func.restype = SPacketStat
-                return _func(self.__id)
+        if self._server.is_running():
+            return self._calls["GetPacketStat"](self.__id)
         return False
 
     def get_ping_status(self) -> Union[bool, bytes]:
@@ -492,12 +550,8 @@ class NetworkWrapper(object):
         --------
             bytes: Ping status
         """
-        _func = self._wrapperdll.GetPingStatus
-        if _func:
-            if self._server.is_running():
-                _func.argtypes = [c_ushort]
-                _func.restype = c_char_p
-                return _func(self.__id)
+        if self._server.is_running():
+            return self._calls["GetPingStatus"](self.__id)
         return False
 
     def _b(self, __str: str = "", encoding: str = "utf-8") -> bytes:
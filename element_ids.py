@@ -0,0 +1,190 @@
+"""
+    Element IDs allocator and lookup table
+"""
+
+from array import array
+from collections import deque
+from threading import Lock
+from typing import Any, Deque, List, Optional
+
+from .errors import ElementIDError, ElementIDLimitReached
+
+# MTA element limit (element IDs are written on 17 bits)
+MAX_ELEMENT_IDS = 1 << 17
+
+
+class ElementID(object):
+    """Element ID (`value` goes on the wire, `generation` tells recycled IDs apart)
+
+    Args:
+    -----
+        value (int): ID (0 - 131071)
+        generation (int, optional): Times the ID was recycled when it was handed out
+    """
+
+    __slots__ = ("value", "generation")
+
+    def __init__(self, value: int, generation: int = 0) -> None:
+        self.value = value
+        self.generation = generation
+
+    def getID(self) -> int:
+        return self.value
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __index__(self) -> int:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"ElementID({self.value}, {self.generation})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ElementID):
+            return NotImplemented
+        return self.value == other.value and self.generation == other.generation
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.generation))
+
+
+class ElementIDAllocator(object):
+    """Hands out element IDs and maps them back to their element
+
+    Elements are kept in a flat list indexed by ID, so resolving an ID
+    (ex: read from a packet) is a single index. Released IDs go to the
+    back of a free list (reused as late as possible) and their generation
+    is bumped, so an `ElementID` kept after its element was destroyed
+    doesn't resolve to the element that reuses the ID.
+
+    >>> _id = element_ids.allocate(myobj)
+    >>> element_ids.get(_id) is myobj
+    True
+
+    Args:
+    -----
+        limit (int, optional): Max IDs (MTA element limit by default)
+    """
+
+    def __init__(self, limit: int = MAX_ELEMENT_IDS) -> None:
+        self._limit = limit
+        self._elements: List[Any] = [None] * limit
+        self._generations = array("L", [0]) * limit
+        self._free: Deque[int] = deque()
+        self._next = 0  # IDs never handed out start here
+        self._count = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_limit(self) -> int:
+        return self._limit
+
+    def get_free_count(self) -> int:
+        return self._limit - self._count
+
+    def allocate(self, element: Any) -> ElementID:
+        """Hand out a free ID to an element
+
+        Raises:
+        -------
+            ElementIDLimitReached: All the IDs are in use
+
+        Returns:
+        --------
+            ElementID: Element ID
+        """
+        with self._lock:
+            if self._free:
+                _value = self._free.popleft()
+            elif self._next < self._limit:
+                _value = self._next
+                self._next += 1
+            else:
+                raise ElementIDLimitReached(
+                    f"All the {self._limit} element IDs are in use"
+                )
+            return self._bind(_value, element)
+
+    def reserve(self, value: int | ElementID, element: Any) -> ElementID:
+        """Give a specific ID to an element (ex: root element, IDs set by hand)
+
+        Raises:
+        -------
+            ElementIDError: The ID is out of range or in use
+
+        Returns:
+        --------
+            ElementID: Element ID (current generation of the ID)
+        """
+        _value = int(value)
+        with self._lock:
+            if not 0 <= _value < self._limit:
+                raise ElementIDError(f"Element ID {_value} is out of range")
+            if self._elements[_value] is not None:
+                raise ElementIDError(f"Element ID {_value} is already in use")
+            if _value >= self._next:
+                self._free.extend(range(self._next, _value))
+                self._next = _value + 1
+            else:
+                self._free.remove(_value)
+            return self._bind(_value, element)
+
+    def release(self, element_id: ElementID) -> bool:
+        """Free an element ID (its generation is bumped)
+
+        Returns:
+        --------
+            bool: False if the ID is stale or not in use
+        """
+        with self._lock:
+            if not self.is_valid(element_id):
+                return False
+            _value = element_id.value
+            self._elements[_value] = None
+            self._generations[_value] = (self._generations[_value] + 1) & 0xFFFFFFFF
+            self._free.append(_value)
+            self._count -= 1
+            return True
+
+    def get(self, element_id: ElementID) -> Optional[Any]:
+        """Get the element of an ID (None if the ID is stale or free)"""
+        _value = element_id.value
+        if (
+            0 <= _value < self._limit
+            and self._generations[_value] == element_id.generation
+        ):
+            return self._elements[_value]
+        return None
+
+    def get_by_value(self, value: int) -> Optional[Any]:
+        """Get the element of a raw ID (ex: `BitStream.read_elementid`)"""
+        if 0 <= value < self._limit:
+            return self._elements[value]
+        return None
+
+    def get_id(self, value: int) -> Optional[ElementID]:
+        """Get the current `ElementID` of a raw ID (None if free)"""
+        if 0 <= value < self._limit and self._elements[value] is not None:
+            return ElementID(value, self._generations[value])
+        return None
+
+    def is_valid(self, element_id: ElementID) -> bool:
+        """Check if an ID is in use and not stale"""
+        _value = element_id.value
+        return (
+            0 <= _value < self._limit
+            and self._elements[_value] is not None
+            and self._generations[_value] == element_id.generation
+        )
+
+    def _bind(self, value: int, element: Any) -> ElementID:
+        self._elements[value] = element
+        self._count += 1
+        return ElementID(value, self._generations[value])
+
+
+# Default allocator, world elements IDs come from it
+element_ids = ElementIDAllocator()
@@ -0,0 +1,277 @@
+"""
+    Struct of arrays element state store
+"""
+
+from threading import Lock
+from typing import Any, List, Optional
+
+import numpy as np
+
+from .errors import ElementStateError
+from .vectors import Vector3
+
+# Default preallocated slots (grows by doubling)
+ELEMENT_STORE_DEFAULT_CAPACITY = 1024
+
+# Columns value ranges (MTA limits)
+MAX_DIMENSION = 65535
+MAX_INTERIOR = 255
+MAX_ALPHA = 255
+
+# Element state record (`ElementStore.snapshot`)
+ELEMENT_STATE_DTYPE = np.dtype(
+    [
+        ("slot", np.uint32),
+        ("position", np.float64, (3,)),
+        ("rotation", np.float64, (3,)),
+        ("dimension", np.uint16),
+        ("interior", np.uint8),
+        ("alpha", np.uint8),
+        ("frozen", np.bool_),
+    ]
+)
+
+
+class ElementStore(object):
+    """World elements state in contiguous NumPy columns
+
+    Each element owns a slot (row) of the position, rotation, dimension,
+    interior, alpha and frozen columns (`ObjBase` accessors read and write
+    its row), so bulk operations (distances, radius checks, snapshots)
+    run on whole columns instead of element by element. Writes hold the
+    lock, since growing replaces the columns (a write to the old column
+    would be lost).
+
+    >>> _distances = element_store.get_distances(Vector3(0, 0, 3))
+    >>> _elements = element_store.query_radius(Vector3(0, 0, 3), 50.0, dimension=0)
+
+    Args:
+    -----
+        capacity (int, optional): Preallocated slots
+    """
+
+    def __init__(self, capacity: int = ELEMENT_STORE_DEFAULT_CAPACITY) -> None:
+        capacity = max(capacity, 1)
+        self.positions = np.zeros((capacity, 3), dtype=np.float64)
+        self.rotations = np.zeros((capacity, 3), dtype=np.float64)
+        self.dimensions = np.zeros(capacity, dtype=np.uint16)
+        self.interiors = np.zeros(capacity, dtype=np.uint8)
+        self.alphas = np.zeros(capacity, dtype=np.uint8)
+        self.frozen = np.zeros(capacity, dtype=np.bool_)
+        self.alive = np.zeros(capacity, dtype=np.bool_)
+        self._elements: List[Any] = [None] * capacity
+        self._free: List[int] = []
+        self._used = 0  # Slots high water mark
+        self._count = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_capacity(self) -> int:
+        return len(self.alive)
+
+    def allocate(
+        self,
+        element: Any,
+        position: Vector3,
+        rotation: Vector3,
+        dimension: int = 0,
+        interior: int = 0,
+        alpha: int = 255,
+        frozen: bool = False,
+    ) -> int:
+        """Allocate a slot to an element and write its state
+
+        Raises:
+        -------
+            ElementStateError: Dimension, interior or alpha out of range
+
+        Returns:
+        --------
+            int: Element slot
+        """
+        _check_range("dimension", dimension, MAX_DIMENSION)
+        _check_range("interior", interior, MAX_INTERIOR)
+        _check_range("alpha", alpha, MAX_ALPHA)
+        with self._lock:
+            if self._free:
+                _slot = self._free.pop()
+            else:
+                if self._used == len(self.alive):
+                    self._grow(self._used * 2)
+                _slot = self._used
+                self._used += 1
+            self._elements[_slot] = element
+            self.alive[_slot] = True
+            self._count += 1
+            self.positions[_slot] = position.x, position.y, position.z
+            self.rotations[_slot] = rotation.x, rotation.y, rotation.z
+            self.dimensions[_slot] = dimension
+            self.interiors[_slot] = interior
+            self.alphas[_slot] = alpha
+            self.frozen[_slot] = frozen
+        return _slot
+
+    def release(self, slot: int, element: Any) -> bool:
+        """Free an element slot (reused by the next allocation)
+
+        Args:
+        -----
+            slot (int): Element slot
+            element (Any): Element owning the slot
+
+        Returns:
+        --------
+            bool: False if the slot isn't allocated to `element`
+        """
+        with self._lock:
+            if not self.alive[slot] or self._elements[slot] is not element:
+                return False
+            self.alive[slot] = False
+            self._elements[slot] = None
+            self._free.append(slot)
+            self._count -= 1
+            return True
+
+    def get_element(self, slot: int) -> Any:
+        return self._elements[slot]
+
+    def get_position(self, slot: int) -> Vector3:
+        _x, _y, _z = self.positions[slot].tolist()
+        return Vector3(_x, _y, _z)
+
+    def set_position(self, slot: int, position: Vector3) -> None:
+        with self._lock:
+            self.positions[slot] = position.x, position.y, position.z
+
+    def get_rotation(self, slot: int) -> Vector3:
+        _x, _y, _z = self.rotations[slot].tolist()
+        return Vector3(_x, _y, _z)
+
+    def set_rotation(self, slot: int, rotation: Vector3) -> None:
+        with self._lock:
+            self.rotations[slot] = rotation.x, rotation.y, rotation.z
+
+    def set_dimension(self, slot: int, dimension: int) -> None:
+        _check_range("dimension", dimension, MAX_DIMENSION)
+        with self._lock:
+            self.dimensions[slot] = dimension
+
+    def set_interior(self, slot: int, interior: int) -> None:
+        _check_range("interior", interior, MAX_INTERIOR)
+        with self._lock:
+            self.interiors[slot] = interior
+
+    def set_alpha(self, slot: int, alpha: int) -> None:
+        _check_range("alpha", alpha, MAX_ALPHA)
+        with self._lock:
+            self.alphas[slot] = alpha
+
+    def set_frozen(self, slot: int, frozen: bool) -> None:
+        with self._lock:
+            self.frozen[slot] = frozen
+
+    def get_slots(self) -> np.ndarray:
+        """Get the allocated slots"""
+        return np.flatnonzero(self.alive[: self._used])
+
+    def get_distances(
+        self, position: Vector3, slots: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Get the distances between `position` and elements (all by default)
+
+        Args:
+        -----
+            position (Vector3): Position
+            slots (np.ndarray, optional): Elements slots. Defaults to all the allocated slots.
+
+        Returns:
+        --------
+            np.ndarray: Distances (same order as `slots`)
+        """
+        if slots is None:
+            slots = self.get_slots()
+        _deltas = self.positions[slots] - (position.x, position.y, position.z)
+        return np.sqrt(np.einsum("ij,ij->i", _deltas, _deltas))
+
+    def query_radius(
+        self,
+        position: Vector3,
+        radius: float,
+        dimension: Optional[int] = None,
+        interior: Optional[int] = None,
+    ) -> List[Any]:
+        """Get the elements within `radius` of `position` (vectorized scan)
+
+        Args:
+        -----
+            position (Vector3): Center
+            radius (float): Radius (world units)
+            dimension (int, optional): Only this dimension. Defaults to any.
+            interior (int, optional): Only this interior. Defaults to any.
+
+        Returns:
+        --------
+            List[Any]: Elements (slot order)
+        """
+        _used = self._used
+        _mask = self.alive[:_used].copy()
+        if dimension is not None:
+            _mask &= self.dimensions[:_used] == dimension
+        if interior is not None:
+            _mask &= self.interiors[:_used] == interior
+        _slots = np.flatnonzero(_mask)
+        _slots = _slots[self.get_distances(position, _slots) <= radius]
+        _elements = self._elements
+        return [_elements[_slot] for _slot in _slots.tolist()]
+
+    def snapshot(self, slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """Copy elements state (ex: sync snapshot, map saving)
+
+        Args:
+        -----
+            slots (np.ndarray, optional): Elements slots. Defaults to all the allocated slots.
+
+        Returns:
+        --------
+            np.ndarray: Structured array of `ELEMENT_STATE_DTYPE`
+        """
+        if slots is None:
+            slots = self.get_slots()
+        _snapshot = np.empty(len(slots), dtype=ELEMENT_STATE_DTYPE)
+        _snapshot["slot"] = slots
+        _snapshot["position"] = self.positions[slots]
+        _snapshot["rotation"] = self.rotations[slots]
+        _snapshot["dimension"] = self.dimensions[slots]
+        _snapshot["interior"] = self.interiors[slots]
+        _snapshot["alpha"] = self.alphas[slots]
+        _snapshot["frozen"] = self.frozen[slots]
+        return _snapshot
+
+    def _grow(self, capacity: int) -> None:
+        # Called with the lock held
+        for _name in (
+            "positions",
+            "rotations",
+            "dimensions",
+            "interiors",
+            "alphas",
+            "frozen",
+            "alive",
+        ):
+            _column = getattr(self, _name)
+            _grown = np.zeros((capacity,) + _column.shape[1:], dtype=_column.dtype)
+            _grown[: len(_column)] = _column
+            setattr(self, _name, _grown)
+        self._elements.extend([None] * (capacity - len(self._elements)))
+
+
+def _check_range(name: str, value: int | float, maximum: int) -> int | float:
+    if not 0 <= value <= maximum:
+        raise ElementStateError(f"{name} must be between 0 and {maximum} (got {value})")
+    return value
+
+
+# Default store, world elements state lives in it
+element_store = ElementStore()
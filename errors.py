@@ -62,3 +62,21 @@ class BitStreamError(Exception):
 
 class EventHandlerError(Exception):
     ...
+
+class PacketHandlerError(Exception):
+    ...
+
+class ElementIDError(Exception):
+    ...
+
+class ElementIDLimitReached(Exception):
+    ...
+
+class ElementDestroyedError(Exception):
+    ...
+
+class ElementStateError(Exception):
+    ...
+
+class HTTPBadRequest(Exception):
+    ...
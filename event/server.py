@@ -14,6 +14,7 @@ class ServerEventHandler(EventHandlerBase):
             "onServerSettingsLoad": [],
             "onReceivePacket": [],
             "onResourceLoad": [],
+            "onResourceStop": [],
         }
 
     def onServerInitalize(self, _func):
@@ -80,7 +81,7 @@ class ServerEventHandler(EventHandlerBase):
             arg_1 (Server): Server Instance
             arg_2 (PacketID): Packet Id
             arg_3 (int): Player Binary Address
-            arg_4 (bytes): Packet Content
+            arg_4 (memoryview): Packet Content (read only view, copy it to keep it)
         """
         self._global_events["onReceivePacket"].append(_func)
 
@@ -101,3 +102,11 @@ class ServerEventHandler(EventHandlerBase):
             arg_1 (Resource): Resource Instance
         """
         self._global_events["onResourceLoad"].append(_func)
+
+    def onResourceStop(self, _func):
+        """onResourceStop (its packet handlers are already unregistered)
+
+        Args:
+            arg_1 (Resource): Resource Instance
+        """
+        self._global_events["onResourceStop"].append(_func)
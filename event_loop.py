@@ -0,0 +1,223 @@
+"""
+    Server event loop (asyncio mode)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Literal, Optional, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+ADDRESS = Tuple[str, int]
+
+
+class DatagramResponder(asyncio.DatagramProtocol):
+    """UDP query protocol (answer each datagram with `respond(data)`)
+
+    Args:
+    -----
+        respond (Callable[[bytes], bytes | None]): Response builder (None = no answer)
+    """
+
+    def __init__(self, respond: Callable[[bytes], Optional[bytes]]) -> None:
+        self._respond = respond
+        self._transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore
+
+    def datagram_received(self, data: bytes, addr: ADDRESS) -> None:
+        _response = self._respond(data)
+        if _response and self._transport is not None:
+            self._transport.sendto(_response, addr)
+
+
+class Timer(object):
+    """Event loop timer
+
+    Args:
+    -----
+        event_loop (ServerEventLoop): Timer event loop
+        callback (Callable[..., Any]): Timer function
+        interval (float): Interval between calls (seconds)
+        times (int): Times to execute (0 = until killed)
+    """
+
+    def __init__(
+        self,
+        event_loop: "ServerEventLoop",
+        callback: Callable[..., Any],
+        interval: float,
+        times: int,
+        *args: Any,
+    ) -> None:
+        self._loop = event_loop.get_loop()
+        self._callback = callback
+        self._interval = interval
+        self._times = times
+        self._args = args
+        self._executed = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._killed = False
+
+    def get_interval(self) -> float:
+        return self._interval
+
+    def get_remaining_times(self) -> int:
+        """Get remaining executions (-1 if the timer runs until killed)"""
+        if self._times == 0:
+            return -1
+        return self._times - self._executed
+
+    def is_active(self) -> bool:
+        return not self._killed
+
+    def kill(self) -> Literal[True]:
+        """Stop the timer (thread safe)"""
+        self._killed = True
+        self._loop.call_soon_threadsafe(self._cancel)
+        return True
+
+    def _schedule(self) -> None:
+        if not self._killed:
+            self._handle = self._loop.call_later(self._interval, self._run)
+
+    def _cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+
+    def _run(self) -> None:
+        self._executed += 1
+        if self._times != 0 and self._executed >= self._times:
+            self._killed = True
+        self._callback(*self._args)
+        self._schedule()
+
+
+class ServerEventLoop(object):
+    """Single event loop running the server services (asyncio mode)
+
+    The packet pump, UDP query sockets, HTTP server and timers run as
+    tasks of one asyncio loop; blocking work (master server announce,
+    file reads, ...) goes through `run_blocking()`, which bounds the
+    number of pending executor jobs (`executor_max_pending` network setting).
+
+    Args:
+    -----
+        server (Server): IronicMTA Server
+    """
+
+    def __init__(self, server) -> None:
+        self._server = server
+        self._logger = server.get_logger()
+        _settings = server.get_settings()["network"]
+        self._loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=_settings["executor_workers"],
+            thread_name_prefix="IronicMTA Executor",
+        )
+        self._max_pending = _settings["executor_max_pending"]
+        self._pending: asyncio.Semaphore | None = None
+        self._main_task: asyncio.Task | None = None
+        self._thread_id: int | None = None
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get asyncio event loop"""
+        return self._loop
+
+    def is_running(self) -> bool:
+        return self._loop.is_running()
+
+    def spawn(self, coroutine: Awaitable[_T]) -> "asyncio.Future[_T]":
+        """Run a coroutine as a loop task (can be called before `run()` or from any thread)
+
+        Returns:
+        --------
+            Future: Task (or concurrent future if called from another thread)
+        """
+        if self._loop.is_running() and threading.get_ident() != self._thread_id:
+            return asyncio.run_coroutine_threadsafe(coroutine, self._loop)  # type: ignore
+        return self._loop.create_task(self._log_errors(coroutine))
+
+    async def run_blocking(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking function in the executor
+
+        Waits while `executor_max_pending` jobs are already pending.
+        """
+        if self._pending is None:
+            self._pending = asyncio.Semaphore(self._max_pending)
+        async with self._pending:
+            return await self._loop.run_in_executor(self._executor, func, *args)
+
+    def set_timer(
+        self, callback: Callable[..., Any], interval: float, times: int = 1, *args: Any
+    ) -> Timer:
+        """Call `callback(*args)` every `interval` seconds (thread safe)
+
+        Args:
+        -----
+            callback (Callable[..., Any]): Timer function
+            interval (float): Interval between calls (seconds)
+            times (int, optional): Times to execute (0 = until killed). Defaults to 1.
+
+        Returns:
+        --------
+            Timer: Timer object (`kill()` to stop it)
+        """
+        _timer = Timer(self, callback, interval, times, *args)
+        self._loop.call_soon_threadsafe(_timer._schedule)
+        return _timer
+
+    async def serve_datagram(
+        self, sock: Any, respond: Callable[[bytes], Optional[bytes]]
+    ) -> asyncio.DatagramTransport:
+        """Serve a bound UDP socket with a `DatagramResponder`"""
+        _transport, _ = await self._loop.create_datagram_endpoint(
+            lambda: DatagramResponder(respond), sock=sock
+        )
+        return _transport
+
+    def run(self, main: Awaitable[Any]) -> Literal[True]:
+        """Run the loop until `main` completes or `stop()` is called
+
+        Args:
+        -----
+            main (Awaitable): Main coroutine (ex: packet pump)
+
+        Returns:
+        --------
+            Literal[True]: True when the loop has been closed
+        """
+        asyncio.set_event_loop(self._loop)
+        self._thread_id = threading.get_ident()
+        self._main_task = self._loop.create_task(main)  # type: ignore
+        try:
+            self._loop.run_until_complete(self._main_task)
+        except asyncio.CancelledError:
+            ...
+        finally:
+            _tasks = asyncio.all_tasks(self._loop)
+            for _task in _tasks:
+                _task.cancel()
+            self._loop.run_until_complete(
+                asyncio.gather(*_tasks, return_exceptions=True)
+            )
+            self._executor.shutdown(wait=False)
+            self._loop.close()
+        return True
+
+    def stop(self) -> Literal[True]:
+        """Stop the loop (thread safe)"""
+        if self._main_task is not None:
+            self._loop.call_soon_threadsafe(self._main_task.cancel)
+        return True
+
+    async def _log_errors(self, coroutine: Awaitable[_T]) -> _T | None:
+        try:
+            return await coroutine
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self._logger.error(f"Event loop task failed: {err!r}")
+            return None
@@ -2,11 +2,20 @@
     HTTP Server Core
 """
 
+import asyncio
+import json
 import socket
 from threading import Thread
-from typing import Tuple, Literal
+from typing import Callable, Dict, Tuple, Literal
+from urllib.parse import parse_qsl, urlsplit
+
+from IronicMTA.errors import HTTPBadRequest
 
 ADDRESS = Tuple[str, int]
+# route(query parameters) -> response message
+RouteHandler = Callable[[Dict[str, str]], str]
+
+NETWORK_STATS_PATH = "/network/stats"
 
 
 class HTTPServer(socket.socket):
@@ -25,7 +34,14 @@ class HTTPServer(socket.socket):
         self.bind(("127.0.0.1", self._server.get_http_port()))
         self._resources = []
         self._http_client_files = []
+        self._event_loop = None
+        self._routes: Dict[str, Tuple[RouteHandler, str]] = {}
         self._server.event.onResourceLoad(self.on_resourceload)
+        _network_settings = self._settings["network"]
+        if _network_settings["stats_http"] and _network_settings["stats_interval"] > 0:
+            self.add_route(
+                NETWORK_STATS_PATH, self._get_network_stats, "application/json"
+            )
 
     def _parse_request(self, request):
         return request.split("\r\n")[0].split(" ")
@@ -39,19 +55,52 @@ class HTTPServer(socket.socket):
         except Exception:
             return False
 
+        _response = self._get_message(request)
+        if _response is None:
+            return False
+        return self.send_response(connection, *_response)
+
+    def _get_message(self, request: str) -> Tuple[str, int, str, str] | None:
         method, path, protocol = self._parse_request(request)
-        path = path.replace("/", "\\")[1:]
         if not self._is_valid_request(protocol):
-            return False
+            return None
+
+        _url = urlsplit(path)
+        _route = self._routes.get(_url.path)
+        if _route is not None:
+            _handler, _content_type = _route
+            try:
+                return _handler(dict(parse_qsl(_url.query))), 200, "OK", _content_type
+            except HTTPBadRequest as err:
+                return str(err), 400, "Bad Request", "text"
+            except Exception as err:
+                self._logger.error(f"HTTP route error ({_url.path}: {err!r})")
+                return "", 500, "Internal Server Error", "text"
 
+        path = path.replace("/", "\\")[1:]
         if path != "favicon.ico":  # for browsers
             for _client_file in self._http_client_files:
                 if _client_file[0] == path:
-                    return self.send_response(connection, _client_file[1].get_buffer())
+                    return _client_file[1].get_buffer(), 200, "OK", "text"
 
             self._logger.debug(
                 f"Invalid url path for resource to download resource ({path})."
             )
+        return None
+
+    async def _handle_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = (await reader.read(1024)).decode()
+            _response = await self._event_loop.run_blocking(self._get_message, request)
+            if _response is not None:
+                writer.write(self._build_response(*_response))
+                await writer.drain()
+        except Exception:
+            ...
+        finally:
+            writer.close()
 
     def _request_handler(self):
         while True:
@@ -59,6 +108,37 @@ class HTTPServer(socket.socket):
             thread = Thread(target=self._handle_request, args=(_conn, _addr))
             thread.start()
 
+    def add_route(
+        self, path: str, handler: RouteHandler, content_type: str = "text"
+    ) -> Literal[True]:
+        """Serve a dynamic response on `path` (handlers raise `HTTPBadRequest` on invalid queries)
+
+        Args:
+            path (str): Url path (ex: "/network/stats")
+            handler (RouteHandler): handler(query parameters) -> response message
+            content_type (str, optional): Response content type. Defaults to "text".
+
+        Returns:
+            Literal[True]: if all succded
+        """
+        self._routes[path] = (handler, content_type)
+        return True
+
+    def remove_route(self, path: str) -> bool:
+        return self._routes.pop(path, None) is not None
+
+    def _get_network_stats(self, query: Dict[str, str]) -> str:
+        # ?samples=N limits the series to the last N samples
+        _samples = None
+        if "samples" in query:
+            try:
+                _samples = int(query["samples"])
+            except ValueError:
+                _samples = -1
+            if _samples < 0:
+                raise HTTPBadRequest("samples must be a non-negative integer")
+        return json.dumps(self._server.get_stats_sampler().as_dict(_samples))
+
     def on_resourceload(self, resource):
         for _client_file in resource.get_client_files():
             self._http_client_files.append(
@@ -78,6 +158,16 @@ class HTTPServer(socket.socket):
         _request_handler_thread.start()
         return True
 
+    async def serve(self, event_loop) -> None:
+        """Serve HTTP requests on the server event loop (asyncio mode)
+
+        Args:
+            event_loop (ServerEventLoop): Server event loop
+        """
+        self._event_loop = event_loop
+        self.listen(self._settings["http_server"]["max_http_connections"])
+        await asyncio.start_server(self._handle_stream, sock=self)
+
     def send_response(
         self,
         connection: socket.socket,
@@ -98,10 +188,21 @@ class HTTPServer(socket.socket):
         Returns:
             Literal[True]: if all succded
         """
+        connection.send(
+            self._build_response(message, status_code, status_message, content_type)
+        )
+        connection.close()
+        return True
+
+    def _build_response(
+        self,
+        message: str,
+        status_code: int = 200,
+        status_message: str = "OK",
+        content_type: str = "text",
+    ) -> bytes:
         response = (
             f"HTTP/1.1 {status_code} {status_message}\nContent-Type:{content_type}\n\n"
             + message
         )
-        connection.send(response.encode())
-        connection.close()
-        return True
+        return response.encode()
@@ -0,0 +1,450 @@
+"""
+    Load generator
+
+    Spins up simulated MTA clients against a server running the loopback
+    transport, performs the join handshake then streams puresync and chat
+    packets, and reports throughput, tick overruns and handler latency
+    percentiles per packet id. The send scheduler and the puresync relay
+    run during the test, packet ids without any handler are reported as
+    dispatch overhead only.
+
+    python -m IronicMTA.loadgen settings.json --clients 200 --duration 30
+"""
+
+import argparse
+import os
+import time
+from math import cos, sin
+from threading import Thread
+from types import SimpleNamespace
+from typing import Any, Dict, List, Literal, Set
+
+from IronicMTA.common import BITSTREAM_VERSION
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.client_manager import Client
+from IronicMTA.core.transport.loopback import LoopbackClient, LoopbackTransport
+from IronicMTA.errors import NetworkWrapperError
+from IronicMTA.network.packets import Packet_PlayerJoinData
+from IronicMTA.player_manager import Player
+from IronicMTA.server import Server
+from IronicMTA.network.sync_decoder import (
+    PURESYNC_FLAG_ON_GROUND,
+    PURESYNC_FLAG_SYNCING_VELOCITY,
+    write_puresync,
+)
+from IronicMTA.vectors import Vector3
+
+PERCENTILES = (("p50", 0.5), ("p99", 0.99), ("p999", 0.999))
+
+
+class SimulatedClient(object):
+    """Simulated MTA client
+
+    Args:
+    -----
+        client (LoopbackClient): Loopback connection
+        index (int): Client index (used for its nickname and path)
+    """
+
+    def __init__(self, client: LoopbackClient, index: int) -> None:
+        self._client = client
+        self._index = index
+        self._bitstream = BitStream()
+        self._joined = False
+        self._puresync_credit = 0.0
+        self._chat_credit = 0.0
+        self._time_context = 0
+        self.sent = 0
+
+    def is_joined(self) -> bool:
+        return self._joined
+
+    def join(self) -> None:
+        """Start the join handshake"""
+        self._send(PacketID.PACKET_ID_PLAYER_JOIN, b"")
+
+    def update(
+        self, now: float, dt: float, puresync_rate: float, chat_rate: float
+    ) -> None:
+        """Handle the server packets and stream the tick packets"""
+        for _packet_id, _, _, _ in self._client.receive():
+            if _packet_id == PacketID.PACKET_ID_MOD_NAME.value and not self._joined:
+                self._send_join_data()
+                self._joined = True
+        if not self._joined:
+            return
+
+        self._puresync_credit += puresync_rate * dt
+        while self._puresync_credit >= 1.0:
+            self._puresync_credit -= 1.0
+            self._send_puresync(now)
+        self._chat_credit += chat_rate * dt
+        while self._chat_credit >= 1.0:
+            self._chat_credit -= 1.0
+            self._send(
+                PacketID.PACKET_ID_COMMAND, f"say hello from {self._index}".encode()
+            )
+
+    def _send(self, packet_id: PacketID, data: bytes) -> None:
+        self._client.send(packet_id, data)
+        self.sent += 1
+
+    def _send_join_data(self) -> None:
+        _bitstream = self._bitstream
+        _bitstream.reset()
+        Packet_PlayerJoinData.schema.encode(
+            _bitstream,
+            SimpleNamespace(
+                net_version=0x0AB,
+                mta_version=0x0106,
+                bitstream_version=BITSTREAM_VERSION,
+                player_version="1.6.0-9.22204.0",
+                optional_update=False,
+                game_version=0,
+                nickname=f"loadgen_{self._index}",
+                password=bytes(16),
+                serial=f"{self._index:032X}",
+            ),
+        )
+        self._send(PacketID.PACKET_ID_PLAYER_JOINDATA, _bitstream.get_bytes())
+
+    def _send_puresync(self, now: float) -> None:
+        _angle = now + self._index
+        _bitstream = self._bitstream
+        _bitstream.reset()
+        self._time_context = (self._time_context + 1) & 0xFF
+        write_puresync(
+            _bitstream,
+            self._time_context,
+            0,
+            PURESYNC_FLAG_ON_GROUND | PURESYNC_FLAG_SYNCING_VELOCITY,
+            Vector3(100.0 * cos(_angle), 100.0 * sin(_angle), 10.0),
+            0.0,
+            Vector3(-sin(_angle), cos(_angle), 0.0),
+            100.0,
+            0.0,
+        )
+        self._send(PacketID.PACKET_ID_PLAYER_PURESYNC, _bitstream.get_bytes())
+
+
+class LoadReport(object):
+    """Load test results"""
+
+    def __init__(
+        self,
+        clients: int,
+        duration: float,
+        sent: int,
+        handled: int,
+        ticks: int,
+        tick_overruns: int,
+        latencies: Dict[int, List[int]],
+        dispatch_only: Set[int],
+        services: Dict[str, Dict[str, int]],
+    ) -> None:
+        self.clients = clients
+        self.duration = duration
+        self.sent = sent
+        self.handled = handled
+        self.ticks = ticks
+        self.tick_overruns = tick_overruns
+        # Packets without handler (the latency is the registry lookup only)
+        self.dispatch_only = {_get_packet_name(_id) for _id in dispatch_only}
+        # Counters of the network services running during the test
+        self.services = services
+        self.latency: Dict[str, Dict[str, float]] = {}
+        for _packet_id, _samples in sorted(latencies.items()):
+            _samples.sort()
+            _stats = {"count": float(len(_samples))}
+            for _name, _percentile in PERCENTILES:
+                _index = min(int(len(_samples) * _percentile), len(_samples) - 1)
+                _stats[_name] = _samples[_index] / 1e6
+            _stats["max"] = _samples[-1] / 1e6
+            self.latency[_get_packet_name(_packet_id)] = _stats
+
+    @property
+    def throughput(self) -> float:
+        """Handled packets per second"""
+        return self.handled / self.duration if self.duration else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "clients": self.clients,
+            "duration": self.duration,
+            "sent": self.sent,
+            "handled": self.handled,
+            "throughput": self.throughput,
+            "ticks": self.ticks,
+            "tick_overruns": self.tick_overruns,
+            "latency_ms": self.latency,
+            "dispatch_only": sorted(self.dispatch_only),
+            "services": self.services,
+        }
+
+    def __str__(self) -> str:
+        _lines = [
+            f"clients: {self.clients}  duration: {self.duration:.2f}s",
+            f"sent: {self.sent}  handled: {self.handled}  throughput: {self.throughput:.0f} packets/s",
+            f"ticks: {self.ticks}  tick overruns: {self.tick_overruns}",
+            f"{'packet':<40}{'count':>10}{'p50 ms':>10}{'p99 ms':>10}{'p999 ms':>10}{'max ms':>10}",
+        ]
+        for _name, _stats in self.latency.items():
+            _line = (
+                f"{_name:<40}{int(_stats['count']):>10}{_stats['p50']:>10.3f}"
+                f"{_stats['p99']:>10.3f}{_stats['p999']:>10.3f}{_stats['max']:>10.3f}"
+            )
+            if _name in self.dispatch_only:
+                _line += "  (no handler, dispatch overhead only)"
+            _lines.append(_line)
+        for _service, _counters in self.services.items():
+            _lines.append(
+                f"{_service}: "
+                + "  ".join(f"{_key}: {_value}" for _key, _value in _counters.items())
+            )
+        return "\n".join(_lines)
+
+
+class LoadGenerator(object):
+    """Simulated clients load generator
+
+    Args:
+    -----
+        server (Server): IronicMTA Server (`transport` network setting must be "loopback")
+        clients (int, optional): Number of simulated clients
+        puresync_rate (float, optional): Puresync packets per second per client
+        chat_rate (float, optional): Chat messages per second per client
+        tick (float, optional): Clients tick interval (seconds)
+        duration (float, optional): Test duration (seconds)
+        scheduler (bool, optional): Run the send scheduler during the test
+        relay (bool, optional): Run the puresync relay during the test
+
+    Raises:
+    -------
+        NetworkWrapperError: If the server doesn't use the loopback transport
+    """
+
+    def __init__(
+        self,
+        server,
+        clients: int = 32,
+        puresync_rate: float = 20.0,
+        chat_rate: float = 0.2,
+        tick: float = 0.05,
+        duration: float = 10.0,
+        scheduler: bool = True,
+        relay: bool = True,
+    ) -> None:
+        self._server = server
+        self._network = server.get_network()
+        if not isinstance(self._network, LoopbackTransport):
+            raise NetworkWrapperError(
+                'Load generator needs the "loopback" network transport'
+            )
+        self._clients_count = clients
+        self._puresync_rate = puresync_rate
+        self._chat_rate = chat_rate
+        self._tick = tick
+        self._duration = duration
+        self._scheduler = scheduler
+        self._relay = relay
+        self._latencies: Dict[int, List[int]] = {}
+        self._dispatch_only: Set[int] = set()
+        self._players: List[Player] = []
+
+    def run(self) -> LoadReport:
+        """Run the load test
+
+        Returns:
+        --------
+            LoadReport: Throughput, tick overruns and handler latencies
+        """
+        _network: LoopbackTransport = self._network
+        _registry = self._server.packets
+        _dispatch = _registry.dispatch
+        _registry.dispatch = self._timed(_dispatch)
+
+        _network.init()
+        _network.start()
+        _started = self._start_services()
+        _listener = Thread(
+            target=_network.start_listening, name="Load Generator Listener", daemon=True
+        )
+        _listener.start()
+        while _network.get_pump() is None:
+            time.sleep(0.001)
+
+        _clients = [
+            SimulatedClient(_network.connect(), _index)
+            for _index in range(self._clients_count)
+        ]
+        for _client in _clients:
+            _client.join()
+
+        _ticks = 0
+        _overruns = 0
+        _start = _last = time.perf_counter()
+        _next_tick = _start + self._tick
+        try:
+            while _last - _start < self._duration:
+                _now = time.perf_counter()
+                for _client in _clients:
+                    _client.update(
+                        _now, _now - _last, self._puresync_rate, self._chat_rate
+                    )
+                _last = _now
+                _ticks += 1
+                _delay = _next_tick - time.perf_counter()
+                if _delay > 0:
+                    time.sleep(_delay)
+                else:
+                    _overruns += 1
+                    if _delay < -self._tick:  # Don't try to catch up the late ticks
+                        _next_tick -= _delay
+                _next_tick += self._tick
+            self._wait_idle()
+            _duration = time.perf_counter() - _start
+        finally:
+            self._stop_services(_started)
+            _network.destroy()
+            _listener.join()
+            _registry.dispatch = _dispatch
+
+        return LoadReport(
+            self._clients_count,
+            _duration,
+            sum(_client.sent for _client in _clients),
+            sum(len(_samples) for _samples in self._latencies.values()),
+            _ticks,
+            _overruns,
+            self._latencies,
+            self._dispatch_only,
+            {
+                "scheduler": self._server.get_send_scheduler().get_stats(),
+                "relay": self._server.get_interest_manager().get_stats(),
+            },
+        )
+
+    def _start_services(self) -> List[Any]:
+        """Register the join handler and start the network services under test
+
+        The join handler stands for the server join flow: it decodes the
+        join data and adds a player, so relayed puresyncs have a sender.
+
+        Returns:
+        --------
+            List[Any]: Services started by the load generator (stopped after the test)
+        """
+        self._server.packets.register(
+            PacketID.PACKET_ID_PLAYER_JOINDATA, self._on_join_data, owner=self
+        )
+        _started: List[Any] = []
+        _scheduler = self._server.get_send_scheduler()
+        if (
+            self._scheduler
+            and not _scheduler.is_running()
+            and _scheduler.get_tick() > 0
+        ):
+            _scheduler.start()
+            _started.append(_scheduler)
+        _relay = self._server.get_interest_manager()
+        if self._relay and not _relay.is_running():
+            _relay.start()
+            _started.append(_relay)
+        return _started
+
+    def _stop_services(self, started: List[Any]) -> None:
+        for _service in started:
+            _service.stop()
+        self._server.packets.unregister_owner(self)
+        _players = self._server.get_all_players()
+        for _player in self._players:
+            _player.destroy()
+            if _player in _players:
+                _players.remove(_player)
+        self._players.clear()
+
+    def _on_join_data(self, packet_id: int, player: int, payload: Any) -> bool:
+        _join_data = Packet_PlayerJoinData(payload)
+        _player = Player(
+            None,
+            _join_data.nickname,
+            Vector3(0.0, 0.0, 0.0),
+            Vector3(0.0, 0.0, 0.0),
+            Client(player, _join_data.bitstream_version, self._server),
+            None,
+            interior=0,
+        )
+        self._players.append(_player)
+        self._server.get_all_players().append(_player)
+        return True
+
+    def _wait_idle(self, timeout: float = 10.0) -> None:
+        _handler = self._network.get_packet_handler()
+        _deadline = time.perf_counter() + timeout
+        while time.perf_counter() < _deadline:
+            if self._network.get_pending_count() == 0 and not any(
+                _handler.get_worker_queue_depths()
+            ):
+                return
+            time.sleep(0.005)
+
+    def _timed(self, dispatch):
+        _latencies = self._latencies
+
+        _is_handled = self._server.packets.is_handled
+        _dispatch_only = self._dispatch_only
+
+        def _timed_dispatch(packet_id: int, player: int, payload: Any) -> bool:
+            if not _is_handled(packet_id):
+                _dispatch_only.add(packet_id)
+            _start = time.perf_counter_ns()
+            try:
+                return dispatch(packet_id, player, payload)
+            finally:
+                _samples = _latencies.get(packet_id)
+                if _samples is None:
+                    _samples = _latencies[packet_id] = []
+                _samples.append(time.perf_counter_ns() - _start)
+
+        return _timed_dispatch
+
+
+def _get_packet_name(packet_id: int) -> str:
+    try:
+        return PacketID(packet_id).name
+    except ValueError:
+        return str(packet_id)
+
+
+def main() -> Literal[0]:
+    _parser = argparse.ArgumentParser(
+        prog="python -m IronicMTA.loadgen", description=__doc__.strip().splitlines()[0]
+    )
+    _parser.add_argument("settings", help="Server settings file (loopback transport)")
+    _parser.add_argument("--clients", type=int, default=32)
+    _parser.add_argument("--duration", type=float, default=10.0)
+    _parser.add_argument("--puresync-rate", type=float, default=20.0)
+    _parser.add_argument("--chat-rate", type=float, default=0.2)
+    _parser.add_argument("--tick", type=float, default=0.05)
+    _parser.add_argument("--no-scheduler", action="store_true")
+    _parser.add_argument("--no-relay", action="store_true")
+    _args = _parser.parse_args()
+
+    _server = Server(_args.settings, os.path.basename(_args.settings))
+    _report = LoadGenerator(
+        _server,
+        clients=_args.clients,
+        puresync_rate=_args.puresync_rate,
+        chat_rate=_args.chat_rate,
+        tick=_args.tick,
+        duration=_args.duration,
+        scheduler=not _args.no_scheduler,
+        relay=not _args.no_relay,
+    ).run()
+    print(_report)
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Per Player Bandwidth Budgets"""
+
+import time
+from typing import Dict, Literal, Optional
+
+from IronicMTA.core.packet_ids import PacketPriority, PacketReliability
+
+# Budget decisions
+SEND = 0
+DEFER = 1
+DROP = 2
+
+# Reliabilities the client can live without (dropped instead of deferred)
+DROPPABLE_RELIABILITIES = frozenset(
+    (
+        PacketReliability.UNRELIABLE,
+        PacketReliability.UNRELIABLE_SEQUENCED,
+        PacketReliability.RELIABLE_SEQUENCED_CAN_DROP_PACKETS,
+    )
+)
+
+
+class TokenBucket(object):
+    """Bytes token bucket
+
+    A packet passes while the bucket has tokens left, so packets bigger
+    than the burst still go through (the bucket goes in debt).
+
+    Args:
+    -----
+        rate (float): Refill rate (bytes per second)
+        burst (float): Bucket size (bytes)
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.perf_counter()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def consume(self, size: int, force: bool = False) -> bool:
+        """Take `size` tokens (always taken if `force`)
+
+        Returns:
+        --------
+            bool: True if the tokens have been taken
+        """
+        if self.tokens > 0 or force:
+            self.tokens -= size
+            return True
+        return False
+
+
+class PlayerSendStats(object):
+    """Outbound counters of a player"""
+
+    __slots__ = (
+        "sent_packets",
+        "sent_bytes",
+        "dropped_packets",
+        "dropped_bytes",
+        "deferred_packets",
+    )
+
+    def __init__(self) -> None:
+        self.sent_packets = 0
+        self.sent_bytes = 0
+        self.dropped_packets = 0
+        self.dropped_bytes = 0
+        self.deferred_packets = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {_name: getattr(self, _name) for _name in self.__slots__}
+
+
+class BandwidthBudget(object):
+    """Per player outbound bandwidth budgets
+
+    Each player has a token bucket (default `rate` bytes per second and
+    `burst` bytes). When a player is over budget, unreliable packets are
+    dropped and reliable medium/low priority packets are deferred to the
+    next tick, high priority packets are always sent.
+
+    Args:
+    -----
+        rate (int, optional): Default player rate (bytes per second, 0 = unlimited)
+        burst (int, optional): Default player burst (bytes, 0 = one second of `rate`)
+    """
+
+    def __init__(self, rate: int = 0, burst: int = 0) -> None:
+        self._rate = rate
+        self._burst = burst or rate
+        self._buckets: Dict[int, Optional[TokenBucket]] = {}
+        self._stats: Dict[int, PlayerSendStats] = {}
+
+    def set_player_rate(self, binaddr: int, rate: int, burst: int = 0) -> Literal[True]:
+        """Set the budget of a player
+
+        Args:
+        -----
+            binaddr (int): Player binary address
+            rate (int): Rate (bytes per second, 0 = unlimited)
+            burst (int, optional): Burst (bytes, 0 = one second of `rate`)
+        """
+        self._buckets[binaddr] = TokenBucket(rate, burst or rate) if rate > 0 else None
+        return True
+
+    def get_player_rate(self, binaddr: int) -> int:
+        """Get the rate of a player (bytes per second, 0 = unlimited)"""
+        _bucket = self._get_bucket(binaddr)
+        return 0 if _bucket is None else int(_bucket.rate)
+
+    def get_player_stats(self, binaddr: int) -> PlayerSendStats:
+        """Get send/drop counters of a player"""
+        _stats = self._stats.get(binaddr)
+        if _stats is None:
+            _stats = self._stats[binaddr] = PlayerSendStats()
+        return _stats
+
+    def get_all_stats(self) -> Dict[int, Dict[str, int]]:
+        """Get send/drop counters of all the players (by binary address)"""
+        return {_binaddr: _stats.as_dict() for _binaddr, _stats in self._stats.items()}
+
+    def remove_player(self, binaddr: int) -> Literal[True]:
+        """Forget a player budget and counters (ex: on disconnect)"""
+        self._buckets.pop(binaddr, None)
+        self._stats.pop(binaddr, None)
+        return True
+
+    def refill(self, binaddr: int, now: float) -> None:
+        """Refill a player bucket (once per flush)"""
+        _bucket = self._get_bucket(binaddr)
+        if _bucket is not None:
+            _bucket.refill(now)
+
+    def decide(
+        self,
+        binaddr: int,
+        priority: PacketPriority,
+        reliability: PacketReliability,
+        size: int,
+        blocked: bool = False,
+    ) -> int:
+        """Decide if a packet is sent, deferred or dropped and count it
+
+        Args:
+        -----
+            binaddr (int): Player binary address
+            priority (PacketPriority): Packet priority
+            reliability (PacketReliability): Packet reliability
+            size (int): Packet size (bytes)
+            blocked (bool, optional): A previous packet of the same priority has been
+                                      deferred (sending this one would reorder them)
+
+        Returns:
+        --------
+            int: SEND, DEFER or DROP
+        """
+        _stats = self.get_player_stats(binaddr)
+        _bucket = self._get_bucket(binaddr)
+        if not blocked and (
+            _bucket is None
+            or _bucket.consume(size, force=priority is PacketPriority.HIGH)
+        ):
+            _stats.sent_packets += 1
+            _stats.sent_bytes += size
+            return SEND
+        if reliability in DROPPABLE_RELIABILITIES:
+            _stats.dropped_packets += 1
+            _stats.dropped_bytes += size
+            return DROP
+        _stats.deferred_packets += 1
+        return DEFER
+
+    def _get_bucket(self, binaddr: int) -> Optional[TokenBucket]:
+        if binaddr not in self._buckets:
+            self._buckets[binaddr] = (
+                TokenBucket(self._rate, self._burst) if self._rate > 0 else None
+            )
+        return self._buckets[binaddr]
@@ -0,0 +1,440 @@
+"""Puresync Relay Interest Management"""
+
+import time
+from math import inf
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple
+
+from IronicMTA.common import BITSTREAM_VERSION
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_handler.payload import retain_payload
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
+from IronicMTA.core.transport.base import OutgoingPacket
+from IronicMTA.element_ids import ElementID, element_ids
+from IronicMTA.network.packet_cache import PrebuiltPacket
+from IronicMTA.network.sync_decoder import SyncBatchDecoder
+from IronicMTA.spatial import SpatialIndex
+from IronicMTA.vectors import Vector3
+
+# encode(sender binary address, puresync payload) -> relayed packet data (None = not relayed)
+PuresyncEncodeFunc = Callable[[int, bytes], Optional[bytes]]
+
+
+class PuresyncRelayEncoder(object):
+    """Default relayed puresync encoder
+
+    Turns a client puresync payload into the server -> client layout:
+    the sender player element ID, the time context and the latency
+    (compressed, 0 as the transport doesn't report pings) are written
+    before the rest of the client payload. Syncs of binary addresses
+    without a player (not joined yet) aren't relayed.
+
+    Args:
+    -----
+        server (Server): IronicMTA Server (players are looked up in `get_all_players`)
+    """
+
+    def __init__(self, server) -> None:
+        self._server = server
+        self._bitstream = BitStream()
+        self._element_ids: Dict[int, ElementID] = {}
+
+    def __call__(self, sender: int, payload: bytes) -> Optional[bytes]:
+        _element_id = self.get_element_id(sender)
+        if _element_id is None or not payload:
+            return None
+        _bitstream = self._bitstream
+        _bitstream.reset()
+        _bitstream.write_elementid(_element_id)
+        _bitstream.write_byte(payload[0])  # Time context
+        _bitstream.write_compressed(0, 2)  # Latency
+        _bitstream.write_bytes(payload[1:])
+        return _bitstream.get_bytes()
+
+    def get_element_id(self, sender: int) -> Optional[ElementID]:
+        """Get the element ID of the player behind a binary address"""
+        _element_id = self._element_ids.get(sender)
+        if _element_id is not None and element_ids.is_valid(_element_id):
+            return _element_id
+        self._element_ids.pop(sender, None)
+        for _player in self._server.get_all_players():
+            if _player.getClient().get_binary_address() == sender:
+                _element_id = self._element_ids[sender] = _player.getID()
+                return _element_id
+        return None
+
+    def forget(self, sender: int) -> None:
+        self._element_ids.pop(sender, None)
+
+
+class InterestPlayer(object):
+    """Relay state of a syncing player"""
+
+    __slots__ = (
+        "binaddr",
+        "dimension",
+        "interior",
+        "position",
+        "anchor",
+        "near",
+        "pending",
+        "last_sync",
+        "last_far_tick",
+    )
+
+    def __init__(self, binaddr: int) -> None:
+        self.binaddr = binaddr
+        self.dimension = 0
+        self.interior = 0
+        self.position = Vector3(0.0, 0.0, 0.0)
+        # Position (and location) of the last neighbors update, None = outdated
+        self.anchor: Optional[Tuple[float, float, float, int, int]] = None
+        self.near: Set[int] = set()
+        self.pending: Optional[bytes] = None
+        self.last_sync = 0.0
+        # Tick of the last relay to the far players
+        self.last_far_tick = 0
+
+
+class InterestManager(object):
+    """Puresync relay with interest management
+
+    Every tick, the puresyncs received since the last tick are decoded in
+    one batch (`SyncBatchDecoder`), and the latest sync of each player is
+    relayed to the players within `stream_distance` in the same dimension
+    and interior. The other players of the dimension and interior get the
+    first sync pending `far_sync_rate` ticks after the last one they got
+    (senders are spread over the ticks).
+
+    Neighbor sets are kept between ticks: only the players that moved
+    more than `update_distance` (or changed dimension/interior) query the
+    spatial grid again, and their neighbors' sets are patched with the
+    difference.
+
+    Args:
+    -----
+        server (Server): IronicMTA Server
+        stream_distance (float, optional): Full rate relay distance (world units)
+        far_sync_rate (int, optional): Far players get 1 sync every `far_sync_rate` ticks (0 = never)
+        tick (float, optional): Relay tick interval (seconds)
+        update_distance (float, optional): Movement that triggers a neighbors update
+        timeout (float, optional): Players not syncing for that long are forgotten (seconds)
+        encode (PuresyncEncodeFunc, optional): Relayed packet encoder. Defaults to `PuresyncRelayEncoder`.
+    """
+
+    def __init__(
+        self,
+        server,
+        stream_distance: float = 300.0,
+        far_sync_rate: int = 5,
+        tick: float = 0.05,
+        update_distance: float = 5.0,
+        timeout: float = 10.0,
+        encode: Optional[PuresyncEncodeFunc] = None,
+    ) -> None:
+        self._server = server
+        self._logger = server.get_logger()
+        self._stream_distance = stream_distance
+        self._far_sync_rate = far_sync_rate
+        self._tick = tick
+        self._update_distance2 = update_distance * update_distance
+        self._timeout = timeout
+        self._encode = PuresyncRelayEncoder(server) if encode is None else encode
+        # Radius queries overlap at most 3x3 cells
+        self._index = SpatialIndex(max(stream_distance, 1.0))
+        self._decoder = SyncBatchDecoder()
+        self._players: Dict[int, InterestPlayer] = {}
+        self._received: Dict[int, bytes] = {}
+        self._lock = Lock()
+        self._ticks = 0
+        self._isrunning = False
+        self._timer = None
+        self._stats = {
+            "ticks": 0,
+            "relayed_near": 0,
+            "relayed_far": 0,
+            "neighbor_updates": 0,
+            "naive_relays": 0,
+        }
+
+    def get_player(self, binaddr: int) -> Optional[InterestPlayer]:
+        return self._players.get(binaddr)
+
+    def get_neighbors(self, binaddr: int) -> Set[int]:
+        """Get the players within streaming distance of a player"""
+        _player = self._players.get(binaddr)
+        return set() if _player is None else set(_player.near)
+
+    def set_player_location(
+        self, binaddr: int, dimension: int = 0, interior: int = 0
+    ) -> Literal[True]:
+        """Set the dimension and interior of a player (not carried by puresync)"""
+        with self._lock:
+            _player = self._get_player(binaddr)
+            _player.dimension = dimension
+            _player.interior = interior
+            _player.anchor = None
+            self._index.insert(binaddr, _player.position, dimension, interior)
+        return True
+
+    def remove_player(self, binaddr: int) -> bool:
+        """Forget a player (ex: on disconnect)"""
+        with self._lock:
+            return self._remove(binaddr)
+
+    def on_puresync(self, packet_id: int, player: int, payload: Any) -> bool:
+        """Packet handler, keeps the latest puresync of the player until the tick"""
+        _payload = retain_payload(payload)
+        with self._lock:
+            self._received[player] = _payload
+        return False
+
+    def update(self) -> int:
+        """Run one relay tick (decode, update neighbors, relay)
+
+        Returns:
+        --------
+            int: Number of relayed packets
+        """
+        with self._lock:
+            _received = self._received
+            self._received = {}
+            _now = time.perf_counter()
+            self._apply_syncs(_received, _now)
+            self._expire(_now)
+            for _player in self._players.values():
+                if _player.anchor is None:
+                    self._update_neighbors(_player)
+            _records, _senders = self._relay()
+        self._ticks += 1
+        self._stats["ticks"] += 1
+        if _records:
+            self._send(_records, _senders)
+        return len(_records)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get relay counters (`naive_relays` = relays a full fan-out would have sent)"""
+        return dict(self._stats, players=len(self._players))
+
+    def get_tick(self) -> float:
+        return self._tick
+
+    def is_running(self) -> bool:
+        return self._isrunning
+
+    def start(self) -> Literal[True]:
+        """Register the puresync handler and start relaying every tick
+
+        Runs as a timer of the server event loop in asyncio mode,
+        else in a dedicated thread.
+        """
+        if self._isrunning:
+            return True
+        self._isrunning = True
+        self._server.packets.register(
+            PacketID.PACKET_ID_PLAYER_PURESYNC, self.on_puresync
+        )
+        _event_loop = self._server.get_event_loop()
+        if _event_loop is not None:
+            self._timer = _event_loop.set_timer(self._update_safe, self._tick, 0)
+        else:
+            Thread(target=self._run, name="Puresync Relay", daemon=True).start()
+        return True
+
+    def stop(self) -> Literal[True]:
+        self._isrunning = False
+        self._server.packets.unregister(
+            PacketID.PACKET_ID_PLAYER_PURESYNC, self.on_puresync
+        )
+        if self._timer is not None:
+            self._timer.kill()
+            self._timer = None
+        return True
+
+    def _apply_syncs(self, received: Dict[int, bytes], now: float) -> None:
+        if not received:
+            return
+        _puresync = PacketID.PACKET_ID_PLAYER_PURESYNC.value
+        _syncs = self._decoder.decode(
+            (_puresync, _binaddr, _payload) for _binaddr, _payload in received.items()
+        )
+        for _binaddr, (_x, _y, _z) in zip(
+            _syncs["player"].tolist(), _syncs["position"].tolist()
+        ):
+            _player = self._get_player(_binaddr)
+            _player.position = Vector3(_x, _y, _z)
+            _player.pending = received[_binaddr]
+            _player.last_sync = now
+            _anchor = _player.anchor
+            if _anchor is not None:
+                _dx, _dy, _dz = _x - _anchor[0], _y - _anchor[1], _z - _anchor[2]
+                if (
+                    _dx * _dx + _dy * _dy + _dz * _dz > self._update_distance2
+                    or _anchor[3] != _player.dimension
+                    or _anchor[4] != _player.interior
+                ):
+                    _player.anchor = None
+            self._index.insert(
+                _binaddr, _player.position, _player.dimension, _player.interior
+            )
+
+    def _update_neighbors(self, player: InterestPlayer) -> None:
+        _position = player.position
+        _near = set(
+            self._index.query_radius(
+                _position, self._stream_distance, player.dimension, player.interior
+            )
+        )
+        _near.discard(player.binaddr)
+        _players = self._players
+        for _binaddr in _near - player.near:
+            _players[_binaddr].near.add(player.binaddr)
+        for _binaddr in player.near - _near:
+            _other = _players.get(_binaddr)
+            if _other is not None:
+                _other.near.discard(player.binaddr)
+        player.near = _near
+        player.anchor = (
+            _position.x,
+            _position.y,
+            _position.z,
+            player.dimension,
+            player.interior,
+        )
+        self._stats["neighbor_updates"] += 1
+
+    def _relay(self) -> Tuple[List[OutgoingPacket], List[int]]:
+        # Relayed packets and their senders
+        _records: List[OutgoingPacket] = []
+        _senders: List[int] = []
+        _packet_id = PacketID.PACKET_ID_PLAYER_PURESYNC
+        _reliability = PacketReliability.UNRELIABLE_SEQUENCED
+        _near_priority = PacketPriority.MEDIUM
+        _far_priority = PacketPriority.LOW
+        _far_sync_rate = self._far_sync_rate
+        _encode = self._encode
+        _partitions: Dict[Tuple[int, int], List[int]] = {}
+        _syncing = _near_count = _far_count = 0
+        for _player in self._players.values():
+            if _player.pending is None:
+                continue
+            _sender = _player.binaddr
+            _data = _encode(_sender, _player.pending)
+            _player.pending = None
+            if _data is None:
+                continue
+            _syncing += 1
+            _near = _player.near
+            _records.extend(
+                (
+                    _recipient,
+                    _packet_id,
+                    BITSTREAM_VERSION,
+                    _data,
+                    _reliability,
+                    _near_priority,
+                )
+                for _recipient in _near
+            )
+            _near_count += len(_near)
+            if (
+                _far_sync_rate > 0
+                and self._ticks - _player.last_far_tick >= _far_sync_rate
+            ):
+                _player.last_far_tick = self._ticks
+                _key = (_player.dimension, _player.interior)
+                _members = _partitions.get(_key)
+                if _members is None:
+                    _members = _partitions[_key] = self._index.query_partition(*_key)
+                _start = len(_records)
+                _records.extend(
+                    (
+                        _recipient,
+                        _packet_id,
+                        BITSTREAM_VERSION,
+                        _data,
+                        _reliability,
+                        _far_priority,
+                    )
+                    for _recipient in _members
+                    if _recipient not in _near and _recipient != _sender
+                )
+                _far_count += len(_records) - _start
+            _senders.extend([_sender] * (len(_records) - len(_senders)))
+        self._stats["relayed_near"] += _near_count
+        self._stats["relayed_far"] += _far_count
+        self._stats["naive_relays"] += _syncing * max(len(self._players) - 1, 0)
+        return _records, _senders
+
+    def _send(self, records: List[OutgoingPacket], senders: List[int]) -> None:
+        _scheduler = self._server.get_send_scheduler()
+        if not _scheduler.is_running():
+            self._server.get_network().send_many(records)
+            return
+        for (
+            _recipient,
+            _packet_id,
+            _bitstream_version,
+            _data,
+            _reliability,
+            _priority,
+        ), _sender in zip(records, senders):
+            _scheduler.queue(
+                _recipient,
+                _bitstream_version,
+                PrebuiltPacket(_packet_id, _priority, _reliability, _data),
+                (_packet_id, _sender),
+            )
+
+    def _expire(self, now: float) -> None:
+        if self._timeout == inf:
+            return
+        for _binaddr in [
+            _binaddr
+            for _binaddr, _player in self._players.items()
+            if now - _player.last_sync > self._timeout
+        ]:
+            self._remove(_binaddr)
+
+    def _get_player(self, binaddr: int) -> InterestPlayer:
+        _player = self._players.get(binaddr)
+        if _player is None:
+            _player = self._players[binaddr] = InterestPlayer(binaddr)
+            _player.last_sync = time.perf_counter()
+            # Far syncs are staggered over the ticks (not all the senders on the same tick)
+            if self._far_sync_rate > 0:
+                _player.last_far_tick = self._ticks - binaddr % self._far_sync_rate
+        return _player
+
+    def _remove(self, binaddr: int) -> bool:
+        _player = self._players.pop(binaddr, None)
+        if _player is None:
+            return False
+        for _binaddr in _player.near:
+            _other = self._players.get(_binaddr)
+            if _other is not None:
+                _other.near.discard(binaddr)
+        self._index.remove(binaddr)
+        self._received.pop(binaddr, None)
+        if isinstance(self._encode, PuresyncRelayEncoder):
+            self._encode.forget(binaddr)
+        return True
+
+    def _run(self) -> None:
+        _next_tick = time.perf_counter() + self._tick
+        while self._isrunning:
+            _delay = _next_tick - time.perf_counter()
+            if _delay > 0:
+                time.sleep(_delay)
+            elif (
+                _delay < -self._tick
+            ):  # Late by more than a tick, don't try to catch up
+                _next_tick -= _delay
+            _next_tick += self._tick
+            self._update_safe()
+
+    def _update_safe(self) -> None:
+        try:
+            self.update()
+        except Exception as err:
+            self._logger.error(f"Couldn't relay the puresyncs ({err!r})")
@@ -1,17 +1,51 @@
-from typing import Union, Any
+from typing import Optional, Union, Any
 
-from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_handler.io import BitStream, bitstream_pool
 from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
+from IronicMTA.network.packet_schema import PacketSchema
 
 
 class Packet(object):
-    """Packet Base"""
+    """Packet Base
+
+    Packets can declare a `schema` (PacketSchema), then `read()`
+    and `build()` are handled by the compiled schema codecs.
+
+    The bitstream is drawn from the default BitStream pool on first use,
+    a packet instance can be rebuilt/reread many times and `release()`
+    gives the stream back to the pool (a later use draws a new one).
+    Received packets release it as soon as their fields are decoded.
+    """
+
+    schema: Optional[PacketSchema] = None
 
     def __init__(self) -> None:
-        self.bitstream = BitStream()
+        self._bitstream: Optional[BitStream] = None
+
+    @property
+    def bitstream(self) -> BitStream:
+        if self._bitstream is None:
+            self._bitstream = bitstream_pool.acquire()
+        return self._bitstream
+
+    def release(self) -> None:
+        """Give back the packet bitstream to the pool"""
+        if self._bitstream is not None:
+            bitstream_pool.release(self._bitstream)
+            self._bitstream = None
+
+    def read(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Decode packet data into the schema fields (reads `data` in place)"""
+        self.bitstream.refresh(data, readonly=True)
+        if self.schema is not None:
+            self.schema.decode(self.bitstream, self)
 
     def build(self) -> Union[bytes, bytearray, Any]:
         """Get packet bytes"""
+        if self.schema is not None:
+            self.bitstream.reset()
+            self.schema.encode(self.bitstream, self)
+            return self.bitstream.get_bytes()
 
     def get_id(self) -> Union[PacketID, Any]:
         """Get The Packet ID Will be Sent"""
@@ -20,4 +54,4 @@ class Packet(object):
         """Get The Packet Priority Will be Sent"""
 
     def get_reliability(self) -> Union[PacketReliability, Any]:
-        """Get The Packet Reliability Will be Sent"""
+        """Get The Packet Reliability Will be Sent"""
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""Prebuilt Packets Cache"""
+
+from threading import Lock
+from typing import Any, Dict, Hashable, Literal, Tuple, Type
+
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
+from IronicMTA.network.packet_base import Packet
+
+
+class PrebuiltPacket(object):
+    """Serialized packet (id, priority, reliability and bytes)"""
+
+    __slots__ = ("packet_id", "priority", "reliability", "data")
+
+    def __init__(
+        self,
+        packet_id: PacketID,
+        priority: PacketPriority,
+        reliability: PacketReliability,
+        data: bytes,
+    ) -> None:
+        self.packet_id = packet_id
+        self.priority = priority
+        self.reliability = reliability
+        self.data = data
+
+    def get_id(self) -> PacketID:
+        return self.packet_id
+
+    def get_priority(self) -> PacketPriority:
+        return self.priority
+
+    def get_reliability(self) -> PacketReliability:
+        return self.reliability
+
+    def build(self) -> bytes:
+        return self.data
+
+
+class PacketCache(object):
+    """Prebuilt packets cache
+
+    Constant and rarely changing outbound packets (mod name, connect
+    complete, ...) are built once per (packet type, parameters) and the
+    same bytes are reused for every player, until the entry is invalidated.
+
+    >>> packet_cache.get(Packet_PlayerJoinModName, BITSTREAM_VERSION)
+
+    Args:
+    -----
+        max_size (int, optional): Max cached packets (oldest entries are evicted first)
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self._max_size = max(max_size, 1)
+        self._packets: Dict[
+            Tuple[Type[Packet], Tuple[Hashable, ...]], PrebuiltPacket
+        ] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, packet_type: Type[Packet], *params: Hashable) -> PrebuiltPacket:
+        """Get a prebuilt packet (builds it on the first call)
+
+        Args:
+        -----
+            packet_type (Type[Packet]): Packet class
+            *params (Hashable): Packet constructor parameters
+
+        Returns:
+        --------
+            PrebuiltPacket: Serialized packet
+        """
+        _key = (packet_type, params)
+        _packet = self._packets.get(_key)
+        if _packet is not None:
+            self._hits += 1
+            return _packet
+
+        with self._lock:
+            _packet = self._packets.get(_key)
+            if _packet is None:
+                self._misses += 1
+                _packet = self._build(packet_type(*params))
+                if len(self._packets) >= self._max_size:
+                    del self._packets[next(iter(self._packets))]
+                self._packets[_key] = _packet
+        return _packet
+
+    def invalidate(self, packet_type: Type[Packet], *params: Hashable) -> int:
+        """Invalidate cached packets
+
+        Args:
+        -----
+            packet_type (Type[Packet]): Packet class
+            *params (Hashable): Packet parameters (all the entries of the
+                                packet type are invalidated if not passed)
+
+        Returns:
+        --------
+            int: Number of invalidated packets
+        """
+        with self._lock:
+            if params:
+                return 1 if self._packets.pop((packet_type, params), None) else 0
+            _keys = [_key for _key in self._packets if _key[0] is packet_type]
+            for _key in _keys:
+                del self._packets[_key]
+            return len(_keys)
+
+    def clear(self) -> Literal[True]:
+        """Invalidate all the cached packets"""
+        with self._lock:
+            self._packets.clear()
+        return True
+
+    def is_cached(self, packet_type: Type[Packet], *params: Hashable) -> bool:
+        return (packet_type, params) in self._packets
+
+    def get_size(self) -> int:
+        """Get number of cached packets"""
+        return len(self._packets)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hits and misses"""
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._packets)}
+
+    def _build(self, packet: Packet) -> PrebuiltPacket:
+        try:
+            return PrebuiltPacket(
+                packet.get_id(),
+                packet.get_priority(),
+                packet.get_reliability(),
+                bytes(packet.build()),
+            )
+        finally:
+            packet.release()
+
+
+# Default packets cache
+packet_cache = PacketCache()
@@ -0,0 +1,187 @@
+"""
+    Declarative packet schemas
+
+    A packet declares its fields once, the schema is compiled (at import)
+    into precomputed `struct.Struct` runs and generated encode/decode functions.
+
+    >>> class MyPacket(Packet):
+    ...     schema = PacketSchema(
+    ...         ("level", UINT32),
+    ...         ("message", STRING),
+    ...     )
+"""
+
+from struct import Struct
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class Field(object):
+    """Packet schema field type
+
+    Args:
+    -----
+        fmt (str, optional): `struct` format of a fixed size field
+        byteorder (str, optional): `struct` byte order ("<", ">" or "" if it doesn't matter)
+        reader (str, optional): BitStream read method of a variable size field
+        writer (str, optional): BitStream write method of a variable size field
+        args (tuple, optional): Extra arguments passed to reader/writer
+        decode (str, optional): Expression template converting the read value
+        encode (str, optional): Expression template converting the value to write
+    """
+
+    def __init__(
+        self,
+        fmt: str = "",
+        byteorder: str = "",
+        reader: str = "",
+        writer: str = "",
+        args: Tuple[Any, ...] = (),
+        decode: str = "{}",
+        encode: str = "{}",
+    ) -> None:
+        self.fmt = fmt
+        self.byteorder = byteorder
+        self.reader = reader
+        self.writer = writer
+        self.args = args
+        self.decode = decode
+        self.encode = encode
+
+    @property
+    def isfixed(self) -> bool:
+        """Check if the field can be merged in a struct run"""
+        return self.fmt != ""
+
+
+# Fixed size fields (same byte order as the BitStream methods)
+BYTE = Field("B")
+USHORT = Field("H", "<")
+UINT16 = Field("H", ">")
+INT16 = Field("h", ">")
+UINT32 = Field("I", ">")
+INT32 = Field("i", ">")
+UINT64 = Field("Q", ">")
+INT64 = Field("q", ">")
+FLOAT = Field("f", ">")
+DOUBLE = Field("d", ">")
+
+# Variable size fields
+BIT = Field(reader="read_bit", writer="write_bit")
+STRING = Field(reader="read_string", writer="write_string")
+
+
+def fixed_bytes(size: int) -> Field:
+    """Fixed size raw bytes field"""
+    return Field(f"{size}s")
+
+
+def fixed_string(size: int) -> Field:
+    """Fixed size characters field (same as `BitStream.read_string_characters`)"""
+    return Field(
+        f"{size}s", decode="{}.decode('latin-1')", encode="{}.encode('latin-1')"
+    )
+
+
+def capped_bytes(max_bytes: int) -> Field:
+    """Length prefixed bytes field (same as `BitStream.read_bytes_capped`)"""
+    return Field(
+        reader="read_bytes_capped", writer="write_bytes_capped", args=(max_bytes,)
+    )
+
+
+class PacketSchema(object):
+    """Packet schema compiled to struct based codecs
+
+    Args:
+    -----
+        *fields (Tuple[str, Field]): (attribute name, field type) pairs in wire order
+    """
+
+    def __init__(self, *fields: Tuple[str, Field]) -> None:
+        self._fields = fields
+        self._runs: List[Tuple[List[Tuple[str, Field]], Struct | None]] = []
+        self._compile_runs()
+        self.decode: Callable[[Any, Any], None] = self._generate_decoder()
+        self.encode: Callable[[Any, Any], None] = self._generate_encoder()
+
+    def get_fields(self) -> Tuple[Tuple[str, Field], ...]:
+        """Get schema fields"""
+        return self._fields
+
+    def get_field_names(self) -> List[str]:
+        """Get schema fields attribute names"""
+        return [_name for _name, _ in self._fields]
+
+    def _compile_runs(self) -> None:
+        _run: List[Tuple[str, Field]] = []
+        _byteorder = ""
+        for _name, _field in self._fields:
+            if _field.isfixed:
+                if (
+                    _run
+                    and _field.byteorder
+                    and _byteorder
+                    and _field.byteorder != _byteorder
+                ):
+                    self._close_run(_run, _byteorder)
+                    _run, _byteorder = [], ""
+                _run.append((_name, _field))
+                _byteorder = _byteorder or _field.byteorder
+                continue
+            if _run:
+                self._close_run(_run, _byteorder)
+                _run, _byteorder = [], ""
+            self._runs.append(([(_name, _field)], None))
+        if _run:
+            self._close_run(_run, _byteorder)
+
+    def _close_run(self, run: List[Tuple[str, Field]], byteorder: str) -> None:
+        _fmt = (byteorder or "<") + "".join(_field.fmt for _, _field in run)
+        self._runs.append((run, Struct(_fmt)))
+
+    def _namespace(self) -> Dict[str, Any]:
+        _namespace: Dict[str, Any] = {}
+        for _index, (_run, _struct) in enumerate(self._runs):
+            if _struct is not None:
+                _namespace[f"_struct_{_index}"] = _struct
+            else:
+                _namespace[f"_args_{_index}"] = _run[0][1].args
+        return _namespace
+
+    def _generate_decoder(self) -> Callable[[Any, Any], None]:
+        _lines = ["def decode(bitstream, packet):"]
+        for _index, (_run, _struct) in enumerate(self._runs):
+            if _struct is None:
+                _name, _field = _run[0]
+                _value = f"bitstream.{_field.reader}(*_args_{_index})"
+                _lines.append(f"    packet.{_name} = {_field.decode.format(_value)}")
+                continue
+            _locals = [f"_v{_index}_{_n}" for _n in range(len(_run))]
+            _lines.append(
+                f"    {', '.join(_locals)}, = bitstream.read_struct(_struct_{_index})"
+            )
+            for (_name, _field), _local in zip(_run, _locals):
+                _lines.append(f"    packet.{_name} = {_field.decode.format(_local)}")
+        _lines.append("    return None")
+        return self._exec("decode", _lines)
+
+    def _generate_encoder(self) -> Callable[[Any, Any], None]:
+        _lines = ["def encode(bitstream, packet):"]
+        for _index, (_run, _struct) in enumerate(self._runs):
+            if _struct is None:
+                _name, _field = _run[0]
+                _lines.append(
+                    f"    bitstream.{_field.writer}(packet.{_name}, *_args_{_index})"
+                )
+                continue
+            _values = ", ".join(
+                _field.encode.format(f"packet.{_name}") for _name, _field in _run
+            )
+            _lines.append(f"    bitstream.write_struct(_struct_{_index}, {_values})")
+        _lines.append("    return None")
+        return self._exec("encode", _lines)
+
+    def _exec(self, name: str, lines: List[str]) -> Callable[[Any, Any], None]:
+        _namespace = self._namespace()
+        exec(compile("\n".join(lines), f"<packet schema {name}>", "exec"), _namespace)
+        return _namespace[name]
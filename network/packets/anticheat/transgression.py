@@ -4,14 +4,19 @@
 
 from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
 from IronicMTA.network.packet_base import Packet
+from IronicMTA.network.packet_schema import PacketSchema, UINT32, STRING
 
 
 class Packet_AntiCheatTransgression(Packet):
+    schema = PacketSchema(
+        ("_level", UINT32),
+        ("_message", STRING),
+    )
+
     def __init__(self, data) -> None:
         super().__init__()
-        self.bitstream.refresh(data)
-        self._level = self.bitstream.read_uint32()
-        self._message = self.bitstream.read_string()
+        self.read(data)
+        self.release()
 
     def get_id(self) -> PacketID:
         return PacketID.PACKET_ID_PLAYER_TRANSGRESSION
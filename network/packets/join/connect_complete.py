@@ -1,17 +1,28 @@
 """
-    Join Mod Name packet
+    Connect complete packet
 """
 
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
 from IronicMTA.network.packet_base import Packet
+from IronicMTA.network.packet_schema import PacketSchema, STRING
 
 
 class Packet_PlayerConnectComplete(Packet):
+    schema = PacketSchema(
+        ("message", STRING),
+        ("net_version", STRING),
+    )
+
     def __init__(self, net_version: int, message: str) -> None:
-        self._netversion = net_version
-        self._message = message
+        super().__init__()
+        self.net_version = str(net_version)
+        self.message = message
+
+    def get_id(self) -> PacketID:
+        return PacketID.PACKET_ID_SERVER_JOIN_COMPLETE
 
-    def build(self):
-        self.bitstream.write_string(self._message)
-        self.bitstream.write_string(str(self._netversion))
+    def get_priority(self) -> PacketPriority:
+        return PacketPriority.HIGH
 
-        return self.bitstream.get_bytes()
+    def get_reliability(self) -> PacketReliability:
+        return PacketReliability.RELIABLE_SEQUENCED
@@ -4,33 +4,37 @@
 
 from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
 from IronicMTA.network.packet_base import Packet
+from IronicMTA.network.packet_schema import (
+    PacketSchema,
+    USHORT,
+    STRING,
+    BIT,
+    BYTE,
+    fixed_bytes,
+    fixed_string,
+)
 from IronicMTA.limits import MAX_PLAYER_NICK_LENGTH, MAX_SERIAL_LENGTH
 
 
 class Packet_PlayerJoinData(Packet):
     """Join Data Packet"""
 
+    schema = PacketSchema(
+        ("net_version", USHORT),
+        ("mta_version", USHORT),
+        ("bitstream_version", USHORT),
+        ("player_version", STRING),
+        ("optional_update", BIT),
+        ("game_version", BYTE),
+        ("nickname", fixed_string(MAX_PLAYER_NICK_LENGTH)),
+        ("password", fixed_bytes(16)),
+        ("serial", fixed_string(MAX_SERIAL_LENGTH)),
+    )
+
     def __init__(self, data: bytearray) -> None:
         super().__init__()
-        self.bitstream.refresh(data)
-        print(f"Data: {bytes(data)!r}")
-        self.net_version = self.bitstream.read_ushort()
-        print(f"NetVersion: {self.net_version}")
-        self.mta_version = self.bitstream.read_ushort()
-        print(f"MTAVersion: {self.mta_version}")
-        self.bitstream_version = self.bitstream.read_ushort()
-        print(f"BitStream Version: {self.bitstream_version}")
-        self.player_version = self.bitstream.read_string()
-        print(f"Player Version: {self.player_version}")
-
-        self.optional_update = self.bitstream.read_bit()
-        print(f"Optional Update: {self.optional_update}")
-        self.game_version = self.bitstream.read_byte()
-        print(f"Game Version: {self.game_version}")
-        self.nickname = self.bitstream.read_string_characters(MAX_PLAYER_NICK_LENGTH)
-        print(f"Nick Version: {self.nickname}")
-        self.password = self.bitstream.read_bytes(16)
-        self.serial = self.bitstream.read_string_characters(MAX_SERIAL_LENGTH)
+        self.read(data)
+        self.release()
 
     def get_id(self) -> PacketID:
         return PacketID.PACKET_ID_PLAYER_JOINDATA
@@ -40,6 +44,3 @@ class Packet_PlayerJoinData(Packet):
 
     def get_reliability(self) -> PacketReliability:
         return PacketReliability.RELIABLE_SEQUENCED
-
-    def build(self):
-        return self.bitstream.get_bytes()
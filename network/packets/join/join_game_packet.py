@@ -2,9 +2,10 @@
     Join complete packet
 """
 
-from IronicMTA.object_manager import ElementID
+from IronicMTA.element_ids import ElementID
 from IronicMTA.limits import MAX_HTTP_DOWNLOAD_URL
 from IronicMTA.common import HttpDownloadTypes
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
 from IronicMTA.network.packet_base import Packet
 
 
@@ -24,6 +25,7 @@ class Packet_PlayerJoinComplete(Packet):
         bit_rate: int = 2400,
         fakelag: bool = False,
     ) -> None:
+        super().__init__()
         self._httptypes = HttpDownloadTypes()
 
         self._player_id = player_id
@@ -39,24 +41,36 @@ class Packet_PlayerJoinComplete(Packet):
         self._voice_quality = voice_quality
         self._bit_rate = bit_rate
 
+    def get_id(self) -> PacketID:
+        return PacketID.PACKET_ID_SERVER_JOINEDGAME
+
+    def get_priority(self) -> PacketPriority:
+        return PacketPriority.HIGH
+
+    def get_reliability(self) -> PacketReliability:
+        return PacketReliability.RELIABLE_SEQUENCED
+
     def build(self):
         _players_count = 1  # Non zero single byte
-        self.bitstream.write(self._root_id.value)
+        self.bitstream.reset()
+        self.bitstream.write_elementid(self._player_id)
+        self.bitstream.write_byte(_players_count)
+        self.bitstream.write_elementid(self._root_id)
 
-        self.bitstream.write(self._enable_client_checks)
-        self.bitstream.write(self._voice_enabled)
-        self.bitstream.writeBytesCapped(self._sample_rate, 2)
-        self.bitstream.writeByteCapped(self._voice_quality, 4)
-        self.bitstream.writeCompressed(bytearray(self._bit_rate), True)
+        self.bitstream.write_native_bits(self._enable_client_checks, 32)
+        self.bitstream.write_bit(self._voice_enabled)
+        self.bitstream.write_native_bits(int(self._sample_rate), 2)
+        self.bitstream.write_native_bits(self._voice_quality, 4)
+        self.bitstream.write_compressed(self._bit_rate)
 
-        self.bitstream.writeBit(self._isfakelag_enabled)
-        self.bitstream.writeBytes(bytearray(self._max_connections_per_client))
-        self.bitstream.writeBytes(bytearray(self._http_download_type))
+        self.bitstream.write_bit(self._isfakelag_enabled)
+        self.bitstream.write_native_bits(self._max_connections_per_client, 32)
+        self.bitstream.write_byte(self._http_download_type)
 
         if self._http_download_type == self._httptypes.HTTP_DOWNLOAD_ENABLED_PORT:
-            self.bitstream.writeBytes(self._http_download_port)
+            self.bitstream.write_native_bits(self._http_download_port, 16)
         elif self._http_download_type == self._httptypes.HTTP_DOWNLOAD_ENABLED_URL:
-            self.bitstream.writeBytes(bytearray(self._http_download_port))
-            self.bitstream.writeBytes(bytearray(self._http_download_url))
+            self.bitstream.write_native_bits(self._http_download_port, 16)
+            self.bitstream.write_string(self._http_download_url)
 
-        return self.bitstream.build()
+        return self.bitstream.get_bytes()
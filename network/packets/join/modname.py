@@ -1,12 +1,18 @@
 from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
 from IronicMTA.network.packet_base import Packet
+from IronicMTA.network.packet_schema import PacketSchema, USHORT, STRING
 
 
 class Packet_PlayerJoinModName(Packet):
+    schema = PacketSchema(
+        ("bitstream_version", USHORT),
+        ("mod_name", STRING),
+    )
+
     def __init__(self, bitstream_version) -> None:
         super().__init__()
-        self.bitstream.write_ushort(bitstream_version)
-        self.bitstream.write_string("deathmatch")
+        self.bitstream_version = bitstream_version
+        self.mod_name = "deathmatch"
 
     def get_id(self) -> PacketID:
         return PacketID.PACKET_ID_MOD_NAME
@@ -17,5 +23,3 @@ class Packet_PlayerJoinModName(Packet):
     def get_reliability(self) -> PacketReliability:
         return PacketReliability.RELIABLE
 
-    def build(self):
-        return self.bitstream.get_bytes()
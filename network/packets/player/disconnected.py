@@ -5,17 +5,21 @@
 from typing import Optional
 from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
 from IronicMTA.network.packet_base import Packet
+from IronicMTA.network.packet_schema import PacketSchema, UINT32, STRING
 from IronicMTA.logger import Logger
 from IronicMTA.common import PlayerDisconnectedTypes
 
 
 class Packet_PlayerDisconnected(Packet):
+    schema = PacketSchema(
+        ("disconnected_type", UINT32),
+        ("reason", STRING),
+    )
+
     def __init__(self, data: bytearray, logger: Optional[Logger] = None) -> None:
         super().__init__()
-        self.bitstream.refresh(data)
-
-        self.disconnected_type = self.bitstream.read_uint32()
-        self.reason = self.bitstream.read_string()
+        self.read(data)
+        self.release()
 
         if logger:
             logger.log(
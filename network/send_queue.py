@@ -0,0 +1,313 @@
+"""Outbound Packets Scheduler"""
+
+import time
+from threading import Lock, Thread
+from typing import Any, Dict, Hashable, Iterator, List, Literal, Optional, Tuple
+
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
+from IronicMTA.core.transport.base import OutgoingPacket
+from IronicMTA.network.bandwidth import BandwidthBudget, SEND, DEFER
+
+
+class OutboundPacket(object):
+    """Queued outbound packet"""
+
+    __slots__ = ("packet_id", "priority", "reliability", "data", "coalesce_key")
+
+    def __init__(
+        self,
+        packet_id: PacketID,
+        priority: PacketPriority,
+        reliability: PacketReliability,
+        data: bytes,
+        coalesce_key: Optional[Hashable] = None,
+    ) -> None:
+        self.packet_id = packet_id
+        self.priority = priority
+        self.reliability = reliability
+        self.data = data
+        self.coalesce_key = coalesce_key
+
+
+class OutboundQueue(object):
+    """Outbound packets queue of a client (one tick)
+
+    Packets are kept per priority. An unreliable sequenced packet pushed
+    with a `coalesce_key` (ex: (packet id, element id)) replaces the queued
+    packet with the same key, so only the newest update is sent.
+
+    Args:
+    -----
+        binaddr (int): Client player binary address
+        bitstream_version (int): Client bitstream version
+    """
+
+    def __init__(self, binaddr: int, bitstream_version: int) -> None:
+        self.binaddr = binaddr
+        self.bitstream_version = bitstream_version
+        self._queues: List[List[Optional[OutboundPacket]]] = [
+            [] for _ in range(PacketPriority.COUNT.value)
+        ]
+        self._coalesced: Dict[Hashable, Tuple[int, int]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, packet: OutboundPacket) -> bool:
+        """Queue a packet
+
+        Returns:
+        --------
+            bool: False if the packet superseded an already queued one
+        """
+        _priority = packet.priority.value
+        _key = packet.coalesce_key
+        if (
+            _key is None
+            or packet.reliability is not PacketReliability.UNRELIABLE_SEQUENCED
+        ):
+            self._queues[_priority].append(packet)
+            self._size += 1
+            return True
+
+        _slot = self._coalesced.get(_key)
+        if _slot is not None:
+            _old_priority, _index = _slot
+            if _old_priority == _priority:
+                self._queues[_priority][_index] = packet
+                return False
+            self._queues[_old_priority][_index] = None
+            self._size -= 1
+        self._coalesced[_key] = (_priority, len(self._queues[_priority]))
+        self._queues[_priority].append(packet)
+        self._size += 1
+        return _slot is None
+
+    def drain(self) -> Iterator[OutboundPacket]:
+        """Pop the queued packets (high priority first, in queue order)"""
+        _queues = self._queues
+        self._queues = [[] for _ in range(PacketPriority.COUNT.value)]
+        self._coalesced = {}
+        self._size = 0
+        for _queue in _queues:
+            for _packet in _queue:
+                if _packet is not None:
+                    yield _packet
+
+
+class SendScheduler(object):
+    """Tick based outbound packets scheduler
+
+    Packets sent during a tick are queued per client and flushed at the
+    end of the tick in priority order, superseded unreliable sequenced
+    updates being coalesced (see `OutboundQueue`). Clients over their
+    bandwidth budget get their droppable packets dropped and their
+    reliable packets deferred to the next tick (see `BandwidthBudget`).
+
+    Args:
+    -----
+        server (Server): IronicMTA Server
+        tick (float, optional): Tick interval (seconds)
+        budget (BandwidthBudget, optional): Per player budgets. Defaults to unlimited budgets.
+    """
+
+    def __init__(
+        self, server, tick: float = 0.05, budget: Optional[BandwidthBudget] = None
+    ) -> None:
+        self._server = server
+        self._budget = budget if budget is not None else BandwidthBudget()
+        self._network = server.get_network()
+        self._logger = server.get_logger()
+        self._tick = tick
+        self._queues: Dict[int, OutboundQueue] = {}
+        self._lock = Lock()
+        self._isrunning = False
+        self._timer = None
+        self._queued = 0
+        self._coalesced = 0
+        self._sent = 0
+        self._flushes = 0
+
+    def queue(
+        self,
+        binaddr: int,
+        bitstream_version: int,
+        packet: Any,
+        coalesce_key: Optional[Hashable] = None,
+    ) -> bool:
+        """Queue a packet until the end of the tick
+
+        The packet is built immediately, it can be reused or released once queued.
+
+        Args:
+        -----
+            binaddr (int): Client player binary address
+            bitstream_version (int): Client bitstream version
+            packet (Packet | PrebuiltPacket): Packet to send
+            coalesce_key (Hashable, optional): Key of the updated state (ex: (packet id, element id))
+
+        Returns:
+        --------
+            bool: False if the packet superseded an already queued one
+        """
+        _packet = OutboundPacket(
+            packet.get_id(),
+            packet.get_priority(),
+            packet.get_reliability(),
+            bytes(packet.build()),
+            coalesce_key,
+        )
+        with self._lock:
+            _queue = self._queues.get(binaddr)
+            if _queue is None:
+                _queue = self._queues[binaddr] = OutboundQueue(
+                    binaddr, bitstream_version
+                )
+            self._queued += 1
+            if _queue.push(_packet):
+                return True
+            self._coalesced += 1
+            return False
+
+    def flush(self) -> int:
+        """Send all the queued packets (end of tick, one `send_many` call)
+
+        Returns:
+        --------
+            int: Number of sent packets
+        """
+        with self._lock:
+            _queues = self._queues
+            self._queues = {}
+        _outgoing: List[OutgoingPacket] = []
+        _budget = self._budget
+        _now = time.perf_counter()
+        for _queue in _queues.values():
+            _binaddr = _queue.binaddr
+            _budget.refill(_binaddr, _now)
+            _blocked = [False] * PacketPriority.COUNT.value
+            _deferred: List[OutboundPacket] = []
+            for _packet in _queue.drain():
+                _decision = _budget.decide(
+                    _binaddr,
+                    _packet.priority,
+                    _packet.reliability,
+                    len(_packet.data),
+                    _blocked[_packet.priority.value],
+                )
+                if _decision == SEND:
+                    _outgoing.append(
+                        (
+                            _binaddr,
+                            _packet.packet_id,
+                            _queue.bitstream_version,
+                            _packet.data,
+                            _packet.reliability,
+                            _packet.priority,
+                        )
+                    )
+                elif _decision == DEFER:
+                    _blocked[_packet.priority.value] = True
+                    _deferred.append(_packet)
+            if _deferred:
+                self._requeue(_queue, _deferred)
+        _sent = self._network.send_many(_outgoing) if _outgoing else 0
+        self._sent += _sent
+        self._flushes += 1
+        return _sent
+
+    def remove_client(self, binaddr: int) -> int:
+        """Forget a client (ex: on disconnect), its queued packets are dropped
+
+        Returns:
+        --------
+            int: Number of dropped packets
+        """
+        with self._lock:
+            _queue = self._queues.pop(binaddr, None)
+        self._budget.remove_player(binaddr)
+        return 0 if _queue is None else len(_queue)
+
+    def get_bandwidth_budget(self) -> BandwidthBudget:
+        """Get per player bandwidth budgets (and send/drop counters)"""
+        return self._budget
+
+    def get_pending_count(self, binaddr: Optional[int] = None) -> int:
+        """Get number of queued packets (of a client or all the clients)"""
+        if binaddr is not None:
+            _queue = self._queues.get(binaddr)
+            return 0 if _queue is None else len(_queue)
+        return sum(len(_queue) for _queue in list(self._queues.values()))
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get queued, coalesced and sent packets counters"""
+        return {
+            "queued": self._queued,
+            "coalesced": self._coalesced,
+            "sent": self._sent,
+            "flushes": self._flushes,
+        }
+
+    def get_tick(self) -> float:
+        return self._tick
+
+    def is_running(self) -> bool:
+        return self._isrunning
+
+    def start(self) -> Literal[True]:
+        """Start flushing the queues every tick
+
+        Runs as a timer of the server event loop in asyncio mode,
+        else in a dedicated thread.
+        """
+        if self._isrunning:
+            return True
+        self._isrunning = True
+        _event_loop = self._server.get_event_loop()
+        if _event_loop is not None:
+            self._timer = _event_loop.set_timer(self._flush_safe, self._tick, 0)
+        else:
+            Thread(target=self._run, name="Send Scheduler", daemon=True).start()
+        return True
+
+    def stop(self) -> Literal[True]:
+        """Stop the tick and send the remaining packets"""
+        self._isrunning = False
+        if self._timer is not None:
+            self._timer.kill()
+            self._timer = None
+        self.flush()
+        return True
+
+    def _run(self) -> None:
+        _next_tick = time.perf_counter() + self._tick
+        while self._isrunning:
+            _delay = _next_tick - time.perf_counter()
+            if _delay > 0:
+                time.sleep(_delay)
+            elif (
+                _delay < -self._tick
+            ):  # Late by more than a tick, don't try to catch up
+                _next_tick -= _delay
+            _next_tick += self._tick
+            self._flush_safe()
+
+    def _requeue(self, queue: OutboundQueue, deferred: List[OutboundPacket]) -> None:
+        # Deferred packets go before the packets queued during the flush
+        with self._lock:
+            _newer = self._queues.get(queue.binaddr)
+            _queue = self._queues[queue.binaddr] = OutboundQueue(
+                queue.binaddr, queue.bitstream_version
+            )
+            for _packet in deferred:
+                _queue.push(_packet)
+            if _newer is not None:
+                for _packet in _newer.drain():
+                    _queue.push(_packet)
+
+    def _flush_safe(self) -> None:
+        try:
+            self.flush()
+        except Exception as err:
+            self._logger.error(f"Couldn't flush the outbound packets ({err!r})")
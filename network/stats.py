@@ -0,0 +1,250 @@
+"""Network Statistics Sampler"""
+
+import time
+from array import array
+from threading import Thread
+from typing import Any, Dict, List, Literal, Optional
+
+# Transport counters sampled into per second rates (series name: BandwidthStatistics field)
+RATE_COUNTERS = {
+    "outgoing_bytes": "llOutgoingUDPByteCount",
+    "incoming_bytes": "llIncomingUDPByteCount",
+    "outgoing_packets": "llOutgoingUDPPacketCount",
+    "incoming_packets": "llIncomingUDPPacketCount",
+    "blocked_bytes": "llIncomingUDPByteCountBlocked",
+    "blocked_packets": "llIncomingUDPPacketCountBlocked",
+    "resent_bytes": "llOutgoingUDPByteResentCount",
+    "resent_messages": "llOutgoingUDPMessageResentCount",
+}
+
+# Network thread CPU usage series (series name: ThreadCPUTimes field)
+CPU_GAUGES = {
+    "cpu_user": "fUserPercent",
+    "cpu_kernel": "fKernelPercent",
+    "cpu_total": "fTotalCPUPercent",
+}
+
+# Packet processing series (series name: SPacketStat field), ctypes transport only
+PACKET_STAT_COUNTERS = {
+    "processed_packets": "iCount",
+    "processed_bytes": "iTotalBytes",
+}
+
+
+class RingBuffer(object):
+    """Fixed size floats ring buffer (oldest values are overwritten)
+
+    Args:
+    -----
+        size (int): Number of kept values
+    """
+
+    __slots__ = ("_values", "_size", "_index", "_count")
+
+    def __init__(self, size: int) -> None:
+        self._values = array("d", bytes(8 * size))
+        self._size = size
+        self._index = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float) -> None:
+        self._values[self._index] = value
+        self._index = (self._index + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+
+    def get_last(self, default: float = 0.0) -> float:
+        if not self._count:
+            return default
+        return self._values[self._index - 1]
+
+    def get_values(self, count: Optional[int] = None) -> List[float]:
+        """Get the last `count` values (all by default), oldest first"""
+        _count = self._count if count is None else min(count, self._count)
+        _start = self._index - _count
+        if _start >= 0:
+            return self._values[_start : self._index].tolist()
+        return (self._values[_start:] + self._values[: self._index]).tolist()
+
+    def get_average(self, count: Optional[int] = None) -> float:
+        """Get the average of the last `count` values (moving average)"""
+        _values = self.get_values(count)
+        return sum(_values) / len(_values) if _values else 0.0
+
+    def get_max(self, count: Optional[int] = None) -> float:
+        return max(self.get_values(count), default=0.0)
+
+
+class NetworkStatsSampler(object):
+    """Background network statistics sampler
+
+    Polls the transport bandwidth statistics, network thread CPU times
+    and packet stats every `interval` seconds, and keeps the per second
+    rates (bytes/s, packets/s, resends/s, blocked packets/s, ...) of the
+    last `size` samples in ring buffers.
+
+    >>> _sampler = server.get_stats_sampler()
+    >>> _sampler.get_latest()["outgoing_bytes"]  # bytes/s
+    >>> _sampler.get_averages(10)  # moving averages of the last 10 samples
+
+    Args:
+    -----
+        server (Server): IronicMTA Server
+        interval (float, optional): Sampling interval (seconds)
+        size (int, optional): Number of kept samples per series
+    """
+
+    def __init__(self, server, interval: float = 1.0, size: int = 300) -> None:
+        self._server = server
+        self._logger = server.get_logger()
+        self._interval = interval
+        self._size = size
+        self._timestamps = RingBuffer(size)
+        self._series: Dict[str, RingBuffer] = {
+            _name: RingBuffer(size)
+            for _name in (*RATE_COUNTERS, *CPU_GAUGES, *PACKET_STAT_COUNTERS)
+        }
+        self._last_counters: Dict[str, int] = {}
+        self._last_time = 0.0
+        self._isrunning = False
+        self._timer = None
+
+    def sample(self) -> Dict[str, float] | None:
+        """Poll the transport statistics once
+
+        Rates are computed from the previous sample, so the first
+        sample only records the counters.
+
+        Returns:
+        --------
+            Dict[str, float] | None: New sample values (None if no sample was stored)
+        """
+        _network = self._server.get_network()
+        _bandwidth = _network.get_bandwidth_statistics()
+        if not _bandwidth:  # Transport not running
+            return None
+        _now = time.time()
+        _counters = {
+            _name: getattr(_bandwidth, _field)
+            for _name, _field in RATE_COUNTERS.items()
+        }
+        _get_packets_stats = getattr(_network, "get_packets_stats", None)
+        _packet_stats = _get_packets_stats() if _get_packets_stats else False
+        if _packet_stats:
+            for _name, _field in PACKET_STAT_COUNTERS.items():
+                _counters[_name] = getattr(_packet_stats, _field)
+
+        _last_counters, _elapsed = self._last_counters, _now - self._last_time
+        self._last_counters, self._last_time = _counters, _now
+        if not _last_counters or _elapsed <= 0:
+            return None
+
+        _sample: Dict[str, float] = {}
+        for _name, _value in _counters.items():
+            # Counters going back (transport restarted) count from zero
+            _delta = _value - _last_counters.get(_name, 0)
+            _sample[_name] = (_delta if _delta >= 0 else _value) / _elapsed
+        _cpu = _bandwidth.threadCPUTimes
+        for _name, _field in CPU_GAUGES.items():
+            _sample[_name] = getattr(_cpu, _field)
+
+        self._timestamps.append(_now)
+        for _name, _buffer in self._series.items():
+            _buffer.append(_sample.get(_name, 0.0))
+        return _sample
+
+    def get_series(self, name: str, count: Optional[int] = None) -> List[float]:
+        """Get the last `count` values of a series (all by default), oldest first
+
+        Raises:
+        -------
+            KeyError: Unknown series name
+        """
+        return self._series[name].get_values(count)
+
+    def get_series_names(self) -> List[str]:
+        return list(self._series)
+
+    def get_timestamps(self, count: Optional[int] = None) -> List[float]:
+        """Get the samples times (unix time), oldest first"""
+        return self._timestamps.get_values(count)
+
+    def get_latest(self) -> Dict[str, float]:
+        """Get the last sample values"""
+        return {_name: _buffer.get_last() for _name, _buffer in self._series.items()}
+
+    def get_averages(self, count: Optional[int] = None) -> Dict[str, float]:
+        """Get the moving averages over the last `count` samples (all by default)"""
+        return {
+            _name: _buffer.get_average(count) for _name, _buffer in self._series.items()
+        }
+
+    def get_peaks(self, count: Optional[int] = None) -> Dict[str, float]:
+        """Get the max values over the last `count` samples (all by default)"""
+        return {
+            _name: _buffer.get_max(count) for _name, _buffer in self._series.items()
+        }
+
+    def as_dict(self, count: Optional[int] = None) -> Dict[str, Any]:
+        """Get the last `count` samples, latest values, averages and peaks (JSON ready)"""
+        return {
+            "interval": self._interval,
+            "samples": len(self._timestamps),
+            "latest": self.get_latest(),
+            "average": self.get_averages(count),
+            "peak": self.get_peaks(count),
+            "timestamps": self.get_timestamps(count),
+            "series": {
+                _name: _buffer.get_values(count)
+                for _name, _buffer in self._series.items()
+            },
+        }
+
+    def get_interval(self) -> float:
+        return self._interval
+
+    def is_running(self) -> bool:
+        return self._isrunning
+
+    def start(self) -> Literal[True]:
+        """Start sampling every `interval` seconds
+
+        Runs as a timer of the server event loop in asyncio mode,
+        else in a dedicated thread.
+        """
+        if self._isrunning:
+            return True
+        self._isrunning = True
+        _event_loop = self._server.get_event_loop()
+        if _event_loop is not None:
+            self._timer = _event_loop.set_timer(self._sample_safe, self._interval, 0)
+        else:
+            Thread(target=self._run, name="Network Stats Sampler", daemon=True).start()
+        return True
+
+    def stop(self) -> Literal[True]:
+        self._isrunning = False
+        if self._timer is not None:
+            self._timer.kill()
+            self._timer = None
+        return True
+
+    def _run(self) -> None:
+        _next_sample = time.perf_counter()
+        while self._isrunning:
+            self._sample_safe()
+            _next_sample += self._interval
+            _delay = _next_sample - time.perf_counter()
+            if _delay > 0:
+                time.sleep(_delay)
+            else:  # Late, don't try to catch up
+                _next_sample -= _delay
+
+    def _sample_safe(self) -> None:
+        try:
+            self.sample()
+        except Exception as err:
+            self._logger.error(f"Couldn't sample the network statistics ({err!r})")
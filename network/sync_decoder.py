@@ -0,0 +1,340 @@
+"""
+    Batch sync decoder
+
+    Decodes all the puresync/keysync/lightsync payloads drained in one tick
+    into a single NumPy structured array. Each payload is only split into its
+    raw (quantized) fields, the dequantization is done column by column.
+"""
+
+from math import pi
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.errors import BitStreamError
+from IronicMTA.vectors import Vector3
+
+# (packet id, player binary address, payload)
+SyncPayload = Tuple[int, int, bytes | bytearray | memoryview]
+
+SYNC_DTYPE = np.dtype(
+    [
+        ("player", np.uint32),
+        ("packet_id", np.uint8),
+        ("time_context", np.uint8),
+        ("flags", np.uint16),
+        ("keys", np.uint16),
+        ("contact", np.uint32),
+        ("position", np.float32, (3,)),
+        ("velocity", np.float32, (3,)),
+        ("rotation", np.float32),
+        ("health", np.float32),
+        ("armor", np.float32),
+    ]
+)
+
+# Puresync flags (SPlayerPuresyncFlags)
+PURESYNC_FLAG_IN_WATER = 1 << 0
+PURESYNC_FLAG_ON_GROUND = 1 << 1
+PURESYNC_FLAG_HAS_JETPACK = 1 << 2
+PURESYNC_FLAG_DUCKED = 1 << 3
+PURESYNC_FLAG_WEARS_GOGGLES = 1 << 4
+PURESYNC_FLAG_HAS_CONTACT = 1 << 5
+PURESYNC_FLAG_CHOKING = 1 << 6
+PURESYNC_FLAG_AKIMBO_TARGET_UP = 1 << 7
+PURESYNC_FLAG_ON_FIRE = 1 << 8
+PURESYNC_FLAG_HAS_WEAPON = 1 << 9
+PURESYNC_FLAG_SYNCING_VELOCITY = 1 << 10
+PURESYNC_FLAG_STEALTH_AIMING = 1 << 11
+PURESYNC_FLAGS_BITS = 12
+
+# Keysync flags (SKeysyncFlags)
+KEYSYNC_FLAG_DUCKED = 1 << 0
+KEYSYNC_FLAG_CHOKING = 1 << 1
+KEYSYNC_FLAG_AKIMBO_TARGET_UP = 1 << 2
+KEYSYNC_FLAG_SYNCING_VEHICLE = 1 << 3
+KEYSYNC_FLAGS_BITS = 4
+
+# Lightsync flags
+LIGHTSYNC_FLAG_HEALTH = 1 << 0
+LIGHTSYNC_FLAG_POSITION = 1 << 1
+LIGHTSYNC_FLAGS_BITS = 2
+
+KEYS_BITS = 16
+
+# SPositionSync (SFloatSync<14, 10>)
+POSITION_INTEGER_BITS = 14
+POSITION_FRACTIONAL_BITS = 10
+# SPedRotationSync (SFloatAsBitsSync<16>(-PI, PI))
+ROTATION_BITS = 16
+# SPlayerHealthSync / SPlayerArmorSync (SFloatAsBitsSync<8>)
+HEALTH_BITS = 8
+MAX_HEALTH = 255.0
+ARMOR_BITS = 8
+MAX_ARMOR = 127.5
+
+_POSITION_BYTES = 3 * (POSITION_INTEGER_BITS + POSITION_FRACTIONAL_BITS) // 8
+
+
+def write_puresync(
+    bitstream: BitStream,
+    time_context: int,
+    keys: int,
+    flags: int,
+    position: Vector3,
+    rotation: float,
+    velocity: Vector3,
+    health: float,
+    armor: float,
+    contact: int = 0,
+) -> None:
+    """Write a player puresync payload (same layout `SyncBatchDecoder` reads)"""
+    bitstream.write_bits(time_context, 8)
+    bitstream.write_native_bits(keys, KEYS_BITS)
+    bitstream.write_native_bits(flags, PURESYNC_FLAGS_BITS)
+    if flags & PURESYNC_FLAG_HAS_CONTACT:
+        bitstream.write_native_bits(contact, 17)
+    bitstream.write_position(position, POSITION_INTEGER_BITS, POSITION_FRACTIONAL_BITS)
+    bitstream.write_float_as_bits(rotation, -pi, pi, ROTATION_BITS, True)
+    if flags & PURESYNC_FLAG_SYNCING_VELOCITY:
+        _modulus = (velocity.x**2 + velocity.y**2 + velocity.z**2) ** 0.5
+        if _modulus == 0.0:
+            bitstream.write_bit(False)
+        else:
+            bitstream.write_bit(True)
+            bitstream.write_float(_modulus)
+            bitstream.write_norm_vector(
+                velocity.x / _modulus, velocity.y / _modulus, velocity.z / _modulus
+            )
+    bitstream.write_float_as_bits(health, 0.0, MAX_HEALTH, HEALTH_BITS)
+    bitstream.write_float_as_bits(armor, 0.0, MAX_ARMOR, ARMOR_BITS)
+
+
+def write_keysync(bitstream: BitStream, keys: int, flags: int) -> None:
+    """Write a player keysync payload"""
+    bitstream.write_native_bits(keys, KEYS_BITS)
+    bitstream.write_native_bits(flags, KEYSYNC_FLAGS_BITS)
+
+
+def write_lightsync(
+    bitstream: BitStream,
+    time_context: int,
+    flags: int,
+    position: Vector3,
+    health: float,
+    armor: float,
+) -> None:
+    """Write a player lightsync payload"""
+    bitstream.write_bits(time_context, 8)
+    bitstream.write_native_bits(flags, LIGHTSYNC_FLAGS_BITS)
+    if flags & LIGHTSYNC_FLAG_HEALTH:
+        bitstream.write_float_as_bits(health, 0.0, MAX_HEALTH, HEALTH_BITS)
+        bitstream.write_float_as_bits(armor, 0.0, MAX_ARMOR, ARMOR_BITS)
+    if flags & LIGHTSYNC_FLAG_POSITION:
+        bitstream.write_position(
+            position, POSITION_INTEGER_BITS, POSITION_FRACTIONAL_BITS
+        )
+
+
+class SyncBatchDecoder(object):
+    """Decode sync packets drained in one tick into a `SYNC_DTYPE` array
+
+    Rows keep the payloads order. Fields a packet doesn't carry are NaN
+    (position, rotation, health, armor) or 0 (velocity, keys, flags, contact).
+    Malformed payloads are dropped and counted.
+
+    >>> decoder = SyncBatchDecoder()
+    >>> syncs = decoder.decode(drained_packets)
+    >>> syncs["position"][syncs["player"] == player]
+    """
+
+    def __init__(self) -> None:
+        self._bitstream = BitStream()
+        self._errors = 0
+        self._puresync = PacketID.PACKET_ID_PLAYER_PURESYNC.value
+        self._keysync = PacketID.PACKET_ID_PLAYER_KEYSYNC.value
+        self._lightsync = PacketID.PACKET_ID_LIGHTSYNC.value
+
+    def get_error_count(self) -> int:
+        """Get number of malformed payloads dropped"""
+        return self._errors
+
+    def is_sync_packet(self, packet_id: int) -> bool:
+        """Check if a packet id is handled by the decoder"""
+        return packet_id in (self._puresync, self._keysync, self._lightsync)
+
+    def decode(self, payloads: Iterable[SyncPayload]) -> np.ndarray:
+        """Decode sync payloads
+
+        Args:
+        -----
+            payloads (Iterable[SyncPayload]): (packet id, player binary address, payload)
+
+        Returns:
+        --------
+            np.ndarray: Structured array of `SYNC_DTYPE`
+        """
+        _bitstream = self._bitstream
+        _players: List[int] = []
+        _packet_ids: List[int] = []
+        _time_contexts: List[int] = []
+        _flags: List[int] = []
+        _keys: List[int] = []
+        _contacts: List[int] = []
+
+        # Raw quantized columns: (row indices, raw data)
+        _position_rows: List[int] = []
+        _positions = bytearray()
+        _rotation_rows: List[int] = []
+        _rotations: List[int] = []
+        _health_rows: List[int] = []
+        _healths: List[int] = []
+        _armors: List[int] = []
+        _velocity_rows: List[int] = []
+        _moduli: List[float] = []
+        _xnegs: List[bool] = []
+        _ys: List[int] = []
+        _zs: List[int] = []
+
+        for _packet_id, _player, _payload in payloads:
+            _row = len(_players)
+            _bitstream.refresh(_payload, readonly=True)
+            _time_context = _flag = _key = _contact = 0
+            try:
+                if _packet_id == self._puresync:
+                    _time_context = _bitstream.read_bits(8)
+                    _key = _bitstream.read_native_bits(KEYS_BITS)
+                    _flag = _bitstream.read_native_bits(PURESYNC_FLAGS_BITS)
+                    if _flag & PURESYNC_FLAG_HAS_CONTACT:
+                        _contact = _bitstream.read_native_bits(17)
+                    _position = _bitstream.read_bytes(_POSITION_BYTES)
+                    _rotation = _bitstream.read_native_bits(ROTATION_BITS)
+                    _velocity = None
+                    if _flag & PURESYNC_FLAG_SYNCING_VELOCITY and _bitstream.read_bit():
+                        _modulus = _bitstream.read_float()
+                        _xneg = _bitstream.read_bit()
+                        _y = (
+                            -1
+                            if _bitstream.read_bit()
+                            else _bitstream.read_native_bits(16)
+                        )
+                        _z = (
+                            -1
+                            if _bitstream.read_bit()
+                            else _bitstream.read_native_bits(16)
+                        )
+                        _velocity = (_modulus, _xneg, _y, _z)
+                    _health = _bitstream.read_native_bits(HEALTH_BITS)
+                    _armor = _bitstream.read_native_bits(ARMOR_BITS)
+
+                    _position_rows.append(_row)
+                    _positions += _position
+                    _rotation_rows.append(_row)
+                    _rotations.append(_rotation)
+                    if _velocity is not None:
+                        _velocity_rows.append(_row)
+                        _moduli.append(_velocity[0])
+                        _xnegs.append(_velocity[1])
+                        _ys.append(_velocity[2])
+                        _zs.append(_velocity[3])
+                    _health_rows.append(_row)
+                    _healths.append(_health)
+                    _armors.append(_armor)
+
+                elif _packet_id == self._keysync:
+                    _key = _bitstream.read_native_bits(KEYS_BITS)
+                    _flag = _bitstream.read_native_bits(KEYSYNC_FLAGS_BITS)
+
+                elif _packet_id == self._lightsync:
+                    _time_context = _bitstream.read_bits(8)
+                    _flag = _bitstream.read_native_bits(LIGHTSYNC_FLAGS_BITS)
+                    if _flag & LIGHTSYNC_FLAG_HEALTH:
+                        _health = _bitstream.read_native_bits(HEALTH_BITS)
+                        _armor = _bitstream.read_native_bits(ARMOR_BITS)
+                        _health_rows.append(_row)
+                        _healths.append(_health)
+                        _armors.append(_armor)
+                    if _flag & LIGHTSYNC_FLAG_POSITION:
+                        _position = _bitstream.read_bytes(_POSITION_BYTES)
+                        _position_rows.append(_row)
+                        _positions += _position
+                else:
+                    continue
+            except BitStreamError:
+                self._errors += 1
+                # Roll back the columns of the partially read payload
+                for _rows, _columns in (
+                    (_position_rows, ()),
+                    (_rotation_rows, (_rotations,)),
+                    (_velocity_rows, (_moduli, _xnegs, _ys, _zs)),
+                    (_health_rows, (_healths, _armors)),
+                ):
+                    if _rows and _rows[-1] == _row:
+                        _rows.pop()
+                        for _column in _columns:
+                            _column.pop()
+                del _positions[len(_position_rows) * _POSITION_BYTES :]
+                continue
+
+            _players.append(_player)
+            _packet_ids.append(_packet_id)
+            _time_contexts.append(_time_context)
+            _flags.append(_flag)
+            _keys.append(_key)
+            _contacts.append(_contact)
+
+        _syncs = np.zeros(len(_players), dtype=SYNC_DTYPE)
+        _syncs["player"] = _players
+        _syncs["packet_id"] = _packet_ids
+        _syncs["time_context"] = _time_contexts
+        _syncs["flags"] = _flags
+        _syncs["keys"] = _keys
+        _syncs["contact"] = _contacts
+        _syncs["position"] = np.nan
+        _syncs["rotation"] = np.nan
+        _syncs["health"] = np.nan
+        _syncs["armor"] = np.nan
+
+        if _position_rows:
+            _syncs["position"][_position_rows] = _decode_positions(_positions)
+        if _rotation_rows:
+            _syncs["rotation"][_rotation_rows] = -pi + np.asarray(
+                _rotations, dtype=np.float32
+            ) * np.float32(2 * pi / ((1 << ROTATION_BITS) - 1))
+        if _health_rows:
+            _syncs["health"][_health_rows] = np.asarray(_healths, dtype=np.float32) * (
+                MAX_HEALTH / ((1 << HEALTH_BITS) - 1)
+            )
+            _syncs["armor"][_health_rows] = np.asarray(_armors, dtype=np.float32) * (
+                MAX_ARMOR / ((1 << ARMOR_BITS) - 1)
+            )
+        if _velocity_rows:
+            _syncs["velocity"][_velocity_rows] = _decode_velocities(
+                _moduli, _xnegs, _ys, _zs
+            )
+        return _syncs
+
+
+def _decode_positions(data: bytearray) -> np.ndarray:
+    """Decode packed SFloatSync<14, 10> triplets (3 little endian bytes each)"""
+    _raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3, 3).astype(np.int32)
+    _values = _raw[..., 0] | (_raw[..., 1] << 8) | (_raw[..., 2] << 16)
+    _values = (_values ^ 0x800000) - 0x800000  # Sign extend 24 bits
+    return _values.astype(np.float32) / np.float32(1 << POSITION_FRACTIONAL_BITS)
+
+
+def _decode_velocities(
+    moduli: List[float], xnegs: List[bool], ys: List[int], zs: List[int]
+) -> np.ndarray:
+    """Decode SVelocitySync (modulus + normalized vector)"""
+    _ys = np.asarray(ys, dtype=np.float32)
+    _zs = np.asarray(zs, dtype=np.float32)
+    _y = np.where(_ys < 0, 0.0, _ys / np.float32(32767.5) - 1.0)
+    _z = np.where(_zs < 0, 0.0, _zs / np.float32(32767.5) - 1.0)
+    _x = np.sqrt(np.clip(1.0 - _y * _y - _z * _z, 0.0, None))
+    _x = np.where(np.asarray(xnegs, dtype=bool), -_x, _x)
+    return (
+        np.stack((_x, _y, _z), axis=1) * np.asarray(moduli, dtype=np.float32)[:, None]
+    )
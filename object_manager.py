@@ -3,7 +3,11 @@
 """
 
 from .vectors import Vector3
-from typing import Literal, Tuple
+from .spatial import spatial_index
+from .element_store import element_store
+from .element_ids import ElementID, element_ids
+from .errors import ElementDestroyedError, ElementStateError
+from typing import Literal, Optional, Tuple
 
 T = Literal[True]
 
@@ -30,19 +34,16 @@ class Interior:
         return ""
 
 
-class ElementID(object):
-    def __init__(self, value: int) -> None:
-        self.value = value
-
-
 class ObjBase(object):
     """
         Base objects for any object
+        (state stored in the `element_store` columns, see `ElementStore`)
+        `__id` is reserved in `element_ids`, None hands out a free one
     """
 
     def __init__(
         self,
-        __id:              ElementID,
+        __id:              Optional[ElementID],
         position:          Vector3,
         rotation:          Vector3,
         dimension: int | float = 0,
@@ -50,25 +51,53 @@ class ObjBase(object):
         alpha:     float | int = 100,
         isfrozen:  bool = False,
     ) -> None:
-        self.__id = __id
-        self._position = position
-        self._rotation = rotation
-        self._dimension = dimension
-        self._interior = interior
-        self._alpha = alpha
-        self._isfrozen = isfrozen
+        self.__id = (
+            element_ids.allocate(self)
+            if __id is None
+            else element_ids.reserve(__id, self)
+        )
+        try:
+            self._slot = element_store.allocate(
+                self,
+                position,
+                rotation,
+                _get_location_id(dimension),
+                _get_location_id(interior),
+                alpha,
+                isfrozen,
+            )
+        except ElementStateError:
+            element_ids.release(self.__id)
+            raise
+        spatial_index.insert(self, position, dimension, interior)
 
     def getID(self) -> ElementID:
         return self.__id
 
+    def getSlot(self) -> int:
+        """
+            Get Object row in the element store columns
+            >>> element_store.positions[myobj.getSlot()]
+        """
+        if self._slot is None:
+            raise ElementDestroyedError(f"{self.__id} has been destroyed")
+        return self._slot
+
+    def isDestroyed(self) -> bool:
+        """
+            Check if Object has been destroyed
+            >>> isdestroyed = myobj.isDestroyed()
+        """
+        return self._slot is None
+
     def setPosition(self, position: Vector3) -> T:
         """
             Set Player Position
             `Params:` Vector3
             >>> myobj.setPosition(Vector3(0, 0, 5))
         """
-        self._position = position
-        assert self._position == position
+        element_store.set_position(self.getSlot(), position)
+        spatial_index.update(self, position=position)
         return True
 
     def setRotation(self, rotation: Vector3) -> T:
@@ -77,18 +106,55 @@ class ObjBase(object):
             `Params:` Vector3
             >>> myobj.setRotation(Vector3(0, 0, 5))
         """
-        self._rotation = rotation
-        assert self._rotation == rotation
+        element_store.set_rotation(self.getSlot(), rotation)
         return True
 
     def setDimension(self, dimension: Dimension) -> T:
         """
             Set Object dimension
             `Params:` Dimension
-            >>> myobj.setRotation(Vector3(0, 0, 5))
+            >>> myobj.setDimension(2)
+        """
+        element_store.set_dimension(self.getSlot(), _get_location_id(dimension))
+        spatial_index.update(self, dimension=dimension)
+        return True
+
+    def setInterior(self, interior: Interior) -> T:
+        """
+            Set Object interior
+            `Params:` Interior
+            >>> myobj.setInterior(3)
+        """
+        element_store.set_interior(self.getSlot(), _get_location_id(interior))
+        spatial_index.update(self, interior=interior)
+        return True
+
+    def setAlpha(self, alpha: int) -> T:
+        """
+            Set Object alpha (0 - 255, raises ElementStateError out of range)
+            >>> myobj.setAlpha(120)
         """
-        self._dimension = dimension
-        assert self._dimension == dimension
+        element_store.set_alpha(self.getSlot(), alpha)
+        return True
+
+    def setFrozen(self, isfrozen: bool) -> T:
+        """
+            Freeze/Unfreeze Object
+            >>> myobj.setFrozen(True)
+        """
+        element_store.set_frozen(self.getSlot(), isfrozen)
+        return True
+
+    def destroy(self) -> T:
+        """
+            Remove the object from the world (spatial index, element store, element IDs)
+            >>> myobj.destroy()
+        """
+        _slot = self.getSlot()
+        self._slot = None
+        spatial_index.remove(self)
+        element_store.release(_slot, self)
+        element_ids.release(self.__id)
         return True
 
     def getDimension(self) -> int:
@@ -96,40 +162,52 @@ class ObjBase(object):
             Get Object Dimension
             >>> dimension = myobj.getDimension()
         """
-        return self._dimension
+        return int(element_store.dimensions[self.getSlot()])
 
     def getInterior(self) -> int:
         """
             Get Object Interior
             >>> interior = myobj.getInterior()
         """
-        return self._interior
+        return int(element_store.interiors[self.getSlot()])
+
+    def getAlpha(self) -> int:
+        """
+            Get Object Alpha
+            >>> alpha = myobj.getAlpha()
+        """
+        return int(element_store.alphas[self.getSlot()])
+
+    def isFrozen(self) -> bool:
+        """
+            Check if Object is frozen
+            >>> isfrozen = myobj.isFrozen()
+        """
+        return bool(element_store.frozen[self.getSlot()])
 
     def getPosition(self) -> Vector3:
         """
             Get Player Position
             >>> position = myobj.getPosition()
         """
-        return self._position
+        return element_store.get_position(self.getSlot())
 
     def getRotation(self) -> Vector3:
         """
             Get Player Rotation
             >>> roration = myobj.getRotation()
         """
-        return self._rotation
+        return element_store.get_rotation(self.getSlot())
 
-    def getDimension(self) -> Vector3:
-        """
-            Get Player Dimension
-            >>> dimension = myobj.getDimension()
-        """
-        return self._rotation
+
+def _get_location_id(location: Dimension | Interior | int) -> int:
+    return int(getattr(location, "id", location))
 
 
 class Object(ObjBase):
     def __init__(
         self,
+        __id:      Optional[ElementID],
         position: Vector3,
         rotation: Vector3,
         dimension: int | float = 0,
@@ -139,6 +217,7 @@ class Object(ObjBase):
         isfrozen:  bool = False
     ) -> None:
         super(Object, self).__init__(
+            __id,
             position,
             rotation,
             dimension,
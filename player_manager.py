@@ -2,7 +2,7 @@ from .vectors import Vector3
 from .object_manager import ObjBase, ElementID
 from .client_manager import Client
 from .team_manager import Team
-from typing import Literal
+from typing import Literal, Optional
 
 T = Literal[True]
 
@@ -10,7 +10,7 @@ T = Literal[True]
 class Player(ObjBase):
     def __init__(
         self,
-        __id: ElementID,
+        __id: Optional[ElementID],
         nick: str,
         position: Vector3,
         rotation: Vector3,
@@ -22,16 +22,14 @@ class Player(ObjBase):
         isfrozen: bool = False,
         skin: int = 0,
     ) -> None:
-        super().__init__(position, rotation, dimension, interior, alpha, isfrozen)
-        self._id = __id
+        super().__init__(
+            __id, position, rotation, dimension, interior, alpha, isfrozen
+        )
         self._nick = nick
         self._client = client
         self._team = team
         self._skin = skin
 
-    def getID(self) -> ElementID:
-        return self._id
-
     def getNick(self) -> str:
         return self._nick
 
@@ -40,3 +38,6 @@ class Player(ObjBase):
 
     def getTeam(self) -> Team:
         return self._team
+
+    def getClient(self) -> Client:
+        return self._client
@@ -11,10 +11,7 @@ from IronicMTA.resources.resource_info import ResourceInfo
 from IronicMTA.resources.resource_obj import Resource
 from IronicMTA.errors import ResourceFileError
 
-_dir = __file__.split("\\")[:-2]
-if _dir[0].endswith(":"):
-    _dir[0] += "\\"
-sys.path.insert(0, os.path.join(*_dir))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 class ResourceLoader(object):
@@ -134,6 +131,19 @@ class ResourceLoader(object):
         self._server.event.call("onResourceLoad", _resource_temp)
         return True
 
+    def unload_resource(self, resource: Resource) -> bool:
+        """Stop a resource (its packet handlers are unregistered)
+
+        Returns:
+            bool: False if the resource isn't loaded
+        """
+        if resource not in self._resources:
+            return False
+        self._resources.remove(resource)
+        self._server.packets.unregister_owner(resource)
+        self._server.event.call("onResourceStop", resource)
+        return True
+
     def _get_files(
         self, __value: Union[Any, bool, int, str], _resource: str
     ) -> List[ResourceFile]:
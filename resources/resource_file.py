@@ -1,13 +1,10 @@
 from IronicMTA.errors import ResourceFileError
 
 from typing import Literal
-from os.path import join, isfile, isdir, normpath
+from os.path import join, isfile, isdir, normpath, dirname, abspath
 from sys import path
 
-_dir = __file__.split('\\')[:-2]
-if _dir[0].endswith(':'):
-    _dir[0] += '\\'
-_basedir = join(*_dir)
+_basedir = dirname(dirname(abspath(__file__)))
 path.insert(0, _basedir)
 
 
@@ -3,18 +3,24 @@
 """
 
 import time
-from os.path import isfile, isdir, join
+from os.path import isfile, isdir, join, dirname, abspath, normpath
 from IronicMTA.common import AseVersion, BuildType
-from typing import List, Tuple, Literal
+from typing import Callable, Dict, Iterable, List, Tuple, Literal
 from IronicMTA.brodcast import BrodcastManager, PortChecker
 from IronicMTA.player_manager import Player
 from IronicMTA.settings import SettingsManager, SettingsModel
-from IronicMTA.core import NetworkWrapper
+from IronicMTA.core import Transport, PacketRegistry, get_transport
+from IronicMTA.network.packet_base import Packet
+from IronicMTA.network.send_queue import SendScheduler
+from IronicMTA.network.bandwidth import BandwidthBudget
+from IronicMTA.network.stats import NetworkStatsSampler
+from IronicMTA.network.interest import InterestManager
 from IronicMTA.httpserver import HTTPServer
 from IronicMTA.logger import Logger
 from IronicMTA.vectors import *
 from IronicMTA.limits import MAX_MAP_NAME_LENGTH, MAX_ASE_GAME_TYPE_LENGTH
 from IronicMTA.event import ServerEventHandler
+from IronicMTA.event_loop import ServerEventLoop
 from IronicMTA.resources import ResourceLoader, Resource
 from IronicMTA.errors import (
     MaxMapNameLength,
@@ -44,10 +50,7 @@ class Server(object):
         build_type: BuildType = BuildType.RELEASE,
     ) -> None:
         self._isrunning = False
-        _dir = main_file.replace("/", "\\").split("\\")[:-1]
-        if _dir[0].endswith(":"):
-            _dir[0] += "\\"
-        self._server_base_dir = join(*_dir)
+        self._server_base_dir = dirname(abspath(main_file))
         settings_file = join(self._server_base_dir, settings_file)
         self._settings_manager = SettingsManager(self)
         self._intialized = False
@@ -65,17 +68,36 @@ class Server(object):
 
         self._password = str(self._settings["server"]["password"])
 
-        log_file = join(self._server_base_dir, self._settings["log_file"]).replace(
-            "/", "\\"
-        )
+        log_file = normpath(join(self._server_base_dir, self._settings["log_file"]))
         self._logger = Logger(log_file)
-        self._netwrapper = NetworkWrapper(self)
+        self._netwrapper = get_transport(self._settings["network"]["transport"])(self)
+        self._send_scheduler = SendScheduler(
+            self,
+            self._settings["network"]["send_tick"],
+            BandwidthBudget(
+                self._settings["network"]["player_bandwidth"],
+                self._settings["network"]["player_bandwidth_burst"],
+            ),
+        )
+        self._stats_sampler = NetworkStatsSampler(
+            self,
+            self._settings["network"]["stats_interval"],
+            self._settings["network"]["stats_samples"],
+        )
 
         self._start_time: float
         self._map_name = self._settings["server"]["map_name"]
         self._game_type = self._settings["server"]["game_type"]
         self._players: List[Player] = []
         self._event_handler = ServerEventHandler()
+        self._packet_registry = PacketRegistry()
+        self._event_loop: ServerEventLoop | None = None
+        self._interest_manager = InterestManager(
+            self,
+            self._settings["network"]["stream_distance"],
+            self._settings["network"]["far_sync_rate"],
+            self._settings["network"]["relay_tick"],
+        )
 
         self._port_checker = PortChecker(self)
         self._brodcast_manager = BrodcastManager(self)
@@ -214,7 +236,10 @@ class Server(object):
         Start Http Server\n
         Serve resources, handle apis, ...
         """
-        self._http_server.start()
+        if self._event_loop is not None:
+            self._event_loop.spawn(self._http_server.serve(self._event_loop))
+        else:
+            self._http_server.start()
         self._logger.success(
             "HTTP Server Has Been Started Successfuly on "
             f"({self._settings_manager.get_server_address()[0]}:{self._settings_manager.get_http_port()}) "
@@ -243,6 +268,12 @@ class Server(object):
             self._logger.success("Server Network Has Been Started Successfuly!")
         else:
             self._logger.error("Failed To Start Server Network :(")
+        if self._settings["network"]["send_tick"] > 0:
+            self._send_scheduler.start()
+        if self._settings["network"]["stats_interval"] > 0:
+            self._stats_sampler.start()
+        if self._settings["network"]["puresync_relay"]:
+            self._interest_manager.start()
         self._event_handler.call("onServerNetworkStart", self, self._netwrapper)
         return True
 
@@ -250,18 +281,29 @@ class Server(object):
         """
         Start Server Packet Listening
         * Receive All the packets esnt by the client
+        * In asyncio mode, runs the server event loop until it's stopped
         """
+        if self._event_loop is not None:
+            return self._event_loop.run(self._netwrapper.listen_async())
         return self._netwrapper.start_listening()
 
-    def start(self) -> Literal[True]:
+    def start(self, asyncio_mode: bool = False) -> Literal[True]:
         """Start MTASA Server With All Services
 
+        Args:
+        -----
+            asyncio_mode (bool, optional): Run the packet pump, ASE sockets, HTTP server
+                                           and timers on one asyncio event loop instead
+                                           of a thread per service. Defaults to False.
+
         Returns:
         --------
             Literal[True]: If server has been started successfuly!
         """
         self._start_time = time.time()
         self._isrunning = True
+        if asyncio_mode:
+            self._event_loop = ServerEventLoop(self)
 
         self.start_server_brodcast()
         self.start_local_server_list_announcements()
@@ -278,12 +320,12 @@ class Server(object):
         self.start_listening()
         return True
 
-    def get_network(self) -> NetworkWrapper:
+    def get_network(self) -> Transport:
         """Get Server Network
 
         Returns:
         --------
-            NetworkWrapper: Network object
+            Transport: Network transport (NetworkWrapper or LoopbackTransport)
         """
         return self._netwrapper
 
@@ -312,6 +354,69 @@ class Server(object):
         """
         return self._players
 
+    def remove_player(self, player_binaddr: int) -> bool:
+        """Forget a disconnected player (quit or timeout)
+
+        The player element is destroyed, its queued packets, bandwidth budget
+        and puresync relay state are dropped.
+
+        Args:
+        -----
+            player_binaddr (int): Player binary address
+
+        Returns:
+        --------
+            bool: False if no player has that binary address
+        """
+        self._send_scheduler.remove_client(player_binaddr)
+        self._interest_manager.remove_player(player_binaddr)
+        for _player in self._players:
+            if _player.getClient().get_binary_address() == player_binaddr:
+                self._players.remove(_player)
+                _player.destroy()
+                return True
+        return False
+
+    def broadcast(
+        self,
+        packet: Packet,
+        players: Iterable[Player] | None = None,
+        predicate: Callable[[Player], bool] | None = None,
+    ) -> int:
+        """Send a packet to many players (the packet is built once)
+
+        Args:
+        -----
+            packet (Packet): Packet to send (not released)
+            players (Iterable[Player], optional): Recipients. Defaults to all the players.
+            predicate (Callable[[Player], bool], optional): Only send to the players it accepts
+
+        Returns:
+        --------
+            int: Number of players the packet has been sent to
+        """
+        _data = bytes(packet.build())
+        _recipients: Dict[int, List[int]] = {}
+        for _player in self._players if players is None else players:
+            if predicate is not None and not predicate(_player):
+                continue
+            _client = _player.getClient()
+            _recipients.setdefault(_client.get_bitstream_version(), []).append(
+                _client.get_binary_address()
+            )
+
+        _count = 0
+        for _bitstream_version, _binaddrs in _recipients.items():
+            _count += self._netwrapper.broadcast(
+                _binaddrs,
+                packet.get_id(),
+                _bitstream_version,
+                _data,
+                packet.get_reliability(),
+                packet.get_priority(),
+            )
+        return _count
+
     def get_player_count(self) -> int:
         """Get server player count"""
         try:
@@ -336,6 +441,37 @@ class Server(object):
             + "..."
         )
 
+    def get_send_scheduler(self) -> SendScheduler:
+        """Get Server outbound packets scheduler
+
+        Returns:
+        --------
+            SendScheduler: Tick based send scheduler (running if `send_tick` network setting > 0)
+        """
+        return self._send_scheduler
+
+    def get_stats_sampler(self) -> NetworkStatsSampler:
+        """Get Server network statistics sampler
+
+        Returns:
+        --------
+            NetworkStatsSampler: Network statistics time series (running if `stats_interval` network setting > 0)
+        """
+        return self._stats_sampler
+
+    def get_interest_manager(self) -> InterestManager:
+        """Get Server puresync relay interest manager
+
+        Returns:
+        --------
+            InterestManager: Puresync relay (running if `puresync_relay` network setting is true)
+        """
+        return self._interest_manager
+
+    def get_event_loop(self) -> ServerEventLoop | None:
+        """Get Server event loop (None if the server isn't running in asyncio mode)"""
+        return self._event_loop
+
     def get_logger(self) -> Logger:
         """Get Server Logger
 
@@ -401,6 +537,22 @@ class Server(object):
         self._resource_loader.load_resource_from_core_path(core_path)
         return True
 
+    def unload_resource(self, resource: Resource) -> bool:
+        """Stop Server Resource
+
+        Packet handlers registered with the resource as owner
+        (`server.packets.register(..., owner=resource)`) are unregistered.
+
+        Args:
+        -----
+            resource (Resource): Loaded resource
+
+        Returns:
+        --------
+            bool: False if the resource isn't loaded
+        """
+        return self._resource_loader.unload_resource(resource)
+
     @property
     def event(self) -> ServerEventHandler:
         """Server Event manager
@@ -410,3 +562,13 @@ class Server(object):
             EventHandler: All server registred events manager
         """
         return self._event_handler
+
+    @property
+    def packets(self) -> PacketRegistry:
+        """Server Packet handlers registry
+
+        Returns:
+        --------
+            PacketRegistry: Packet handlers registry (register handlers per packet id)
+        """
+        return self._packet_registry
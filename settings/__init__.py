@@ -8,6 +8,7 @@ import json
 from IronicMTA.settings.anticheat import AntiCheatSettings
 from IronicMTA.settings.databases import DatabasesSettings
 from IronicMTA.settings.http_server import HttpServerSettings
+from IronicMTA.settings.network import NetworkSettings
 from IronicMTA.settings.resources import ResourcesSettings
 from IronicMTA.settings.server import ServerSettings
 from IronicMTA.settings.version import VersionSettings
@@ -19,6 +20,7 @@ class SettingsModel(TypedDict):
 
     server: ServerSettings
     http_server: HttpServerSettings
+    network: NetworkSettings
     check_ports_before_start: bool
     anticheat: AntiCheatSettings
     version: VersionSettings
@@ -53,6 +55,26 @@ class SettingsManager(object):
                 "debug_http_port": 60000,
                 "max_http_connections": 32,
             },
+            "network": {
+                "transport": "ctypes",
+                "packet_workers": 0,
+                "pump_batch_size": 64,
+                "pump_min_sleep": 0.0005,
+                "pump_max_sleep": 0.01,
+                "executor_workers": 4,
+                "executor_max_pending": 64,
+                "send_tick": 0.0,
+                "player_bandwidth": 0,
+                "player_bandwidth_burst": 0,
+                "capture_file": "",
+                "stats_interval": 0.0,
+                "stats_samples": 300,
+                "stats_http": False,
+                "puresync_relay": False,
+                "relay_tick": 0.05,
+                "stream_distance": 300.0,
+                "far_sync_rate": 5,
+            },
             "check_ports_before_start": True,
             "anticheat": {"disabled_ac": [], "enabled_sd": []},
             "version": {
@@ -167,6 +189,9 @@ class SettingsManager(object):
         for key, value in self.default_settings.items():
             if not key in data.keys():
                 data[key.strip()] = value
+            elif isinstance(value, dict) and isinstance(data[key], dict):
+                for sub_key, sub_value in value.items():
+                    data[key].setdefault(sub_key, sub_value)
         return data
 
     def _strip_keys(self, data: dict) -> Dict[str, int | bool | None]:
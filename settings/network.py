@@ -0,0 +1,22 @@
+from typing import TypedDict
+
+
+class NetworkSettings(TypedDict):
+    transport: str
+    packet_workers: int
+    pump_batch_size: int
+    pump_min_sleep: float
+    pump_max_sleep: float
+    executor_workers: int
+    executor_max_pending: int
+    send_tick: float
+    player_bandwidth: int
+    player_bandwidth_burst: int
+    capture_file: str
+    stats_interval: float
+    stats_samples: int
+    stats_http: bool
+    puresync_relay: bool
+    relay_tick: float
+    stream_distance: float
+    far_sync_rate: int
\ No newline at end of file
@@ -0,0 +1,441 @@
+"""
+    Spatial index of world elements
+"""
+
+import heapq
+from itertools import count
+from math import floor, inf, sqrt
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .vectors import Vector3
+
+# Grid cell size (world units), about a streaming distance fraction
+SPATIAL_DEFAULT_CELL_SIZE = 64.0
+
+# (dimension, interior)
+PartitionKey = Tuple[int, int]
+CellKey = Tuple[int, int]
+
+
+class SpatialEntry(object):
+    """Indexed element position and location"""
+
+    __slots__ = ("element", "x", "y", "z", "partition", "cell")
+
+    def __init__(
+        self,
+        element: Any,
+        x: float,
+        y: float,
+        z: float,
+        partition: PartitionKey,
+        cell: CellKey,
+    ) -> None:
+        self.element = element
+        self.x = x
+        self.y = y
+        self.z = z
+        self.partition = partition
+        self.cell = cell
+
+
+class SpatialPartition(object):
+    """Grid cells of a (dimension, interior) pair"""
+
+    __slots__ = ("cells", "size", "min_x", "max_x", "min_y", "max_y")
+
+    def __init__(self) -> None:
+        self.cells: Dict[CellKey, Dict[Any, SpatialEntry]] = {}
+        self.size = 0
+        # Occupied cells bounds (only grows, bounds the nearest queries rings)
+        self.min_x = self.min_y = 1 << 62
+        self.max_x = self.max_y = -(1 << 62)
+
+    def add(self, entry: SpatialEntry) -> None:
+        _cell_x, _cell_y = entry.cell
+        _cell = self.cells.get(entry.cell)
+        if _cell is None:
+            _cell = self.cells[entry.cell] = {}
+            self.min_x = min(self.min_x, _cell_x)
+            self.max_x = max(self.max_x, _cell_x)
+            self.min_y = min(self.min_y, _cell_y)
+            self.max_y = max(self.max_y, _cell_y)
+        _cell[entry.element] = entry
+        self.size += 1
+
+    def discard(self, entry: SpatialEntry) -> None:
+        _cell = self.cells[entry.cell]
+        del _cell[entry.element]
+        if not _cell:
+            del self.cells[entry.cell]
+        self.size -= 1
+
+
+class SpatialIndex(object):
+    """Uniform grid spatial index
+
+    Elements are bucketed per (dimension, interior) in square cells of
+    `cell_size` world units (on the x/y plane), so queries only visit the
+    cells they overlap instead of every element. Elements (`ObjBase`)
+    register themselves in the default `spatial_index` and are moved on
+    `setPosition`, `setDimension` and `setInterior`.
+
+    >>> spatial_index.query_radius(Vector3(0, 0, 3), 50.0)
+    >>> spatial_index.query_nearest(player.getPosition(), 5, player.getDimension())
+
+    Args:
+    -----
+        cell_size (float, optional): Grid cell size (world units)
+    """
+
+    def __init__(self, cell_size: float = SPATIAL_DEFAULT_CELL_SIZE) -> None:
+        self._cell_size = cell_size
+        self._inverse_cell_size = 1.0 / cell_size
+        self._partitions: Dict[PartitionKey, SpatialPartition] = {}
+        self._entries: Dict[Any, SpatialEntry] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, element: Any) -> bool:
+        return element in self._entries
+
+    def get_cell_size(self) -> float:
+        return self._cell_size
+
+    def insert(
+        self, element: Any, position: Vector3, dimension: int = 0, interior: int = 0
+    ) -> SpatialEntry:
+        """Index an element (moves it if it's already indexed)
+
+        Args:
+        -----
+            element (Any): Element to index (hashable)
+            position (Vector3): Element position
+            dimension (int, optional): Element dimension
+            interior (int, optional): Element interior
+
+        Returns:
+        --------
+            SpatialEntry: Element entry
+        """
+        with self._lock:
+            _entry = self._entries.get(element)
+            if _entry is not None:
+                self._move(
+                    _entry,
+                    position.x,
+                    position.y,
+                    position.z,
+                    (_get_id(dimension), _get_id(interior)),
+                )
+                return _entry
+            _entry = SpatialEntry(
+                element,
+                position.x,
+                position.y,
+                position.z,
+                (_get_id(dimension), _get_id(interior)),
+                self._get_cell(position.x, position.y),
+            )
+            self._entries[element] = _entry
+            self._get_partition(_entry.partition).add(_entry)
+            return _entry
+
+    def update(
+        self,
+        element: Any,
+        position: Optional[Vector3] = None,
+        dimension: Optional[int] = None,
+        interior: Optional[int] = None,
+    ) -> bool:
+        """Move an indexed element (unchanged fields are kept)
+
+        Returns:
+        --------
+            bool: False if the element isn't indexed
+        """
+        with self._lock:
+            _entry = self._entries.get(element)
+            if _entry is None:
+                return False
+            _dimension, _interior = _entry.partition
+            self._move(
+                _entry,
+                _entry.x if position is None else position.x,
+                _entry.y if position is None else position.y,
+                _entry.z if position is None else position.z,
+                (
+                    _dimension if dimension is None else _get_id(dimension),
+                    _interior if interior is None else _get_id(interior),
+                ),
+            )
+            return True
+
+    def remove(self, element: Any) -> bool:
+        """Remove an element from the index
+
+        Returns:
+        --------
+            bool: False if the element wasn't indexed
+        """
+        with self._lock:
+            _entry = self._entries.pop(element, None)
+            if _entry is None:
+                return False
+            self._discard(_entry)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions = {}
+            self._entries = {}
+
+    def get_entry(self, element: Any) -> Optional[SpatialEntry]:
+        return self._entries.get(element)
+
+    def query_partition(self, dimension: int = 0, interior: int = 0) -> List[Any]:
+        """Get all the elements of a dimension and interior"""
+        with self._lock:
+            _partition = self._partitions.get((_get_id(dimension), _get_id(interior)))
+            if _partition is None:
+                return []
+            return [
+                _element for _cell in _partition.cells.values() for _element in _cell
+            ]
+
+    def query_radius(
+        self, position: Vector3, radius: float, dimension: int = 0, interior: int = 0
+    ) -> List[Any]:
+        """Get the elements within `radius` of `position` (3D distance)
+
+        Args:
+        -----
+            position (Vector3): Center
+            radius (float): Radius (world units)
+            dimension (int, optional): Dimension
+            interior (int, optional): Interior
+
+        Returns:
+        --------
+            List[Any]: Elements (unordered)
+        """
+        _x, _y, _z = position.x, position.y, position.z
+        _radius2 = radius * radius
+        _elements = []
+        with self._lock:
+            for _entry in self._iter_area(
+                _x - radius, _y - radius, _x + radius, _y + radius, dimension, interior
+            ):
+                _dx, _dy, _dz = _entry.x - _x, _entry.y - _y, _entry.z - _z
+                if _dx * _dx + _dy * _dy + _dz * _dz <= _radius2:
+                    _elements.append(_entry.element)
+        return _elements
+
+    def query_box(
+        self,
+        min_corner: Vector3,
+        max_corner: Vector3,
+        dimension: int = 0,
+        interior: int = 0,
+    ) -> List[Any]:
+        """Get the elements inside an axis aligned box (bounds included)
+
+        Returns:
+        --------
+            List[Any]: Elements (unordered)
+        """
+        _min_z, _max_z = min_corner.z, max_corner.z
+        _elements = []
+        with self._lock:
+            for _entry in self._iter_area(
+                min_corner.x,
+                min_corner.y,
+                max_corner.x,
+                max_corner.y,
+                dimension,
+                interior,
+            ):
+                if (
+                    min_corner.x <= _entry.x <= max_corner.x
+                    and min_corner.y <= _entry.y <= max_corner.y
+                    and _min_z <= _entry.z <= _max_z
+                ):
+                    _elements.append(_entry.element)
+        return _elements
+
+    def query_nearest(
+        self,
+        position: Vector3,
+        k: int = 1,
+        dimension: int = 0,
+        interior: int = 0,
+        max_distance: float = inf,
+        exclude: Any = None,
+    ) -> List[Tuple[float, Any]]:
+        """Get the `k` nearest elements of `position`
+
+        Visits the grid in rings around `position` and stops as soon
+        as no unvisited cell can hold a nearer element.
+
+        Args:
+        -----
+            position (Vector3): Center
+            k (int, optional): Number of elements
+            dimension (int, optional): Dimension
+            interior (int, optional): Interior
+            max_distance (float, optional): Ignore the elements further than that
+            exclude (Any, optional): Element to skip (ex: the querying element)
+
+        Returns:
+        --------
+            List[Tuple[float, Any]]: (distance, element) nearest first
+        """
+        _x, _y, _z = position.x, position.y, position.z
+        _max_distance2 = max_distance * max_distance
+        # Max heap of the k nearest: (-squared distance, order, element)
+        _nearest: List[Tuple[float, int, Any]] = []
+        _order = count()
+
+        def _visit(cell: Dict[Any, SpatialEntry]) -> None:
+            for _entry in cell.values():
+                if _entry.element is exclude:
+                    continue
+                _dx, _dy, _dz = _entry.x - _x, _entry.y - _y, _entry.z - _z
+                _distance2 = _dx * _dx + _dy * _dy + _dz * _dz
+                if _distance2 > _max_distance2:
+                    continue
+                if len(_nearest) < k:
+                    heapq.heappush(
+                        _nearest, (-_distance2, next(_order), _entry.element)
+                    )
+                elif _distance2 < -_nearest[0][0]:
+                    heapq.heapreplace(
+                        _nearest, (-_distance2, next(_order), _entry.element)
+                    )
+
+        with self._lock:
+            _partition = self._partitions.get((_get_id(dimension), _get_id(interior)))
+            if _partition is None or k <= 0:
+                return []
+            _cells = _partition.cells
+            _center_x, _center_y = self._get_cell(_x, _y)
+            _max_ring = max(
+                abs(_center_x - _partition.min_x),
+                abs(_center_x - _partition.max_x),
+                abs(_center_y - _partition.min_y),
+                abs(_center_y - _partition.max_y),
+            )
+            _ring = 0
+            while _ring <= _max_ring:
+                if 8 * _ring >= len(_cells):  # Sparse grid, visit the cells directly
+                    for (_cell_x, _cell_y), _cell in _cells.items():
+                        if (
+                            max(abs(_cell_x - _center_x), abs(_cell_y - _center_y))
+                            >= _ring
+                        ):
+                            _visit(_cell)
+                    break
+                for _cell_key in _iter_ring(_center_x, _center_y, _ring):
+                    _cell = _cells.get(_cell_key)
+                    if _cell is not None:
+                        _visit(_cell)
+                # Unvisited cells are at least `_ring` cells away
+                _bound = _ring * self._cell_size
+                if _bound > max_distance or (
+                    len(_nearest) == k and -_nearest[0][0] <= _bound * _bound
+                ):
+                    break
+                _ring += 1
+
+        _nearest.sort(reverse=True)
+        return [(sqrt(-_distance2), _element) for _distance2, _, _element in _nearest]
+
+    def _iter_area(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+        dimension: int,
+        interior: int,
+    ) -> Iterator[SpatialEntry]:
+        _partition = self._partitions.get((_get_id(dimension), _get_id(interior)))
+        if _partition is None:
+            return
+        _cells = _partition.cells
+        _min_cell_x, _min_cell_y = self._get_cell(min_x, min_y)
+        _max_cell_x, _max_cell_y = self._get_cell(max_x, max_y)
+        if (_max_cell_x - _min_cell_x + 1) * (_max_cell_y - _min_cell_y + 1) > len(
+            _cells
+        ):  # Area bigger than the occupied cells, visit them directly
+            for (_cell_x, _cell_y), _cell in _cells.items():
+                if (
+                    _min_cell_x <= _cell_x <= _max_cell_x
+                    and _min_cell_y <= _cell_y <= _max_cell_y
+                ):
+                    yield from _cell.values()
+            return
+        for _cell_x in range(_min_cell_x, _max_cell_x + 1):
+            for _cell_y in range(_min_cell_y, _max_cell_y + 1):
+                _cell = _cells.get((_cell_x, _cell_y))
+                if _cell is not None:
+                    yield from _cell.values()
+
+    def _move(
+        self,
+        entry: SpatialEntry,
+        x: float,
+        y: float,
+        z: float,
+        partition: PartitionKey,
+    ) -> None:
+        entry.x, entry.y, entry.z = x, y, z
+        _cell = self._get_cell(x, y)
+        if _cell == entry.cell and partition == entry.partition:
+            return
+        self._discard(entry)
+        entry.cell = _cell
+        entry.partition = partition
+        self._get_partition(partition).add(entry)
+
+    def _discard(self, entry: SpatialEntry) -> None:
+        _partition = self._partitions[entry.partition]
+        _partition.discard(entry)
+        if not _partition.size:
+            del self._partitions[entry.partition]
+
+    def _get_partition(self, key: PartitionKey) -> SpatialPartition:
+        _partition = self._partitions.get(key)
+        if _partition is None:
+            _partition = self._partitions[key] = SpatialPartition()
+        return _partition
+
+    def _get_cell(self, x: float, y: float) -> CellKey:
+        return (
+            floor(x * self._inverse_cell_size),
+            floor(y * self._inverse_cell_size),
+        )
+
+
+def _iter_ring(center_x: int, center_y: int, ring: int) -> Iterator[CellKey]:
+    if ring == 0:
+        yield center_x, center_y
+        return
+    for _x in range(center_x - ring, center_x + ring + 1):
+        yield _x, center_y - ring
+        yield _x, center_y + ring
+    for _y in range(center_y - ring + 1, center_y + ring):
+        yield center_x - ring, _y
+        yield center_x + ring, _y
+
+
+def _get_id(value: Any) -> int:
+    # Dimension/Interior objects or plain ids
+    return int(getattr(value, "id", value))
+
+
+# Default index, world elements register in it
+spatial_index = SpatialIndex()
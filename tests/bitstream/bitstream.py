@@ -18,3 +18,16 @@ print(f"String1: '{new_stream.read_string()}'")
 print(f"String2: '{new_stream.read_string()}'")
 print(f"String2: '{new_stream.read_string()}'")
 print(f"String2: '{new_stream.read_string()}'")
+
+bit_stream = BitStream()
+bit_stream.write_bit(True)
+bit_stream.write_bits(5, 3)
+bit_stream.write_string("Unaligned String")
+bit_stream.write_bits(0x1234, 13)
+
+new_bit_stream = BitStream(bit_stream.get_bytes())
+print(f"Packed Size: {bit_stream.get_size()} bytes ({bit_stream.get_number_of_bits_used()} bits)")
+print(f"Bit: {new_bit_stream.read_bit()}")
+print(f"Bits: {new_bit_stream.read_bits(3) == 5}")
+print(f"Unaligned String: '{new_bit_stream.read_string()}'")
+print(f"Bits: {new_bit_stream.read_bits(13) == 0x1234}")
@@ -0,0 +1,73 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.vectors import Vector3
+
+
+def reread(bitstream: BitStream) -> BitStream:
+    return BitStream(bitstream.get_bytes(), readonly=True)
+
+
+def test_bits():
+    bitstream = BitStream()
+    bitstream.write_bit(True)
+    bitstream.write_bits(0b101, 3)
+    bitstream.write_native_bits(0x1ABCD, 17)
+    bitstream.write_native_bits(-5, 12)
+    bitstream.write_string("deathmatch")
+    reader = reread(bitstream)
+    assert reader.read_bit() is True
+    assert reader.read_bits(3) == 0b101
+    assert reader.read_native_bits(17) == 0x1ABCD
+    assert reader.read_native_bits(12, signed=True) == -5
+    assert reader.read_string() == "deathmatch"
+
+
+def test_compressed():
+    for num_bytes, unsigned, values in (
+        (4, True, (0, 1, 15, 16, 255, 256, 65535, 0x12345678, 0xFFFFFFFF)),
+        (2, True, (0, 7, 300, 0xFFFF)),
+        (4, False, (0, -1, -16, -17, 127, -128, -70000, 0x7FFFFFFF)),
+    ):
+        bitstream = BitStream()
+        bitstream.write_bit(True)  # Unaligned values
+        for value in values:
+            bitstream.write_compressed(value, num_bytes, unsigned)
+        reader = reread(bitstream)
+        assert reader.read_bit()
+        for value in values:
+            assert reader.read_compressed(num_bytes, unsigned) == value, value
+
+    # High zero bytes cost one bit each
+    bitstream = BitStream()
+    bitstream.write_compressed(5)
+    assert bitstream.write_offset == 3 + 5
+
+
+def test_quantized():
+    bitstream = BitStream()
+    positions = [Vector3(1.5, -2.25, 3000.125), Vector3(-8000.0, 0.0, 7.0009765625)]
+    bitstream.write_positions(positions)
+    bitstream.write_float_as_bits(100.0, 0.0, 255.0, 8)
+    bitstream.write_float_as_bits(4.0, -3.14159, 3.14159, 16, True)  # Wrapped
+    bitstream.write_rotations([Vector3(90.0, 180.0, 359.0)])
+    bitstream.write_norm_vector(0.6, 0.0, -0.8)
+    reader = reread(bitstream)
+    for expected, value in zip(positions, reader.read_positions(2)):
+        assert expected.distance(value) < 1 / 1024 * 2, value
+    assert abs(reader.read_float_as_bits(0.0, 255.0, 8) - 100.0) <= 1.0
+    assert abs(reader.read_float_as_bits(-3.14159, 3.14159, 16) - (4.0 - 6.28318)) < 1e-3
+    rotation = reader.read_rotation()
+    assert Vector3(90.0, 180.0, 359.0).distance(rotation) < 0.02, rotation
+    normal = reader.read_norm_vector()
+    assert Vector3(0.6, 0.0, -0.8).distance(normal) < 1e-3, normal
+    assert reader.get_number_of_unread_bits() < 8
+
+
+if __name__ == "__main__":
+    for _test in (test_bits, test_compressed, test_quantized):
+        _test()
+        print(f"{_test.__name__}: OK")
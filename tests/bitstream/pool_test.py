@@ -0,0 +1,36 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler.io import BitStream, BitStreamPool, bitstream_pool
+from IronicMTA.network.packets import Packet_PlayerDisconnected
+
+
+def test_pool():
+    pool = BitStreamPool(size=1)
+    bitstream = pool.acquire()
+    bitstream.write_string("data")
+    assert pool.release(bitstream)
+    assert not pool.release(bitstream)  # Double release ignored
+    assert pool.get_idle_count() == 1
+    first, second = pool.acquire(), pool.acquire()
+    assert first is not second
+    assert first.write_offset == 0
+
+
+def test_received_packets_release():
+    bitstream = BitStream()
+    bitstream.write_native_bits(0, 32)
+    bitstream.write_string("bye")
+    idle = bitstream_pool.get_idle_count()
+    for _ in range(100):
+        packet = Packet_PlayerDisconnected(bitstream.get_bytes())
+        assert packet.reason == "bye"
+    assert bitstream_pool.get_idle_count() == idle
+
+
+if __name__ == "__main__":
+    for _test in (test_pool, test_received_packets_release):
+        _test()
+        print(f"{_test.__name__}: OK")
@@ -0,0 +1,106 @@
+import os
+import sys
+from types import SimpleNamespace
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.network.packet_schema import (
+    PacketSchema,
+    BYTE,
+    USHORT,
+    UINT16,
+    INT16,
+    UINT32,
+    INT32,
+    UINT64,
+    INT64,
+    FLOAT,
+    DOUBLE,
+    BIT,
+    STRING,
+    fixed_bytes,
+    fixed_string,
+    capped_bytes,
+)
+from IronicMTA.network.packets import Packet_PlayerJoinData
+from IronicMTA.network.packets.join.modname import Packet_PlayerJoinModName
+
+
+def test_all_fields():
+    schema = PacketSchema(
+        ("byte", BYTE),
+        ("ushort", USHORT),
+        ("flag", BIT),  # Breaks the fixed size run (unaligned fields after it)
+        ("uint16", UINT16),
+        ("int16", INT16),
+        ("uint32", UINT32),
+        ("int32", INT32),
+        ("uint64", UINT64),
+        ("int64", INT64),
+        ("float", FLOAT),
+        ("double", DOUBLE),
+        ("string", STRING),
+        ("raw", fixed_bytes(4)),
+        ("chars", fixed_string(6)),
+        ("capped", capped_bytes(16)),
+    )
+    packet = SimpleNamespace(
+        byte=200,
+        ushort=0xABCD,
+        flag=True,
+        uint16=0x1234,
+        int16=-1234,
+        uint32=0xDEADBEEF,
+        int32=-123456,
+        uint64=0x0123456789ABCDEF,
+        int64=-(1 << 40),
+        float=1.5,
+        double=-2.25,
+        string="hello",
+        raw=b"\x00\x01\x02\x03",
+        chars="serial",
+        capped=b"capped data",
+    )
+    bitstream = BitStream()
+    schema.encode(bitstream, packet)
+    decoded = SimpleNamespace()
+    schema.decode(BitStream(bitstream.get_bytes(), readonly=True), decoded)
+    for name in schema.get_field_names():
+        value = getattr(decoded, name)
+        if isinstance(value, memoryview):  # Byte fields are views in read only mode
+            value = bytes(value)
+        assert value == getattr(packet, name), name
+
+
+def test_packet_bytes():
+    # Same bytes as tests/bitstream/packets_test.py
+    assert list(Packet_PlayerJoinModName(117).build()) == [
+        117, 0, 10, 0, 100, 101, 97, 116, 104, 109, 97, 116, 99, 104
+    ]
+
+
+def test_join_data():
+    fields = dict(
+        net_version=0x0AB,
+        mta_version=0x0106,
+        bitstream_version=171,
+        player_version="1.6.0-9.22204.0",
+        optional_update=False,
+        game_version=0,
+        nickname="player".ljust(22, "\x00"),
+        password=bytes(16),
+        serial="A" * 32,
+    )
+    bitstream = BitStream()
+    Packet_PlayerJoinData.schema.encode(bitstream, SimpleNamespace(**fields))
+    packet = Packet_PlayerJoinData(bitstream.get_bytes())
+    for name, value in fields.items():
+        decoded = getattr(packet, name)
+        assert (bytes(decoded) if name == "password" else decoded) == value, name
+
+
+if __name__ == "__main__":
+    for _test in (test_all_fields, test_packet_bytes, test_join_data):
+        _test()
+        print(f"{_test.__name__}: OK")
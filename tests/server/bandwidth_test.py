@@ -0,0 +1,73 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
+from IronicMTA.network.bandwidth import BandwidthBudget, TokenBucket, SEND, DEFER, DROP
+from IronicMTA.network.packet_cache import PrebuiltPacket
+from IronicMTA.network.send_queue import SendScheduler
+from IronicMTA.tests.server.stubs import StubServer
+
+
+def packet(
+    data: bytes, priority: PacketPriority, reliability: PacketReliability
+) -> PrebuiltPacket:
+    return PrebuiltPacket(PacketID.PACKET_ID_PLAYER_PURESYNC, priority, reliability, data)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(100.0, 50.0)
+    assert bucket.consume(80)  # Goes in debt
+    assert not bucket.consume(1)
+    assert bucket.consume(1, force=True)
+    bucket.refill(bucket.updated + 10.0)
+    assert bucket.tokens == 50.0  # Capped to the burst
+
+
+def test_decisions():
+    budget = BandwidthBudget(rate=1, burst=10)
+    high, medium = PacketPriority.HIGH, PacketPriority.MEDIUM
+    assert budget.decide(1, medium, PacketReliability.RELIABLE, 20) == SEND
+    assert budget.decide(1, high, PacketReliability.RELIABLE, 20) == SEND
+    assert budget.decide(1, medium, PacketReliability.UNRELIABLE, 20) == DROP
+    assert budget.decide(1, medium, PacketReliability.RELIABLE, 20) == DEFER
+    assert budget.decide(2, medium, PacketReliability.RELIABLE, 20) == SEND  # Own budget
+    assert budget.get_player_rate(3) == 1
+    budget.set_player_rate(3, 0)
+    assert budget.get_player_rate(3) == 0  # Unlimited
+    stats = budget.get_player_stats(1)
+    assert (stats.sent_packets, stats.dropped_packets, stats.deferred_packets) == (2, 1, 1)
+
+
+def test_scheduler_budget():
+    server = StubServer()
+    budget = BandwidthBudget(rate=1, burst=100)
+    scheduler = SendScheduler(server, budget=budget)
+    reliable, unreliable = PacketReliability.RELIABLE, PacketReliability.UNRELIABLE
+    medium = PacketPriority.MEDIUM
+    scheduler.queue(1, 171, packet(b"A" * 80, medium, reliable))
+    scheduler.queue(1, 171, packet(b"B" * 80, medium, unreliable))
+    scheduler.queue(1, 171, packet(b"C" * 10, medium, reliable))
+    scheduler.queue(1, 171, packet(b"D" * 200, PacketPriority.HIGH, reliable))
+    scheduler.queue(1, 171, packet(b"E" * 10, PacketPriority.LOW, unreliable))
+
+    # High priority always sent, the rest is over budget
+    assert scheduler.flush() == 1
+    assert server.network.sent[0][3][:1] == b"D"
+    stats = budget.get_player_stats(1)
+    assert (stats.sent_packets, stats.dropped_packets, stats.deferred_packets) == (1, 2, 2)
+    assert scheduler.get_pending_count(1) == 2
+
+    # Deferred reliable packets go first on the next tick, in order
+    budget.set_player_rate(1, 1, 100)
+    server.network.sent.clear()
+    assert scheduler.flush() == 2
+    assert [_packet[3][:1] for _packet in server.network.sent] == [b"A", b"C"]
+    assert scheduler.get_pending_count() == 0
+
+
+if __name__ == "__main__":
+    for _test in (test_token_bucket, test_decisions, test_scheduler_budget):
+        _test()
+        print(f"{_test.__name__}: OK")
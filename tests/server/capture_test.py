@@ -0,0 +1,133 @@
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler.capture import (
+    CAPTURE_MAGIC,
+    CAPTURE_VERSION,
+    PacketCapture,
+    PacketReplayer,
+    _HEADER,
+    _RECORD,
+)
+from IronicMTA.errors import PacketHandlerError
+
+PACKETS = [(34, 1, b"puresync"), (33, 2, b""), (180, 0xFFFFFFFF, bytes(range(256)))]
+
+
+def capture(directory: str, packets=PACKETS) -> str:
+    path = os.path.join(directory, "capture.bin")
+    _capture = PacketCapture(path)
+    for packet_id, player, payload in packets:
+        _capture.record(packet_id, player, memoryview(payload))
+    _capture.close()
+    return path
+
+
+def read(path: str):
+    replayer = PacketReplayer(path)
+    packets = [
+        (_timestamp, _player, _packet_id, bytes(_payload))
+        for _timestamp, _player, _packet_id, _payload in replayer
+    ]
+    replayer.close()
+    return packets
+
+
+def test_round_trip():
+    with TemporaryDirectory() as directory:
+        start = time.time()
+        path = capture(directory)
+        end = time.time()
+        packets = read(path)
+    assert [(_id, _player, _payload) for _, _player, _id, _payload in packets] == PACKETS
+    timestamps = [_packet[0] for _packet in packets]
+    assert timestamps == sorted(timestamps) and start <= timestamps[0] <= timestamps[-1] <= end
+
+
+def test_truncated():
+    with TemporaryDirectory() as directory:
+        path = capture(directory)
+        size = os.path.getsize(path)
+        with open(path, "r+b") as _file:
+            _file.truncate(size - 1)  # Last payload cut
+        assert [_packet[1:3] for _packet in read(path)] == [(1, 34), (2, 33)]
+        with open(path, "r+b") as _file:
+            _file.truncate(_HEADER.size + _RECORD.size + len(b"puresync") + 3)  # Record header cut
+        assert [_packet[1:3] for _packet in read(path)] == [(1, 34)]
+        with open(path, "r+b") as _file:
+            _file.truncate(_HEADER.size)
+        assert read(path) == []
+
+
+def test_invalid_file():
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "capture.bin")
+        for content in (
+            b"",
+            b"IMTA",
+            b"NOTACAP\x01",
+            _HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION + 1),
+        ):
+            with open(path, "wb") as _file:
+                _file.write(content)
+            try:
+                PacketReplayer(path)
+            except PacketHandlerError:
+                pass
+            else:
+                raise AssertionError(f"PacketHandlerError not raised for {content!r}")
+
+
+def test_record_after_close():
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "capture.bin")
+        _capture = PacketCapture(path)
+        _capture.record(34, 1, b"kept")
+        _capture.close()
+        assert _capture.is_closed()
+        _capture.record(34, 1, b"ignored")
+        assert _capture.get_count() == 1
+        assert [_packet[3] for _packet in read(path)] == [b"kept"]
+
+
+def test_replay_speed():
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "capture.bin")
+        with open(path, "wb") as _file:  # Packets recorded 0.1s apart
+            _file.write(_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION))
+            for _index in range(3):
+                _file.write(_RECORD.pack(1000.0 + _index * 0.1, 1, 34, 1))
+                _file.write(bytes((_index,)))
+        replayer = PacketReplayer(path)
+        replayed = []
+
+        def process(packet_id, player, payload):
+            replayed.append((time.perf_counter(), packet_id, player, bytes(payload)))
+
+        start = time.perf_counter()
+        assert replayer.replay(process, speed=2.0) == 3
+        elapsed = time.perf_counter() - start
+        assert [_packet[3] for _packet in replayed] == [b"\x00", b"\x01", b"\x02"]
+        # 0.2s recorded at twice the speed
+        assert 0.09 <= elapsed < 0.5, elapsed
+        assert replayed[1][0] - replayed[0][0] >= 0.045
+        start = time.perf_counter()
+        assert replayer.replay(lambda *_args: None) == 3
+        assert time.perf_counter() - start < 0.05  # As fast as possible
+        replayer.close()
+
+
+if __name__ == "__main__":
+    for _test in (
+        test_round_trip,
+        test_truncated,
+        test_invalid_file,
+        test_record_after_close,
+        test_replay_speed,
+    ):
+        _test()
+        print(f"{_test.__name__}: OK")
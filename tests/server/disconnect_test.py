@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA import Server
+from IronicMTA.client_manager import Client
+from IronicMTA.core.packet_handler import PacketHandler
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
+from IronicMTA.network.packet_cache import PrebuiltPacket
+from IronicMTA.network.sync_decoder import write_puresync
+from IronicMTA.player_manager import Player
+from IronicMTA.vectors import Vector3
+
+
+def loopback_server(directory: str) -> Server:
+    with open(os.path.join(directory, "settings.json"), "w") as _file:
+        json.dump({"network": {"transport": "loopback", "player_bandwidth": 1000}}, _file)
+    return Server(main_file=os.path.join(directory, "main.py"), settings_file="settings.json")
+
+
+def join(server: Server) -> Player:
+    binaddr = server.get_network().connect().get_binary_address()
+    player = Player(
+        None, "player", Vector3(0, 0, 0), Vector3(0, 0, 0), Client(binaddr, 171, server), None
+    )
+    server.get_all_players().append(player)
+    # Queued packet, bandwidth counters and relay state of the player
+    server.get_send_scheduler().queue(
+        binaddr,
+        171,
+        PrebuiltPacket(
+            PacketID.PACKET_ID_PLAYER_PURESYNC,
+            PacketPriority.MEDIUM,
+            PacketReliability.RELIABLE,
+            b"sync",
+        ),
+    )
+    server.get_send_scheduler().get_bandwidth_budget().decide(
+        binaddr, PacketPriority.MEDIUM, PacketReliability.RELIABLE, 4
+    )
+    bitstream = BitStream()
+    write_puresync(bitstream, 1, 0, 0, Vector3(0, 0, 0), 0.0, Vector3(0, 0, 0), 100.0, 0.0)
+    server.get_interest_manager().on_puresync(
+        PacketID.PACKET_ID_PLAYER_PURESYNC.value, binaddr, bitstream.get_bytes()
+    )
+    server.get_interest_manager().update()
+    return player
+
+
+def test_disconnect_clears_player_state():
+    with TemporaryDirectory() as directory:
+        server = loopback_server(directory)
+        handler = PacketHandler(server)
+        scheduler = server.get_send_scheduler()
+        budget = scheduler.get_bandwidth_budget()
+        interest = server.get_interest_manager()
+        quitting, timing_out, staying = join(server), join(server), join(server)
+        for player, packet_id in (
+            (quitting, PacketID.PACKET_ID_PLAYER_QUIT),
+            (timing_out, PacketID.PACKET_ID_PLAYER_TIMEOUT),
+        ):
+            binaddr = player.getClient().get_binary_address()
+            assert scheduler.get_pending_count(binaddr) == 1
+            assert binaddr in budget.get_all_stats() and interest.get_player(binaddr) is not None
+            handler.process(packet_id.value, binaddr, b"")
+            assert scheduler.get_pending_count(binaddr) == 0
+            assert binaddr not in budget.get_all_stats()
+            assert interest.get_player(binaddr) is None
+            assert player not in server.get_all_players() and player.isDestroyed()
+        binaddr = staying.getClient().get_binary_address()
+        assert server.get_all_players() == [staying]
+        assert scheduler.get_pending_count(binaddr) == 1 and interest.get_player(binaddr) is not None
+        assert not server.remove_player(1000)
+        assert server.remove_player(binaddr) and server.get_all_players() == []
+        handler.stop()
+
+
+if __name__ == "__main__":
+    for _test in (test_disconnect_clears_player_state,):
+        _test()
+        print(f"{_test.__name__}: OK")
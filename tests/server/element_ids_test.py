@@ -0,0 +1,79 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.element_ids import ElementID, ElementIDAllocator
+from IronicMTA.errors import ElementIDError, ElementIDLimitReached
+
+
+def test_stale_id():
+    allocator = ElementIDAllocator(4)
+    first = allocator.allocate("first")
+    assert allocator.get(first) == "first"
+    assert allocator.release(first)
+    assert not allocator.release(first)  # Already released
+    second = allocator.allocate("second")
+    # Same raw ID, new generation: the old ID doesn't resolve to the new element
+    assert second.value == first.value and second != first
+    assert allocator.get(first) is None and not allocator.is_valid(first)
+    assert not allocator.release(first)
+    assert allocator.get(second) == "second"
+    assert allocator.get_by_value(first.value) == "second"
+    assert allocator.get_id(first.value) == second
+
+
+def test_fifo_reuse():
+    allocator = ElementIDAllocator(8)
+    ids = [allocator.allocate(_element) for _element in range(8)]
+    for _id in (ids[5], ids[2], ids[7]):
+        allocator.release(_id)
+    # Released IDs are reused as late as possible, in release order
+    assert [allocator.allocate(object()).value for _ in range(3)] == [5, 2, 7]
+
+
+def test_limit():
+    allocator = ElementIDAllocator(2)
+    allocator.allocate("a")
+    second = allocator.allocate("b")
+    assert allocator.get_free_count() == 0
+    try:
+        allocator.allocate("c")
+    except ElementIDLimitReached:
+        pass
+    else:
+        raise AssertionError("ElementIDLimitReached not raised")
+    allocator.release(second)
+    assert allocator.allocate("c").value == second.value
+    assert len(allocator) == 2
+
+
+def test_reserve():
+    allocator = ElementIDAllocator(16)
+    assert allocator.reserve(5, "root") == ElementID(5)
+    for value in (5, 16, -1):  # In use, out of range
+        try:
+            allocator.reserve(value, "other")
+        except ElementIDError:
+            pass
+        else:
+            raise AssertionError(f"ElementIDError not raised for {value}")
+    # IDs skipped by the reservation are handed out first
+    assert [allocator.allocate(object()).value for _ in range(6)] == [0, 1, 2, 3, 4, 6]
+    allocator.release(allocator.get_id(2))
+    assert allocator.reserve(2, "again").generation == 1
+
+
+def test_bitstream():
+    element_id = ElementID(0x1ABCD, 3)
+    assert int(element_id) == 0x1ABCD and element_id.getID() == 0x1ABCD
+    bitstream = BitStream()
+    bitstream.write_elementid(element_id)
+    assert BitStream(bitstream.get_bytes(), readonly=True).read_elementid() == 0x1ABCD
+
+
+if __name__ == "__main__":
+    for _test in (test_stale_id, test_fifo_reuse, test_limit, test_reserve, test_bitstream):
+        _test()
+        print(f"{_test.__name__}: OK")
@@ -0,0 +1,143 @@
+import os
+import sys
+from threading import Thread
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.element_ids import element_ids
+from IronicMTA.element_store import ElementStore, element_store
+from IronicMTA.errors import ElementDestroyedError, ElementStateError
+from IronicMTA.object_manager import Object
+from IronicMTA.vectors import Vector3
+
+
+def raises(error, function, *args) -> bool:
+    try:
+        function(*args)
+    except error:
+        return True
+    return False
+
+
+def test_release_owner():
+    store = ElementStore(2)
+    first, second = object(), object()
+    slot = store.allocate(first, Vector3(1, 2, 3), Vector3(0, 0, 0))
+    assert store.release(slot, first)
+    assert store.allocate(second, Vector3(4, 5, 6), Vector3(0, 0, 0)) == slot  # Slot reused
+    # The old owner can't free the slot of the element that reuses it
+    assert not store.release(slot, first)
+    assert store.get_element(slot) is second
+    assert store.get_position(slot) == Vector3(4, 5, 6)
+
+
+def test_grow():
+    store = ElementStore(1)
+    elements = [object() for _ in range(5)]
+    slots = [
+        store.allocate(_element, Vector3(_i, 0, 0), Vector3(0, 0, 0))
+        for _i, _element in enumerate(elements)
+    ]
+    assert store.get_capacity() >= 5 and len(store) == 5
+    for _i, _slot in enumerate(slots):
+        assert store.get_element(_slot) is elements[_i]
+        assert store.get_position(_slot) == Vector3(_i, 0, 0)
+
+
+class GrowingStore(ElementStore):
+    """Grows the columns from another thread when a writer loads `positions`"""
+
+    def __init__(self, capacity: int) -> None:
+        self.grow_on_load = False
+        self.grower = None
+        super(GrowingStore, self).__init__(capacity)
+
+    @property
+    def positions(self):
+        _positions = self._positions
+        if self.grow_on_load:
+            self.grow_on_load = False
+            self.grower = Thread(
+                target=self.allocate, args=(object(), Vector3(0, 0, 0), Vector3(0, 0, 0))
+            )
+            self.grower.start()
+            self.grower.join(0.2)  # Returns once grown, times out if the writer holds the lock
+        return _positions
+
+    @positions.setter
+    def positions(self, positions) -> None:
+        self._positions = positions
+
+
+def test_writes_during_grow():
+    store = GrowingStore(2)
+    moved = object()
+    slot = store.allocate(moved, Vector3(0, 0, 0), Vector3(0, 0, 0))
+    # Row written by allocate while another allocation grows the columns
+    store.grow_on_load = True
+    created = store.allocate(object(), Vector3(1, 2, 3), Vector3(0, 0, 0))
+    store.grower.join()
+    assert store.get_capacity() == 4
+    assert store.get_position(created) == Vector3(1, 2, 3)
+    # Row written by a setter while another allocation grows the columns
+    store.allocate(object(), Vector3(0, 0, 0), Vector3(0, 0, 0))  # Full again
+    store.grow_on_load = True
+    store.set_position(slot, Vector3(4, 5, 6))
+    store.grower.join()
+    assert store.get_capacity() == 8
+    assert store.get_position(slot) == Vector3(4, 5, 6)
+
+
+def test_ranges():
+    store = ElementStore(2)
+    element = object()
+    for args in ((70000, 0, 255), (0, 256, 255), (0, 0, 300), (-1, 0, 255)):
+        assert raises(
+            ElementStateError, store.allocate, element, Vector3(0, 0, 0), Vector3(0, 0, 0), *args
+        ), args
+    assert len(store) == 0  # Nothing allocated on error
+    slot = store.allocate(element, Vector3(0, 0, 0), Vector3(0, 0, 0), 65535, 255, 255)
+    assert raises(ElementStateError, store.set_dimension, slot, 65536)
+    assert raises(ElementStateError, store.set_interior, slot, 256)
+    assert raises(ElementStateError, store.set_alpha, slot, -1)
+    assert (store.dimensions[slot], store.interiors[slot], store.alphas[slot]) == (65535, 255, 255)
+
+
+def test_destroyed_object():
+    first = Object(None, Vector3(0, 0, 0), Vector3(0, 0, 0))
+    slot, first_id = first.getSlot(), first.getID()
+    first.destroy()
+    assert first.isDestroyed()
+    second = Object(None, Vector3(7, 8, 9), Vector3(0, 0, 0), dimension=3)
+    assert second.getSlot() == slot  # Slot reused
+    # The destroyed object doesn't read or write the reusing object state
+    assert raises(ElementDestroyedError, first.getPosition)
+    assert raises(ElementDestroyedError, first.setPosition, Vector3(1, 1, 1))
+    assert raises(ElementDestroyedError, first.destroy)
+    assert second.getPosition() == Vector3(7, 8, 9) and second.getDimension() == 3
+    assert not element_ids.is_valid(first_id)
+    second.destroy()
+
+
+def test_object_range():
+    count = len(element_ids)
+    assert raises(ElementStateError, Object, None, Vector3(0, 0, 0), Vector3(0, 0, 0), 70000)
+    assert len(element_ids) == count  # The element ID is released
+    obj = Object(None, Vector3(0, 0, 0), Vector3(0, 0, 0))
+    assert raises(ElementStateError, obj.setInterior, 256)
+    assert raises(ElementStateError, obj.setAlpha, 1000)
+    assert element_store.get_element(obj.getSlot()) is obj
+    obj.destroy()
+
+
+if __name__ == "__main__":
+    for _test in (
+        test_release_owner,
+        test_grow,
+        test_writes_during_grow,
+        test_ranges,
+        test_destroyed_object,
+        test_object_range,
+    ):
+        _test()
+        print(f"{_test.__name__}: OK")
@@ -0,0 +1,122 @@
+import os
+import sys
+from random import Random
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.client_manager import Client
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.network.interest import InterestManager
+from IronicMTA.network.sync_decoder import write_puresync
+from IronicMTA.player_manager import Player
+from IronicMTA.tests.server.stubs import StubServer
+from IronicMTA.vectors import Vector3
+
+PURESYNC = PacketID.PACKET_ID_PLAYER_PURESYNC.value
+
+
+def puresync(position: Vector3, time_context: int = 1) -> bytes:
+    bitstream = BitStream()
+    write_puresync(
+        bitstream, time_context, 0, 0, position, 0.0, Vector3(0, 0, 0), 100.0, 0.0
+    )
+    return bitstream.get_bytes()
+
+
+def relay_all(manager: InterestManager, positions) -> None:
+    for binaddr, position in positions.items():
+        manager.on_puresync(PURESYNC, binaddr, puresync(position))
+
+
+def test_neighbors_match_brute_force():
+    random = Random(3)
+    server = StubServer()
+    manager = InterestManager(
+        server, stream_distance=100.0, far_sync_rate=0, encode=lambda _b, _p: bytes(_p)
+    )
+    positions = {}
+    for binaddr in range(1, 201):
+        positions[binaddr] = Vector3(random.uniform(-400, 400), random.uniform(-400, 400), 0.0)
+        manager.set_player_location(binaddr, dimension=binaddr % 2)
+    for _ in range(5):  # Players move, neighbor sets are patched incrementally
+        for binaddr in positions:
+            _position = positions[binaddr]
+            positions[binaddr] = Vector3(
+                _position.x + random.uniform(-30, 30), _position.y + random.uniform(-30, 30), 0.0
+            )
+        relay_all(manager, positions)
+        manager.update()
+    for binaddr, position in positions.items():
+        expected = {
+            _other
+            for _other, _position in positions.items()
+            if _other != binaddr
+            and _other % 2 == binaddr % 2
+            and _position.distance(position) <= 100.0
+        }
+        # Neighbors are refreshed once a player moved more than update_distance
+        assert manager.get_neighbors(binaddr) == expected, binaddr
+
+
+def test_near_and_far_relay():
+    server = StubServer()
+    manager = InterestManager(
+        server, stream_distance=100.0, far_sync_rate=4, encode=lambda _b, _p: bytes(_p)
+    )
+    positions = {1: Vector3(0, 0, 0), 2: Vector3(50, 0, 0), 3: Vector3(1000, 0, 0)}
+    far_sync = puresync(positions[3])
+    far = 0
+    for tick in range(40):
+        manager.on_puresync(PURESYNC, 1, puresync(positions[1]))
+        manager.on_puresync(PURESYNC, 2, puresync(positions[2]))
+        if tick % 2 == 1:  # Sender 3 syncs every other tick
+            manager.on_puresync(PURESYNC, 3, far_sync)
+        server.network.sent.clear()
+        manager.update()
+        recipients = [_packet[0] for _packet in server.network.sent]
+        assert recipients.count(1) >= 1 and recipients.count(2) >= 1  # 1 <-> 2 every tick
+        far += sum(
+            1 for _packet in server.network.sent if _packet[0] == 1 and _packet[3] == far_sync
+        )
+    # Far players get one sync of 3 every 4 ticks whatever its sync cadence
+    assert 9 <= far <= 10, far
+
+
+def test_remove_player():
+    server = StubServer()
+    manager = InterestManager(server, stream_distance=100.0, encode=lambda _b, _p: bytes(_p))
+    relay_all(manager, {1: Vector3(0, 0, 0), 2: Vector3(10, 0, 0)})
+    manager.update()
+    assert manager.get_neighbors(1) == {2}
+    assert manager.remove_player(2)
+    assert manager.get_neighbors(1) == set()
+    assert not manager.remove_player(2)
+
+
+def test_default_encoder():
+    server = StubServer()
+    manager = InterestManager(server, stream_distance=100.0, far_sync_rate=0)
+    player = Player(None, "player", Vector3(0, 0, 0), Vector3(0, 0, 0), Client(1, 171, server), None)
+    server.players.append(player)
+    relay_all(manager, {1: Vector3(0, 0, 0), 2: Vector3(10, 0, 0)})
+    server.network.sent.clear()
+    manager.update()
+    # 2 has no player (not joined): its syncs aren't relayed
+    assert [_packet[0] for _packet in server.network.sent] == [2]
+    reader = BitStream(server.network.sent[0][3], readonly=True)
+    assert reader.read_elementid() == player.getID().value
+    assert reader.read_byte() == 1  # Time context
+    assert reader.read_compressed(2) == 0  # Latency
+    player.destroy()
+
+
+if __name__ == "__main__":
+    for _test in (
+        test_neighbors_match_brute_force,
+        test_near_and_far_relay,
+        test_remove_player,
+        test_default_encoder,
+    ):
+        _test()
+        print(f"{_test.__name__}: OK")
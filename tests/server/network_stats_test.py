@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA import Server
+from IronicMTA.core.transport import BandwidthStatistics
+from IronicMTA.httpserver.core import NETWORK_STATS_PATH
+from IronicMTA.network import stats
+from IronicMTA.network.stats import NetworkStatsSampler, RingBuffer
+from IronicMTA.tests.server.stubs import StubServer
+
+
+class StatsNetwork(object):
+    """Transport with settable bandwidth counters"""
+
+    def __init__(self) -> None:
+        self.statistics = BandwidthStatistics()
+
+    def get_bandwidth_statistics(self) -> BandwidthStatistics:
+        return self.statistics
+
+
+class StatsServer(StubServer):
+    def __init__(self) -> None:
+        super(StatsServer, self).__init__()
+        self.network = StatsNetwork()
+
+
+class Clock(object):
+    """`time` module stand-in (`time.time()` returns `now`)"""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def test_ring_buffer():
+    buffer = RingBuffer(3)
+    assert len(buffer) == 0 and buffer.get_values() == [] and buffer.get_last(-1.0) == -1.0
+    assert buffer.get_average() == 0.0 and buffer.get_max() == 0.0
+    for value in (1.0, 2.0):
+        buffer.append(value)
+    assert buffer.get_values() == [1.0, 2.0]
+    for value in (3.0, 4.0, 5.0):  # Wraps around, oldest values overwritten
+        buffer.append(value)
+    assert len(buffer) == 3
+    assert buffer.get_values() == [3.0, 4.0, 5.0]
+    assert buffer.get_values(2) == [4.0, 5.0] and buffer.get_values(10) == [3.0, 4.0, 5.0]
+    assert buffer.get_last() == 5.0
+    assert buffer.get_average() == 4.0 and buffer.get_average(2) == 4.5
+    assert buffer.get_max(1) == 5.0
+
+
+def test_sampler_rates():
+    server = StatsServer()
+    counters = server.network.statistics
+    sampler = NetworkStatsSampler(server, interval=1.0, size=2)
+    clock = Clock(100.0)
+    _time, stats.time = stats.time, clock
+    try:
+        counters.llOutgoingUDPByteCount = 1000
+        assert sampler.sample() is None  # First sample only records the counters
+        clock.now = 102.0
+        counters.llOutgoingUDPByteCount = 5000
+        counters.llIncomingUDPPacketCount = 10
+        counters.threadCPUTimes.fTotalCPUPercent = 12.5
+        sample = sampler.sample()
+        assert sample["outgoing_bytes"] == 2000.0 and sample["incoming_packets"] == 5.0
+        assert sample["cpu_total"] == 12.5
+        clock.now = 103.0
+        counters.llOutgoingUDPByteCount = 100  # Transport restarted
+        assert sampler.sample()["outgoing_bytes"] == 100.0
+        clock.now = 104.0
+        sampler.sample()
+    finally:
+        stats.time = _time
+    assert sampler.get_timestamps() == [103.0, 104.0]  # Last `size` samples
+    assert sampler.get_series("outgoing_bytes") == [100.0, 0.0]
+    assert sampler.get_peaks()["outgoing_bytes"] == 100.0
+    assert sampler.get_averages(1)["outgoing_bytes"] == 0.0
+    _dict = sampler.as_dict(1)
+    assert _dict["samples"] == 2 and _dict["timestamps"] == [104.0]
+    assert _dict["series"]["outgoing_bytes"] == [0.0]
+
+
+def stats_server(directory: str, network: dict) -> Server:
+    with open(os.path.join(directory, "settings.json"), "w") as _file:
+        json.dump({"network": dict(transport="loopback", **network)}, _file)
+    return Server(main_file=os.path.join(directory, "main.py"), settings_file="settings.json")
+
+
+def get(server: Server, path: str):
+    return server.get_http_server()._get_message(f"GET {path} HTTP/1.1\r\n\r\n")
+
+
+def test_stats_route():
+    with TemporaryDirectory() as directory:
+        server = stats_server(directory, {"stats_http": True, "stats_interval": 1.0})
+        sampler = server.get_stats_sampler()
+        sampler.sample()
+        sampler.sample()
+        message, status, _, content_type = get(server, NETWORK_STATS_PATH + "?samples=1")
+        assert (status, content_type) == (200, "application/json")
+        stats_dict = json.loads(message)
+        assert stats_dict["interval"] == 1.0 and len(stats_dict["timestamps"]) <= 1
+        assert get(server, NETWORK_STATS_PATH)[1] == 200
+        for samples in ("x", "-1", "1.5"):
+            response = get(server, f"{NETWORK_STATS_PATH}?samples={samples}")
+            assert response[1:3] == (400, "Bad Request"), samples
+        server.get_http_server().close()
+
+
+def test_stats_route_opt_in():
+    with TemporaryDirectory() as directory:
+        server = stats_server(directory, {})  # Defaults: no sampler, no route
+        assert server.get_settings()["network"]["stats_interval"] == 0
+        assert get(server, NETWORK_STATS_PATH) is None
+        server.get_http_server().close()
+    with TemporaryDirectory() as directory:
+        server = stats_server(directory, {"stats_http": True})  # Sampler still off
+        assert get(server, NETWORK_STATS_PATH) is None
+        server.get_http_server().close()
+
+
+if __name__ == "__main__":
+    for _test in (
+        test_ring_buffer,
+        test_sampler_rates,
+        test_stats_route,
+        test_stats_route_opt_in,
+    ):
+        _test()
+        print(f"{_test.__name__}: OK")
@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA import Server
+from IronicMTA.common import BITSTREAM_VERSION
+from IronicMTA.core.packet_handler import PacketHandler
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.network.packet_cache import PacketCache
+from IronicMTA.network.packets.join.modname import Packet_PlayerJoinModName
+
+
+def fresh_build(*params) -> bytes:
+    packet = Packet_PlayerJoinModName(*params)
+    try:
+        return bytes(packet.build())
+    finally:
+        packet.release()
+
+
+def test_built_once():
+    cache = PacketCache()
+    first = cache.get(Packet_PlayerJoinModName, 117)
+    assert cache.get(Packet_PlayerJoinModName, 117) is first
+    assert cache.get_stats() == {"hits": 1, "misses": 1, "size": 1}
+    assert first.get_id() == PacketID.PACKET_ID_MOD_NAME
+    assert first.build() == fresh_build(117)
+    assert list(first.build()) == [117, 0, 10, 0, 100, 101, 97, 116, 104, 109, 97, 116, 99, 104]
+
+
+def test_different_params():
+    cache = PacketCache()
+    first = cache.get(Packet_PlayerJoinModName, 117)
+    second = cache.get(Packet_PlayerJoinModName, 118)
+    assert second is not first and cache.get_stats()["misses"] == 2
+    assert (first.build(), second.build()) == (fresh_build(117), fresh_build(118))
+    assert first.build() != second.build()
+    assert cache.is_cached(Packet_PlayerJoinModName, 118)
+    assert cache.invalidate(Packet_PlayerJoinModName, 118) == 1
+    assert not cache.is_cached(Packet_PlayerJoinModName, 118)
+    assert cache.get(Packet_PlayerJoinModName, 117) is first
+    assert cache.invalidate(Packet_PlayerJoinModName) == 1 and cache.get_size() == 0
+
+
+def test_eviction():
+    cache = PacketCache(max_size=2)
+    for version in (1, 2, 3):
+        cache.get(Packet_PlayerJoinModName, version)
+    assert cache.get_size() == 2
+    assert not cache.is_cached(Packet_PlayerJoinModName, 1)  # Oldest entry evicted
+    assert cache.is_cached(Packet_PlayerJoinModName, 3)
+
+
+def test_send_result():
+    with TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "settings.json"), "w") as _file:
+            json.dump({"network": {"transport": "loopback"}}, _file)
+        server = Server(main_file=os.path.join(directory, "main.py"), settings_file="settings.json")
+        handler = PacketHandler(server)
+        client = server.get_network().connect()
+        binaddr = client.get_binary_address()
+        assert handler.send_cached(binaddr, Packet_PlayerJoinModName, BITSTREAM_VERSION) is True
+        assert handler.send(binaddr, Packet_PlayerJoinModName(BITSTREAM_VERSION)) is True
+        assert [_packet[1] for _packet in client.receive()] == [fresh_build(BITSTREAM_VERSION)] * 2
+        server.get_network().send = lambda **kwargs: False  # Transport refusing the packet
+        assert handler.send_cached(binaddr, Packet_PlayerJoinModName, BITSTREAM_VERSION) is False
+        assert handler.send(binaddr, Packet_PlayerJoinModName(BITSTREAM_VERSION)) is False
+        handler.stop()
+        server.get_http_server().close()
+
+
+if __name__ == "__main__":
+    for _test in (test_built_once, test_different_params, test_eviction, test_send_result):
+        _test()
+        print(f"{_test.__name__}: OK")
@@ -0,0 +1,147 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler.registry import PacketRegistry
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.errors import PacketHandlerError
+from IronicMTA.event.server import ServerEventHandler
+from IronicMTA.resources import ResourceLoader
+
+PURESYNC = PacketID.PACKET_ID_PLAYER_PURESYNC
+KEYSYNC = PacketID.PACKET_ID_PLAYER_KEYSYNC
+
+
+def recorder(calls, name, handled=False):
+    def _handler(packet_id, player, payload):
+        calls.append(name)
+        return handled
+
+    return _handler
+
+
+def test_order_and_first():
+    registry = PacketRegistry()
+    calls = []
+    registry.register(PURESYNC, recorder(calls, "a"))
+    registry.register(PURESYNC.value, recorder(calls, "b"))
+    registry.register(PURESYNC, recorder(calls, "first"), first=True)
+    assert not registry.dispatch(PURESYNC.value, 1, b"")
+    assert calls == ["first", "a", "b"]
+    assert registry.is_handled(PURESYNC.value) and not registry.is_handled(KEYSYNC.value)
+    assert not registry.is_handled(1000)
+    try:
+        registry.register(256, recorder(calls, "bad"))
+    except PacketHandlerError:
+        pass
+    else:
+        raise AssertionError("PacketHandlerError not raised")
+
+
+def test_handled_stops_chain():
+    registry = PacketRegistry()
+    calls = []
+
+    @registry.on(PURESYNC)
+    def _handled(packet_id, player, payload):
+        calls.append((packet_id, player, payload))
+        return True
+
+    registry.register(PURESYNC, recorder(calls, "after"))
+    registry.register_fallback(recorder(calls, "fallback"))
+    assert registry.dispatch(PURESYNC.value, 7, b"data")
+    assert calls == [(PURESYNC.value, 7, b"data")]
+
+
+def test_fallbacks():
+    registry = PacketRegistry()
+    calls = []
+    registry.register(PURESYNC, recorder(calls, "unhandled"))
+    registry.register_fallback(recorder(calls, "fallback", handled=True))
+    registry.register_fallback(recorder(calls, "never"))
+    assert registry.dispatch(PURESYNC.value, 1, b"")
+    assert registry.dispatch(1000, 1, b"")  # Out of range ids only go to fallbacks
+    assert calls == ["unhandled", "fallback", "fallback"]
+
+
+def test_unregister():
+    registry = PacketRegistry()
+    calls = []
+    handler = recorder(calls, "a")
+    owner = object()
+    registry.register(PURESYNC, handler, owner=owner)
+    assert registry.unregister(PURESYNC, handler)
+    assert not registry.unregister(PURESYNC, handler)
+    assert registry.get_handlers(PURESYNC) == ()
+    # The owner entry went with the handler, re-registering it unowned is kept
+    registry.register(PURESYNC, handler)
+    assert registry.unregister_owner(owner) == 0
+    assert registry.get_handlers(PURESYNC) == (handler,)
+
+
+def test_unregister_owner():
+    registry = PacketRegistry()
+    calls = []
+    shared, own = recorder(calls, "shared"), recorder(calls, "own")
+    first, second = object(), object()
+    registry.register(PURESYNC, shared, owner=first)
+    registry.register(PURESYNC, shared, owner=second)
+    registry.register(KEYSYNC, own, owner=first)
+    registry.register_fallback(own, owner=first)
+    assert registry.unregister_owner(first) == 3
+    # The handler `second` registered is still there
+    assert registry.get_handlers(PURESYNC) == (shared,)
+    assert registry.get_handlers(KEYSYNC) == ()
+    assert not registry.dispatch(KEYSYNC.value, 1, b"")
+    assert registry.unregister_owner(first) == 0
+    assert registry.unregister_owner(second) == 1
+    assert registry.get_handlers(PURESYNC) == ()
+
+
+class StubResourceServer(object):
+    """Server with no resource folders"""
+
+    def __init__(self) -> None:
+        self.packets = PacketRegistry()
+        self.event = ServerEventHandler()
+
+    def get_settings(self):
+        return {"resources": {"resource_cores_files": [], "resources_folders": []}}
+
+    def get_base_dir(self) -> str:
+        return ""
+
+
+def test_resource_stop():
+    server = StubResourceServer()
+    loader = ResourceLoader(server)
+    resource, other = object(), object()
+    loader.get_all_resources().extend((resource, other))
+    handler = recorder([], "handler")
+    server.packets.register(PURESYNC, handler, owner=resource)
+    server.packets.register(KEYSYNC, handler, owner=other)
+    stopped = []
+
+    @server.event.onResourceStop
+    def _on_stop(stopped_resource):
+        stopped.append(stopped_resource)
+
+    assert loader.unload_resource(resource)
+    assert not loader.unload_resource(resource)
+    assert stopped == [resource]
+    assert server.packets.get_handlers(PURESYNC) == ()
+    assert server.packets.get_handlers(KEYSYNC) == (handler,)
+
+
+if __name__ == "__main__":
+    for _test in (
+        test_order_and_first,
+        test_handled_stops_chain,
+        test_fallbacks,
+        test_unregister,
+        test_unregister_owner,
+        test_resource_stop,
+    ):
+        _test()
+        print(f"{_test.__name__}: OK")
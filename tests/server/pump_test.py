@@ -0,0 +1,128 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler import pump
+from IronicMTA.core.packet_handler.pump import PacketPump
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.core.transport import LoopbackTransport
+from IronicMTA.tests.server.stubs import StubServer
+
+PURESYNC = PacketID.PACKET_ID_PLAYER_PURESYNC.value
+
+
+class Sleeper(object):
+    """`time` module stand-in (`time.sleep()` only records the delays)"""
+
+    def __init__(self) -> None:
+        self.sleeps = []
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+
+
+class RecordingLogger(object):
+    def __init__(self) -> None:
+        self.warnings = []
+
+    def warning(self, message: str) -> None:
+        self.warnings.append(message)
+
+
+def loopback_pump(**kwargs):
+    transport = LoopbackTransport(StubServer())
+    transport.init()
+    transport.start()
+    received = []
+    _pump = PacketPump(
+        transport.receive_batch,
+        lambda packet_id, player, content: received.append((packet_id, player, content)),
+        **kwargs,
+    )
+    return transport, _pump, received
+
+
+def test_batch_draining():
+    transport, _pump, received = loopback_pump(batch_size=4)
+    client = transport.connect()
+    for _index in range(10):
+        client.send(PURESYNC, bytes([_index]))
+    assert [_pump.poll() for _ in range(4)] == [4, 4, 2, 0]
+    assert [_packet[2] for _packet in received] == [bytes([_index]) for _index in range(10)]
+    assert received[0][:2] == (PURESYNC, client.get_binary_address())
+    assert transport.get_pending_count() == 0 and _pump.get_last_packet_index() == 9
+    stats = _pump.get_stats()
+    assert (stats.packets, stats.batches, stats.max_batch, stats.empty_polls) == (10, 3, 4, 1)
+    assert stats.lost == 0 and stats.duplicates == 0
+
+
+def test_backoff():
+    transport, _pump, _ = loopback_pump(min_sleep=0.001, max_sleep=0.005)
+    client = transport.connect()
+    sleeper = Sleeper()
+    _time, pump.time = pump.time, sleeper
+    try:
+        for _ in range(5):  # Idle: 1, 2, 4 ms then capped at `max_sleep`
+            _pump.backoff(_pump.poll())
+        assert sleeper.sleeps == [0.001, 0.002, 0.004, 0.005, 0.005]
+        client.send(PURESYNC, b"sync")
+        _pump.backoff(_pump.poll())  # Traffic: no sleep, backoff reset
+        assert len(sleeper.sleeps) == 5
+        _pump.backoff(_pump.poll())
+        assert sleeper.sleeps[-1] == 0.001
+    finally:
+        pump.time = _time
+    assert _pump.get_stats().sleeps == 6
+
+
+def test_index_reset():
+    transport, _, _ = loopback_pump()
+    backend = [transport]
+    logger = RecordingLogger()
+    received = []
+    _pump = PacketPump(
+        lambda max_packets, last_index: backend[0].receive_batch(max_packets, last_index),
+        lambda packet_id, player, content: received.append(content),
+        reset_window=64,
+        logger=logger,
+    )
+    client = transport.connect()
+    for _ in range(100):
+        client.send(PURESYNC, b"before")
+    while _pump.poll():
+        pass
+    assert _pump.get_last_packet_index() == 99
+
+    # Backend restarted: its packet counter starts again from 0
+    restarted, _, _ = loopback_pump()
+    backend[0] = restarted
+    client = restarted.connect()
+    for _ in range(3):
+        client.send(PURESYNC, b"after")
+    assert _pump.poll() == 3
+    assert received[100:] == [b"after"] * 3
+    stats = _pump.get_stats()
+    assert stats.index_resets == 1 and stats.duplicates == 0
+    assert _pump.get_last_packet_index() == 2
+    assert len(logger.warnings) == 1 and "99 to 0" in logger.warnings[0]
+
+
+def test_duplicates_and_lost():
+    batches = [[(PURESYNC, 1, 5, b"a"), (PURESYNC, 1, 5, b"a"), (PURESYNC, 1, 8, b"b")]]
+    batches.append([(PURESYNC, 1, 7, b"late"), (PURESYNC, 1, 9, b"c")])
+    received = []
+    _pump = PacketPump(
+        lambda max_packets, last_index: batches.pop(0) if batches else [],
+        lambda packet_id, player, content: received.append(content),
+    )
+    assert _pump.poll() == 2 and _pump.poll() == 1
+    assert received == [b"a", b"b", b"c"]
+    stats = _pump.get_stats()
+    assert (stats.duplicates, stats.lost, stats.index_resets) == (2, 2, 0)
+
+
+if __name__ == "__main__":
+    for _test in (test_batch_draining, test_backoff, test_index_reset, test_duplicates_and_lost):
+        _test()
+        print(f"{_test.__name__}: OK")
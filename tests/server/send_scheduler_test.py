@@ -0,0 +1,83 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_ids import PacketID, PacketPriority, PacketReliability
+from IronicMTA.network.packet_cache import PrebuiltPacket
+from IronicMTA.network.send_queue import SendScheduler
+from IronicMTA.tests.server.stubs import StubServer
+
+
+def sync(data: bytes, priority: PacketPriority = PacketPriority.MEDIUM) -> PrebuiltPacket:
+    return PrebuiltPacket(
+        PacketID.PACKET_ID_PLAYER_PURESYNC,
+        priority,
+        PacketReliability.UNRELIABLE_SEQUENCED,
+        data,
+    )
+
+
+def test_coalescing():
+    server = StubServer()
+    scheduler = SendScheduler(server)
+    key = (PacketID.PACKET_ID_PLAYER_PURESYNC, 7)
+    assert scheduler.queue(1, 171, sync(b"old"), key)
+    assert not scheduler.queue(1, 171, sync(b"new"), key)  # Superseded
+    assert scheduler.queue(1, 171, sync(b"other"), (PacketID.PACKET_ID_PLAYER_PURESYNC, 8))
+    assert scheduler.queue(2, 171, sync(b"old"), key)  # Queues are per client
+    assert scheduler.get_pending_count() == 3
+    assert scheduler.flush() == 3
+    sent = [(_binaddr, _data) for _binaddr, _, _, _data, _, _ in server.network.sent]
+    assert (1, b"new") in sent and (1, b"old") not in sent
+    assert scheduler.get_stats()["coalesced"] == 1
+
+
+def test_coalescing_priority_change():
+    server = StubServer()
+    scheduler = SendScheduler(server)
+    key = (PacketID.PACKET_ID_PLAYER_PURESYNC, 7)
+    scheduler.queue(1, 171, sync(b"low", PacketPriority.LOW), key)
+    scheduler.queue(1, 171, sync(b"high", PacketPriority.HIGH), key)
+    assert scheduler.flush() == 1
+    assert server.network.sent[0][3] == b"high"
+
+
+def test_reliable_not_coalesced():
+    server = StubServer()
+    scheduler = SendScheduler(server)
+    key = (PacketID.PACKET_ID_PLAYER_PURESYNC, 7)
+    for data in (b"a", b"b"):
+        scheduler.queue(
+            1,
+            171,
+            PrebuiltPacket(
+                PacketID.PACKET_ID_PLAYER_PURESYNC,
+                PacketPriority.MEDIUM,
+                PacketReliability.RELIABLE,
+                data,
+            ),
+            key,
+        )
+    assert scheduler.flush() == 2
+
+
+def test_priority_order():
+    server = StubServer()
+    scheduler = SendScheduler(server)
+    scheduler.queue(1, 171, sync(b"low", PacketPriority.LOW))
+    scheduler.queue(1, 171, sync(b"high", PacketPriority.HIGH))
+    scheduler.queue(1, 171, sync(b"medium", PacketPriority.MEDIUM))
+    scheduler.flush()
+    assert [_packet[3] for _packet in server.network.sent] == [b"high", b"medium", b"low"]
+
+
+if __name__ == "__main__":
+    for _test in (
+        test_coalescing,
+        test_coalescing_priority_change,
+        test_reliable_not_coalesced,
+        test_priority_order,
+    ):
+        _test()
+        print(f"{_test.__name__}: OK")
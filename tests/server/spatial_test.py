@@ -0,0 +1,89 @@
+import os
+import sys
+from random import Random
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.spatial import SpatialIndex
+from IronicMTA.vectors import Vector3
+
+
+def build(count: int = 500, seed: int = 1):
+    random = Random(seed)
+    index = SpatialIndex(32.0)
+    positions = {}
+    for element in range(count):
+        position = Vector3(
+            random.uniform(-500, 500), random.uniform(-500, 500), random.uniform(-50, 50)
+        )
+        dimension = random.choice((0, 0, 0, 1))
+        index.insert(element, position, dimension)
+        positions[element] = (position, dimension)
+    return index, positions, random
+
+
+def test_radius_matches_brute_force():
+    index, positions, random = build()
+    for _ in range(50):
+        center = Vector3(random.uniform(-500, 500), random.uniform(-500, 500), 0.0)
+        radius = random.uniform(1, 200)
+        expected = {
+            _element
+            for _element, (_position, _dimension) in positions.items()
+            if _dimension == 0 and _position.distance(center) <= radius
+        }
+        assert set(index.query_radius(center, radius)) == expected
+
+
+def test_box_matches_brute_force():
+    index, positions, _ = build()
+    low, high = Vector3(-100, -50, -10), Vector3(120, 80, 30)
+    expected = {
+        _element
+        for _element, (_position, _dimension) in positions.items()
+        if _dimension == 1
+        and all(_low <= _value <= _high for _low, _value, _high in zip(low, _position, high))
+    }
+    assert set(index.query_box(low, high, dimension=1)) == expected
+
+
+def test_nearest_matches_brute_force():
+    index, positions, random = build()
+    for _ in range(20):
+        center = Vector3(random.uniform(-600, 600), random.uniform(-600, 600), 0.0)
+        distances = sorted(
+            _position.distance(center)
+            for _position, _dimension in positions.values()
+            if _dimension == 0
+        )
+        nearest = index.query_nearest(center, 5)
+        assert len(nearest) == 5
+        for (distance, element), expected in zip(nearest, distances):
+            assert abs(distance - expected) < 1e-9
+            assert abs(positions[element][0].distance(center) - distance) < 1e-9
+
+
+def test_update_and_remove():
+    index = SpatialIndex(32.0)
+    index.insert("car", Vector3(0, 0, 0))
+    assert index.query_radius(Vector3(0, 0, 0), 1.0) == ["car"]
+    index.update("car", position=Vector3(1000, 1000, 0))
+    assert index.query_radius(Vector3(0, 0, 0), 10.0) == []
+    assert index.query_radius(Vector3(1000, 1000, 0), 1.0) == ["car"]
+    index.update("car", interior=3)
+    assert index.query_radius(Vector3(1000, 1000, 0), 1.0) == []
+    assert index.query_partition(0, 3) == ["car"]
+    assert index.remove("car")
+    assert not index.remove("car")
+    assert index.query_partition(0, 3) == []
+
+
+if __name__ == "__main__":
+    for _test in (
+        test_radius_matches_brute_force,
+        test_box_matches_brute_force,
+        test_nearest_matches_brute_force,
+        test_update_and_remove,
+    ):
+        _test()
+        print(f"{_test.__name__}: OK")
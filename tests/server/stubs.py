@@ -0,0 +1,45 @@
+"""
+    Stand-ins for the server and its transport (network tests)
+"""
+
+
+class RecordingNetwork(object):
+    """Transport keeping the sent packets"""
+
+    def __init__(self) -> None:
+        self.sent = []
+
+    def send_many(self, packets) -> int:
+        _packets = list(packets)
+        self.sent.extend(_packets)
+        return len(_packets)
+
+
+class StoppedScheduler(object):
+    """Send scheduler that isn't running (packets go straight to the network)"""
+
+    def is_running(self) -> bool:
+        return False
+
+
+class StubServer(object):
+    """Server with a `RecordingNetwork`, no logger, event loop or running scheduler"""
+
+    def __init__(self) -> None:
+        self.network = RecordingNetwork()
+        self.players = []
+
+    def get_network(self) -> RecordingNetwork:
+        return self.network
+
+    def get_send_scheduler(self) -> StoppedScheduler:
+        return StoppedScheduler()
+
+    def get_logger(self) -> None:
+        return None
+
+    def get_event_loop(self) -> None:
+        return None
+
+    def get_all_players(self):
+        return self.players
@@ -0,0 +1,134 @@
+import os
+import sys
+
+import numpy as np
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_handler.io import BitStream
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.network.sync_decoder import (
+    SYNC_DTYPE,
+    SyncBatchDecoder,
+    KEYSYNC_FLAG_DUCKED,
+    LIGHTSYNC_FLAG_HEALTH,
+    LIGHTSYNC_FLAG_POSITION,
+    PURESYNC_FLAG_HAS_CONTACT,
+    PURESYNC_FLAG_ON_GROUND,
+    PURESYNC_FLAG_SYNCING_VELOCITY,
+    write_keysync,
+    write_lightsync,
+    write_puresync,
+)
+from IronicMTA.vectors import Vector3
+
+PURESYNC = PacketID.PACKET_ID_PLAYER_PURESYNC.value
+KEYSYNC = PacketID.PACKET_ID_PLAYER_KEYSYNC.value
+LIGHTSYNC = PacketID.PACKET_ID_LIGHTSYNC.value
+
+
+def payload(write, *args) -> bytes:
+    bitstream = BitStream()
+    write(bitstream, *args)
+    return bitstream.get_bytes()
+
+
+def close(value, expected, tolerance: float) -> bool:
+    return bool(np.all(np.abs(np.asarray(value) - np.asarray(expected)) <= tolerance))
+
+
+def test_puresync():
+    flags = PURESYNC_FLAG_ON_GROUND | PURESYNC_FLAG_SYNCING_VELOCITY | PURESYNC_FLAG_HAS_CONTACT
+    syncs = SyncBatchDecoder().decode(
+        [
+            (
+                PURESYNC,
+                7,
+                payload(
+                    write_puresync, 3, 0xBEEF, flags, Vector3(1234.5, -2000.25, 15.125),
+                    1.25, Vector3(3.0, -4.0, 12.0), 100.0, 50.0, 4321,
+                ),
+            ),
+            (
+                PURESYNC,
+                8,
+                payload(
+                    write_puresync, 4, 0, 0, Vector3(-1.0, 2.0, -3.0),
+                    -3.0, Vector3(9, 9, 9), 255.0, 0.0,
+                ),
+            ),
+        ]
+    )
+    assert syncs.dtype == SYNC_DTYPE and len(syncs) == 2
+    first, second = syncs
+    assert (first["player"], first["packet_id"], first["time_context"]) == (7, PURESYNC, 3)
+    assert (first["keys"], first["flags"], first["contact"]) == (0xBEEF, flags, 4321)
+    assert close(first["position"], (1234.5, -2000.25, 15.125), 1 / 1024)
+    assert close(first["rotation"], 1.25, 1e-4)
+    assert close(first["velocity"], (3.0, -4.0, 12.0), 1e-2)
+    assert close(first["health"], 100.0, 1.0) and close(first["armor"], 50.0, 0.5)
+    assert close(second["position"], (-1.0, 2.0, -3.0), 1 / 1024)
+    assert close(second["rotation"], -3.0, 1e-4)
+    assert tuple(second["velocity"]) == (0.0, 0.0, 0.0)  # Not synced
+    assert (second["health"], second["armor"]) == (255.0, 0.0)
+
+
+def test_keysync_and_lightsync():
+    syncs = SyncBatchDecoder().decode(
+        [
+            (KEYSYNC, 1, payload(write_keysync, 0x1234, KEYSYNC_FLAG_DUCKED)),
+            (
+                LIGHTSYNC,
+                2,
+                payload(
+                    write_lightsync, 9, LIGHTSYNC_FLAG_HEALTH | LIGHTSYNC_FLAG_POSITION,
+                    Vector3(10.0, 20.0, 30.0), 200.0, 100.0,
+                ),
+            ),
+            (LIGHTSYNC, 3, payload(write_lightsync, 10, 0, Vector3(0, 0, 0), 0.0, 0.0)),
+            (PacketID.PACKET_ID_PLAYER_JOINDATA.value, 4, b"ignored"),
+        ]
+    )
+    assert syncs["player"].tolist() == [1, 2, 3]
+    keysync, lightsync, empty = syncs
+    assert (keysync["keys"], keysync["flags"]) == (0x1234, KEYSYNC_FLAG_DUCKED)
+    assert np.isnan(keysync["position"]).all() and np.isnan(keysync["rotation"])
+    assert lightsync["time_context"] == 9
+    assert close(lightsync["position"], (10.0, 20.0, 30.0), 1 / 1024)
+    assert close(lightsync["health"], 200.0, 1.0) and close(lightsync["armor"], 100.0, 0.5)
+    assert np.isnan(lightsync["rotation"])
+    assert np.isnan(empty["position"]).all() and np.isnan(empty["health"])
+
+
+def test_malformed_rollback():
+    decoder = SyncBatchDecoder()
+    lightsync = payload(
+        write_lightsync, 1, LIGHTSYNC_FLAG_HEALTH | LIGHTSYNC_FLAG_POSITION,
+        Vector3(1.0, 1.0, 1.0), 100.0, 10.0,
+    )
+    puresync = payload(
+        write_puresync, 2, 0, 0, Vector3(5.0, 6.0, 7.0), 0.5, Vector3(0, 0, 0), 80.0, 20.0
+    )
+    syncs = decoder.decode(
+        [
+            (LIGHTSYNC, 1, lightsync[:4]),  # Health read, position cut: rolled back
+            (PURESYNC, 2, puresync[:6]),
+            (KEYSYNC, 3, b""),
+            (LIGHTSYNC, 4, lightsync),
+            (PURESYNC, 5, puresync),
+        ]
+    )
+    assert decoder.get_error_count() == 3
+    assert syncs["player"].tolist() == [4, 5]
+    # The dropped payloads columns don't shift the next rows
+    assert close(syncs["position"], ((1.0, 1.0, 1.0), (5.0, 6.0, 7.0)), 1 / 1024)
+    assert close(syncs["health"], (100.0, 80.0), 1.0)
+    assert close(syncs["armor"], (10.0, 20.0), 0.5)
+    assert np.isnan(syncs["rotation"][0]) and close(syncs["rotation"][1], 0.5, 1e-4)
+    assert len(decoder.decode([])) == 0
+
+
+if __name__ == "__main__":
+    for _test in (test_puresync, test_keysync_and_lightsync, test_malformed_rollback):
+        _test()
+        print(f"{_test.__name__}: OK")
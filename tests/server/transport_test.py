@@ -0,0 +1,49 @@
+import os
+import sys
+
+# IronicMTA path setup
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+from IronicMTA.core.packet_ids import PacketID
+from IronicMTA.core.transport import LoopbackTransport, Transport
+from IronicMTA.tests.server.stubs import StubServer
+
+
+class IncompleteTransport(Transport):
+    """Backend without `send`"""
+
+    def init(self) -> bool:
+        return True
+
+    def start(self):
+        return True
+
+    def stop(self):
+        return True
+
+    def receive_batch(self, max_packets: int, last_index: int):
+        return []
+
+
+def test_incomplete_backend():
+    try:
+        IncompleteTransport(StubServer())
+    except TypeError as error:
+        assert "send" in str(error)
+    else:
+        raise AssertionError("TypeError not raised")
+
+
+def test_loopback_backend():
+    transport = LoopbackTransport(StubServer())
+    assert transport.init() and transport.start()
+    client = transport.connect()
+    assert transport.broadcast(
+        [client.get_binary_address()], PacketID.PACKET_ID_PLAYER_PURESYNC, 171, b"text"
+    ) == 1
+    assert [_packet[1] for _packet in client.receive()] == [b"text"]
+
+
+if __name__ == "__main__":
+    for _test in (test_incomplete_backend, test_loopback_backend):
+        _test()
+        print(f"{_test.__name__}: OK")
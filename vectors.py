@@ -1,16 +1,195 @@
-from typing import Tuple
+from math import sqrt
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
 
 class Vector2:
+    """2D vector (hashed by value, don't mutate a vector used as a key)"""
+
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float | int, y: float | int) -> None:
         self.x = x
         self.y = y
+
     def get(self) -> Tuple[float | int, float | int]:
         return (self.x, self.y)
 
+    def __repr__(self) -> str:
+        return f"Vector2({self.x}, {self.y})"
+
+    def __iter__(self) -> Iterator[float | int]:
+        yield self.x
+        yield self.y
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Vector2):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __add__(self, other: "Vector2") -> "Vector2":
+        return Vector2(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: "Vector2") -> "Vector2":
+        return Vector2(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar: float | int) -> "Vector2":
+        return Vector2(self.x * scalar, self.y * scalar)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float | int) -> "Vector2":
+        return Vector2(self.x / scalar, self.y / scalar)
+
+    def __neg__(self) -> "Vector2":
+        return Vector2(-self.x, -self.y)
+
+    def dot(self, other: "Vector2") -> float:
+        return self.x * other.x + self.y * other.y
+
+    def length(self) -> float:
+        return sqrt(self.x * self.x + self.y * self.y)
+
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    def distance(self, other: "Vector2") -> float:
+        _dx, _dy = self.x - other.x, self.y - other.y
+        return sqrt(_dx * _dx + _dy * _dy)
+
+    def distance_squared(self, other: "Vector2") -> float:
+        _dx, _dy = self.x - other.x, self.y - other.y
+        return _dx * _dx + _dy * _dy
+
+
 class Vector3:
+    """3D vector (hashed by value, don't mutate a vector used as a key)"""
+
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float | int, y: float | int, z: float | int) -> None:
         self.x = x
         self.y = y
         self.z = z
+
     def get(self) -> Tuple[float | int, float | int, float | int]:
-        return (self.x, self.y, self.z)
\ No newline at end of file
+        return (self.x, self.y, self.z)
+
+    def __repr__(self) -> str:
+        return f"Vector3({self.x}, {self.y}, {self.z})"
+
+    def __iter__(self) -> Iterator[float | int]:
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Vector3):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y, self.z))
+
+    def __add__(self, other: "Vector3") -> "Vector3":
+        return Vector3(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: "Vector3") -> "Vector3":
+        return Vector3(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, scalar: float | int) -> "Vector3":
+        return Vector3(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float | int) -> "Vector3":
+        return Vector3(self.x / scalar, self.y / scalar, self.z / scalar)
+
+    def __neg__(self) -> "Vector3":
+        return Vector3(-self.x, -self.y, -self.z)
+
+    def dot(self, other: "Vector3") -> float:
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: "Vector3") -> "Vector3":
+        return Vector3(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def length(self) -> float:
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def distance(self, other: "Vector3") -> float:
+        _dx, _dy, _dz = self.x - other.x, self.y - other.y, self.z - other.z
+        return sqrt(_dx * _dx + _dy * _dy + _dz * _dz)
+
+    def distance_squared(self, other: "Vector3") -> float:
+        _dx, _dy, _dz = self.x - other.x, self.y - other.y, self.z - other.z
+        return _dx * _dx + _dy * _dy + _dz * _dz
+
+
+class Vector3Batch:
+    """Array backed batch of 3D vectors
+
+    Wraps a (n, 3) float array without copying it (ex: the element store
+    positions column), `array` gives the same memory back to NumPy.
+
+    >>> _batch = Vector3Batch(element_store.positions)
+    >>> _batch.distances(Vector3(0, 0, 3))
+
+    Args:
+    -----
+        array (np.ndarray): (n, 3) array (viewed in place when it's already a float array)
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: np.ndarray) -> None:
+        self.array = np.asarray(array, dtype=np.float64).reshape(-1, 3)
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector3]) -> "Vector3Batch":
+        """Pack vectors in a new batch (one pass, no intermediate tuples)"""
+        _values = np.fromiter(
+            (
+                _value
+                for _vector in vectors
+                for _value in (_vector.x, _vector.y, _vector.z)
+            ),
+            dtype=np.float64,
+        )
+        return cls(_values)
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, index: int) -> Vector3:
+        _x, _y, _z = self.array[index].tolist()
+        return Vector3(_x, _y, _z)
+
+    def __setitem__(self, index: int, vector: Vector3) -> None:
+        self.array[index] = vector.x, vector.y, vector.z
+
+    def __iter__(self) -> Iterator[Vector3]:
+        for _x, _y, _z in self.array.tolist():
+            yield Vector3(_x, _y, _z)
+
+    def to_vectors(self) -> List[Vector3]:
+        return list(self)
+
+    def lengths(self) -> np.ndarray:
+        return np.sqrt(np.einsum("ij,ij->i", self.array, self.array))
+
+    def distances(self, vector: Vector3) -> np.ndarray:
+        """Get the distances between `vector` and each vector of the batch"""
+        _deltas = self.array - (vector.x, vector.y, vector.z)
+        return np.sqrt(np.einsum("ij,ij->i", _deltas, _deltas))